@@ -0,0 +1,211 @@
+"""
+File name: benchmark_asgi.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import asyncio
+import tracemalloc
+from time import perf_counter
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from django.utils.timezone import now
+
+import psutil
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.models.order import Order
+from api.models.product import Product
+from api.models.product_quantity import ProductQuantity
+from auth_api.models import User
+
+
+class Command(BaseCommand):
+    """
+    The benchmark ASGI command.
+
+    Seeds a user, a product and a closed order, sends the requests to the
+    health, order, product and product report views through the WSGI handler,
+    one at a time as a sync worker does, and through the ASGI handler, with
+    the concurrent connections given, and removes the seeded rows.
+
+    The sync memory per connection is the process resident memory, as a sync
+    worker serves one connection. The ASGI memory per connection is the peak
+    of the memory allocated while serving the concurrent connections, divided
+    by them.
+    """
+
+    help = "Benchmarks the requests per second of the WSGI and ASGI handlers."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=50)
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        user, product, order = self.__seed()
+
+        try:
+            token = str(AccessToken.for_user(user))
+            urls = [
+                ("health", reverse("health")),
+                ("order", reverse("orders_id", kwargs={"id": order.id})),
+                ("product", reverse("products_id", kwargs={"id": product.id})),
+                ("report", reverse("products_reports")),
+            ]
+
+            self.stdout.write(
+                "requests: %s, concurrency: %s"
+                % (options["requests"], options["concurrency"])
+            )
+            for url_name, url in urls:
+                sync_rate = self.__time_sync(url, token, options["requests"])
+                asgi_rate, asgi_memory = asyncio.run(
+                    self.__time_asgi(
+                        url, token, options["requests"], options["concurrency"]
+                    )
+                )
+                self.stdout.write(
+                    "%-16s %10.1f requests/s" % (url_name + " wsgi", sync_rate)
+                )
+                self.stdout.write(
+                    "%-16s %10.1f requests/s" % (url_name + " asgi", asgi_rate)
+                )
+                self.stdout.write(
+                    "%-16s %10.1f KiB/connection"
+                    % (url_name + " asgi", asgi_memory / 1024)
+                )
+
+            self.stdout.write(
+                "%-16s %10.1f KiB/connection"
+                % ("wsgi", psutil.Process().memory_info().rss / 1024)
+            )
+        finally:
+            self.__clear(user, product, order)
+
+    def __clear(self, user, product, order):
+        """
+        Removes the seeded user, product, order and product quantity.
+
+        :param User user: The seeded user.
+        :param Product product: The seeded product.
+        :param Order order: The seeded order.
+        """
+        ProductQuantity.objects.filter(order_id=order.id).delete()
+        order.delete()
+        product.delete()
+        user.delete()
+
+    async def __get_asgi(self, client, semaphore, url, token):
+        """
+        Sends a request through the ASGI handler, once a connection is free.
+
+        :param django.test.AsyncClient client: The client sending the request.
+        :param asyncio.Semaphore semaphore: The free connections.
+        :param string url: The requested url.
+        :param string token: The user access token.
+        """
+        async with semaphore:
+            await client.get(url, authorization="Bearer %s" % token)
+
+    def __seed(self):
+        """
+        Seeds a user, a product and a closed order with one product quantity.
+        """
+        user = User.objects.create(
+            id=uuid4(),
+            email="benchmark%s@benchmark.com" % uuid4().hex,
+            password="benchmark",
+            first_name="benchmark",
+            last_name="user",
+            role=2,
+        )
+        product = Product.objects.create(
+            id=uuid4(),
+            name="benchmark product",
+            description="benchmark product",
+            price=100,
+        )
+        order = Order.objects.create(
+            id=uuid4(),
+            external_client="benchmark client",
+            total_price=1000,
+            closed_at=now(),
+        )
+        ProductQuantity.objects.create(
+            id=uuid4(),
+            order_id=order.id,
+            product_id=product.id,
+            quantity=10,
+            unit_price=100,
+            line_total=1000,
+        )
+
+        return user, product, order
+
+    async def __time_asgi(self, url, token, requests, concurrency):
+        """
+        Gets the requests per second of the ASGI handler and its peak memory
+        per concurrent connection, in bytes.
+
+        :param string url: The requested url.
+        :param string token: The user access token.
+        :param int requests: The requests sent.
+        :param int concurrency: The concurrent connections.
+        """
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        try:
+            start = perf_counter()
+            await asyncio.gather(
+                *[
+                    self.__get_asgi(client, semaphore, url, token)
+                    for _ in range(requests)
+                ]
+            )
+            rate = requests / (perf_counter() - start)
+
+            tracemalloc.start()
+            try:
+                baseline, _ = tracemalloc.get_traced_memory()
+                await asyncio.gather(
+                    *[
+                        self.__get_asgi(client, semaphore, url, token)
+                        for _ in range(concurrency)
+                    ]
+                )
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        finally:
+            await sync_to_async(connections.close_all)()
+
+        return rate, (peak - baseline) / concurrency
+
+    def __time_sync(self, url, token, requests):
+        """
+        Gets the requests per second of the WSGI handler.
+
+        :param string url: The requested url.
+        :param string token: The user access token.
+        :param int requests: The requests sent.
+        """
+        client = Client()
+
+        start = perf_counter()
+        for _ in range(requests):
+            client.get(url, HTTP_AUTHORIZATION="Bearer %s" % token)
+
+        return requests / (perf_counter() - start)
@@ -0,0 +1,186 @@
+"""
+File name: benchmark_formats.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from datetime import timedelta
+from io import BytesIO
+from time import perf_counter
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from utils.parsers.fast_json_parser import FastJSONParser
+from utils.parsers.message_pack_parser import MessagePackParser
+from utils.renderers.fast_json_renderer import FastJSONRenderer
+from utils.renderers.message_pack_renderer import MessagePackRenderer
+
+
+class Command(BaseCommand):
+    """
+    The benchmark formats command.
+
+    Compares the size, render and parse time of order, report and user
+    payloads as JSON, fast JSON and MessagePack, with identifiers and dates as
+    strings, as the response serializers output them, and as native uuids and
+    datetimes.
+    """
+
+    help = "Benchmarks the JSON and MessagePack formats over response payloads."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument("--orders", type=int, default=100)
+        parser.add_argument("--lines", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        orders, lines = options["orders"], options["lines"]
+        payloads = [
+            ("orders", self.__create_payload(orders, lines, False)),
+            ("orders native", self.__create_payload(orders, lines, True)),
+            ("report", self.__create_report_payload(orders * lines, False)),
+            ("report native", self.__create_report_payload(orders * lines, True)),
+            ("users", self.__create_user_payload(orders * lines)),
+        ]
+        formats = [
+            ("json", JSONRenderer(), JSONParser()),
+            ("fast json", FastJSONRenderer(), FastJSONParser()),
+            ("msgpack", MessagePackRenderer(), MessagePackParser()),
+        ]
+
+        self.stdout.write("orders: %s, lines: %s" % (orders, lines))
+        for payload_name, payload in payloads:
+            for format_name, renderer, parser in formats:
+                body = renderer.render(payload)
+                render_time = self.__time(
+                    lambda: renderer.render(payload), options["repeat"]
+                )
+                parse_time = self.__time(
+                    lambda: parser.parse(BytesIO(body)), options["repeat"]
+                )
+                self.stdout.write(
+                    "%-32s %10s bytes %10.2f ms render %10.2f ms parse"
+                    % (
+                        payload_name + " " + format_name,
+                        len(body),
+                        render_time,
+                        parse_time,
+                    )
+                )
+
+    def __create_payload(self, orders, lines, native):
+        """
+        Creates a list of order payloads shaped as the order response.
+
+        :param int orders: The orders in the payload.
+        :param int lines: The product quantities of each order.
+        :param bool native: Whether identifiers and dates are native objects.
+        """
+
+        def convert(value):
+            return value if native else str(value)
+
+        closed_at = now()
+
+        return [
+            {
+                "id": convert(uuid4()),
+                "created_at": convert(closed_at),
+                "closed_at": convert(closed_at),
+                "external_client": "benchmark client",
+                "total_price": lines * 1000,
+                "product_quantities": [
+                    {
+                        "id": convert(uuid4()),
+                        "product": {
+                            "id": convert(uuid4()),
+                            "name": "benchmark product",
+                            "description": "benchmark product description",
+                            "price": 100,
+                        },
+                        "quantity": 10,
+                        "unit_price": 100,
+                        "line_total": 1000,
+                    }
+                    for _ in range(lines)
+                ],
+            }
+            for _ in range(orders)
+        ]
+
+    def __create_report_payload(self, products, native):
+        """
+        Creates a product report payload, followed by a daily series.
+
+        :param int products: The products in the report.
+        :param bool native: Whether identifiers and dates are native objects.
+        """
+
+        def convert(value):
+            return value if native else str(value)
+
+        date = now()
+
+        return {
+            "products": [
+                {
+                    "id": convert(uuid4()),
+                    "name": "benchmark product",
+                    "description": "benchmark product description",
+                    "total_quantity": 10,
+                    "total_price": 1000,
+                }
+                for _ in range(products)
+            ],
+            "series": [
+                {
+                    "date": convert(date - timedelta(days=day)),
+                    "total_quantity": 10,
+                    "total_price": 1000,
+                }
+                for day in range(products)
+            ],
+        }
+
+    def __create_user_payload(self, users):
+        """
+        Creates a user list payload.
+
+        :param int users: The users in the payload.
+        """
+        return [
+            {
+                "first_name": "benchmark",
+                "last_name": "user",
+                "email": "benchmark%s@benchmark.com" % user,
+                "role": 1,
+            }
+            for user in range(users)
+        ]
+
+    def __time(self, benchmark, repeat):
+        """
+        Gets the best wall time of a benchmark, in milliseconds.
+
+        :param function benchmark: The benchmark.
+        :param int repeat: The times the benchmark is run.
+        """
+        timings = []
+
+        for _ in range(repeat):
+            start = perf_counter()
+            benchmark()
+            timings.append(perf_counter() - start)
+
+        return min(timings) * 1000
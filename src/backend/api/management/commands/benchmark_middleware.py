@@ -0,0 +1,146 @@
+"""
+File name: benchmark_middleware.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from time import perf_counter
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.models.order import Order
+from api.models.product import Product
+from api.models.product_quantity import ProductQuantity
+from auth_api.models import User
+
+
+class Command(BaseCommand):
+    """
+    The benchmark middleware command.
+
+    Seeds a user and a closed order, times the requests to the health and the
+    order by identifier views through the session and the stateless middleware
+    stacks and removes the seeded rows.
+    """
+
+    help = "Benchmarks the per request overhead of the middleware stacks."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        user, product, order = self.__seed()
+
+        try:
+            headers = {"HTTP_AUTHORIZATION": "Bearer %s" % AccessToken.for_user(user)}
+            urls = [
+                ("health", reverse("health")),
+                ("order", reverse("orders_id", kwargs={"id": order.id})),
+            ]
+            stacks = [
+                ("session", settings.SESSION_MIDDLEWARE, True),
+                ("stateless", settings.STATELESS_MIDDLEWARE, False),
+            ]
+
+            self.stdout.write("requests: %s" % options["requests"])
+            for url_name, url in urls:
+                for stack_name, middleware, i18n in stacks:
+                    with override_settings(
+                        MIDDLEWARE=middleware, USE_I18N=i18n, USE_L10N=i18n
+                    ):
+                        request_time = self.__time(
+                            Client(),
+                            url,
+                            headers,
+                            options["requests"],
+                            options["repeat"],
+                        )
+                    self.stdout.write(
+                        "%-24s %10.1f us/request"
+                        % (url_name + " " + stack_name, request_time)
+                    )
+        finally:
+            self.__clear(user, product, order)
+
+    def __clear(self, user, product, order):
+        """
+        Removes the seeded user, product, order and product quantity.
+
+        :param User user: The seeded user.
+        :param Product product: The seeded product.
+        :param Order order: The seeded order.
+        """
+        ProductQuantity.objects.filter(order_id=order.id).delete()
+        order.delete()
+        product.delete()
+        user.delete()
+
+    def __seed(self):
+        """
+        Seeds a user, a product and a closed order with one product quantity.
+        """
+        user = User.objects.create(
+            id=uuid4(),
+            email="benchmark%s@benchmark.com" % uuid4().hex,
+            password="benchmark",
+            first_name="benchmark",
+            last_name="user",
+            role=2,
+        )
+        product = Product.objects.create(
+            id=uuid4(),
+            name="benchmark product",
+            description="benchmark product",
+            price=100,
+        )
+        order = Order.objects.create(
+            id=uuid4(),
+            external_client="benchmark client",
+            total_price=1000,
+            closed_at=now(),
+        )
+        ProductQuantity.objects.create(
+            id=uuid4(),
+            order_id=order.id,
+            product_id=product.id,
+            quantity=10,
+            unit_price=100,
+            line_total=1000,
+        )
+
+        return user, product, order
+
+    def __time(self, client, url, headers, requests, repeat):
+        """
+        Gets the best mean wall time of a request, in microseconds.
+
+        :param django.test.Client client: The client sending the requests.
+        :param string url: The requested url.
+        :param dict headers: The request headers.
+        :param int requests: The requests sent per run.
+        :param int repeat: The times the run is repeated.
+        """
+        timings = []
+
+        for _ in range(repeat):
+            start = perf_counter()
+            for _ in range(requests):
+                client.get(url, **headers)
+            timings.append((perf_counter() - start) / requests)
+
+        return min(timings) * 1000000
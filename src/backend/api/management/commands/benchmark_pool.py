@@ -0,0 +1,148 @@
+"""
+File name: benchmark_pool.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from functools import partial
+from threading import Thread
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+import psycopg2
+
+from utils.databases.connection_pool import ConnectionPool
+
+
+class Command(BaseCommand):
+    """
+    The benchmark pool command.
+
+    Runs a query per request on the threads given, as a threaded worker does,
+    opening a connection per request, as CONN_MAX_AGE 0 does, and checking a
+    connection out of a connection pool of the size given, and writes the
+    pool checkout and wait statistics.
+    """
+
+    help = "Benchmarks the requests per second with and without a connection pool."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--pool-size", type=int, default=4)
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        create = partial(psycopg2.connect, **connection.get_connection_params())
+        pool = ConnectionPool(create, options["pool_size"], 30, 1800, 30)
+
+        try:
+            connect_rate = self.__time(
+                partial(self.__query_connected, create),
+                options["requests"],
+                options["threads"],
+            )
+            pool_rate = self.__time(
+                partial(self.__query_pooled, pool),
+                options["requests"],
+                options["threads"],
+            )
+        finally:
+            pool.close()
+
+        stats = pool.get_stats()
+        self.stdout.write(
+            "requests: %s, threads: %s, pool size: %s"
+            % (options["requests"], options["threads"], options["pool_size"])
+        )
+        self.stdout.write("%-10s %10.1f requests/s" % ("connect", connect_rate))
+        self.stdout.write("%-10s %10.1f requests/s" % ("pool", pool_rate))
+        self.stdout.write(
+            "%-10s %10d created, %d waits, %.1f ms mean wait, %.1f ms max wait"
+            % (
+                "pool",
+                stats["created"],
+                stats["waits"],
+                stats["wait_time"] / max(1, stats["waits"]) * 1000,
+                stats["max_wait_time"] * 1000,
+            )
+        )
+
+    def __query(self, database_connection):
+        """
+        Runs the request query.
+
+        :param psycopg2.extensions.connection database_connection: The connection.
+        """
+        with database_connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        database_connection.rollback()
+
+    def __query_connected(self, create):
+        """
+        Runs the request query on a new connection.
+
+        :param callable create: The function opening a new connection.
+        """
+        database_connection = create()
+
+        try:
+            self.__query(database_connection)
+        finally:
+            database_connection.close()
+
+    def __query_pooled(self, pool):
+        """
+        Runs the request query on a pooled connection.
+
+        :param ConnectionPool pool: The connection pool.
+        """
+        database_connection = pool.get_connection()
+
+        try:
+            self.__query(database_connection)
+        finally:
+            pool.put_connection(database_connection)
+
+    def __run(self, request, requests):
+        """
+        Sends requests one at a time.
+
+        :param callable request: The request.
+        :param int requests: The requests sent.
+        """
+        for _ in range(requests):
+            request()
+
+    def __time(self, request, requests, threads):
+        """
+        Gets the requests per second of the threads sharing the requests.
+
+        :param callable request: The request.
+        :param int requests: The requests sent.
+        :param int threads: The threads sending them.
+        """
+        workers = [
+            Thread(
+                target=self.__run,
+                args=(request, requests // threads + (index < requests % threads)),
+            )
+            for index in range(threads)
+        ]
+
+        start = perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        return requests / (perf_counter() - start)
@@ -0,0 +1,239 @@
+"""
+File name: benchmark_reports.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from datetime import datetime, timedelta
+from os import cpu_count
+from random import Random
+from time import perf_counter
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from django.utils.timezone import make_aware, now, utc
+
+from api.models.order import Order
+from api.models.product import Product
+from api.models.product_quantity import ProductQuantity
+from api.repositories.product_quantity_repository import ProductQuantityRepository
+from api.services.product_quantity_service import ProductQuantityService
+from utils.configurations.constants import ExceptionConstants, GenericConstants
+
+
+class Command(BaseCommand):
+    """
+    The benchmark reports command.
+
+    Seeds closed orders, times the report queries against the former
+    in-process aggregation loop and removes the seeded rows, by identifier so
+    the rows it did not seed are kept. The rows are committed, so the live
+    reports of the database see them while it runs, and it only runs when the
+    database writes are allowed.
+    """
+
+    help = "Benchmarks the product reports over seeded closed orders."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument("--rows", type=int, default=10000)
+        parser.add_argument("--products", type=int, default=200)
+        parser.add_argument("--clients", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--parallelism", type=int, nargs="+", default=[1, 2, 4, 8])
+        parser.add_argument("--skip-legacy", action="store_true")
+        parser.add_argument("--allow-database-writes", action="store_true")
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        if not options["allow_database_writes"]:
+            raise CommandError(ExceptionConstants.BENCHMARK_DATABASE_NOT_ALLOWED)
+
+        self.repository = ProductQuantityRepository()
+        self.service = ProductQuantityService()
+        self.order_ids = []
+        self.product_ids = []
+
+        try:
+            self.__seed(options["rows"], options["products"], options["clients"])
+
+            start_date = make_aware(datetime.min)
+            end_date = now()
+            benchmarks = [
+                (
+                    "product report",
+                    lambda: self.repository.get_product_totals_by_order_closure_date(
+                        start_date, end_date, GenericConstants.TOTAL_QUANTITY
+                    ),
+                ),
+                (
+                    "product report top 10",
+                    lambda: self.repository.get_product_totals_by_order_closure_date(
+                        start_date, end_date, GenericConstants.TOTAL_PRICE, 10
+                    ),
+                ),
+                (
+                    "dimension report",
+                    lambda: self.repository.get_dimension_totals_by_order_closure_date(
+                        start_date,
+                        end_date,
+                        list(GenericConstants.DIMENSION_OPTIONS),
+                        utc,
+                    ),
+                ),
+            ]
+            if not options["skip_legacy"]:
+                benchmarks.insert(
+                    0,
+                    ("legacy loop", lambda: self.__legacy_report(start_date, end_date)),
+                )
+
+            for parallelism in options["parallelism"]:
+                benchmarks.append(
+                    (
+                        "product report x%s" % parallelism,
+                        lambda parallelism=parallelism: self.__partitioned_report(
+                            start_date, end_date, parallelism
+                        ),
+                    )
+                )
+
+            self.stdout.write("rows: %s, cpus: %s" % (options["rows"], cpu_count()))
+            for name, benchmark in benchmarks:
+                self.stdout.write(
+                    "%-24s %10.1f ms"
+                    % (name, self.__time(benchmark, options["repeat"]))
+                )
+        finally:
+            self.__clear()
+
+    def __clear(self):
+        """
+        Removes the seeded products, orders and product quantities.
+        """
+        batch_size = 10000
+
+        ProductQuantity.objects.filter(product_id__in=self.product_ids).delete()
+        for offset in range(0, len(self.order_ids), batch_size):
+            Order.objects.filter(
+                id__in=self.order_ids[offset : offset + batch_size]
+            ).delete()
+        Product.objects.filter(id__in=self.product_ids).delete()
+
+    def __legacy_report(self, start_date, end_date):
+        """
+        Aggregates the product report in process, as the report used to.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        """
+        product_totals = {}
+
+        for product_quantity in ProductQuantity.objects.filter(
+            deleted_at=None,
+            order__closed_at__range=[start_date, end_date],
+        ).select_related(GenericConstants.PRODUCT):
+            total = product_totals.setdefault(product_quantity.product_id, [0, 0])
+            total[0] += product_quantity.quantity
+            total[1] += product_quantity.quantity * product_quantity.product.price
+
+        return sorted(product_totals.items(), key=lambda item: item[1][0], reverse=True)
+
+    def __partitioned_report(self, start_date, end_date, parallelism):
+        """
+        Gets the product report aggregated over closure date partitions.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param int parallelism: The partitions aggregated in parallel.
+        """
+        with override_settings(REPORT_PARALLELISM=parallelism):
+            (
+                product_reports,
+                _,
+            ) = self.service.get_product_quantity_by_order_closure_date(
+                start_date, end_date
+            )
+
+        return product_reports
+
+    def __seed(self, rows, products, clients):
+        """
+        Seeds products, closed orders and product quantities, keeping the
+        seeded product and order identifiers.
+
+        :param int rows: The product quantities to seed.
+        :param int products: The products to seed.
+        :param int clients: The external clients to seed.
+        """
+        random = Random(0)
+        batch_size = 10000
+        lines_per_order = 4
+        closed_at = now()
+
+        product_prices = {uuid4(): random.randint(1, 500) for _ in range(products)}
+        product_ids = list(product_prices)
+        self.product_ids.extend(product_ids)
+        Product.objects.bulk_create(
+            [
+                Product(
+                    id=product_id,
+                    name="benchmark product",
+                    description="benchmark product",
+                    price=price,
+                )
+                for product_id, price in product_prices.items()
+            ]
+        )
+
+        for offset in range(0, rows, batch_size):
+            batch_rows = min(batch_size, rows - offset)
+            orders = [
+                Order(
+                    id=uuid4(),
+                    external_client="benchmark client %s" % random.randrange(clients),
+                    total_price=0,
+                    closed_at=closed_at
+                    - timedelta(minutes=random.randrange(60 * 24 * 365)),
+                )
+                for _ in range(-(-batch_rows // lines_per_order))
+            ]
+            self.order_ids.extend(order.id for order in orders)
+            Order.objects.bulk_create(orders)
+            product_quantities = []
+            for row in range(batch_rows):
+                product_id = random.choice(product_ids)
+                quantity = random.randint(1, 10)
+                product_quantities.append(
+                    ProductQuantity(
+                        id=uuid4(),
+                        order_id=orders[row // lines_per_order].id,
+                        product_id=product_id,
+                        quantity=quantity,
+                        unit_price=product_prices[product_id],
+                        line_total=quantity * product_prices[product_id],
+                    )
+                )
+            ProductQuantity.objects.bulk_create(product_quantities)
+
+    def __time(self, benchmark, repeat):
+        """
+        Gets the best wall time of a benchmark, in milliseconds.
+
+        :param function benchmark: The benchmark returning the rows to read.
+        :param int repeat: The times the benchmark is run.
+        """
+        timings = []
+
+        for _ in range(repeat):
+            start = perf_counter()
+            list(benchmark())
+            timings.append(perf_counter() - start)
+
+        return min(timings) * 1000
@@ -0,0 +1,46 @@
+# Generated by Django 3.2.9 on 2021-12-13 10:12
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_unit_price(apps, schema_editor):
+    """
+    Captures the current product price and line total on existing lines.
+    """
+    Product = apps.get_model("api", "Product")
+    ProductQuantity = apps.get_model("api", "ProductQuantity")
+
+    ProductQuantity.objects.update(
+        unit_price=Coalesce(
+            Subquery(
+                Product.objects.filter(id=OuterRef("product_id")).values("price")[:1]
+            ),
+            Value(0),
+        )
+    )
+    ProductQuantity.objects.update(
+        line_total=Coalesce(F("quantity"), Value(0)) * F("unit_price")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0005_order_closed_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productquantity",
+            name="line_total",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="productquantity",
+            name="unit_price",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_unit_price, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.9 on 2021-12-13 11:40
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0006_productquantity_unit_price"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="snapshot",
+            field=models.JSONField(
+                default=None,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+File name: client_report.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+
+
+class ClientReport:
+    """
+    The external client report object.
+    """
+
+    def __init__(
+        self,
+        external_client,
+        total_orders,
+        total_quantity,
+        total_price,
+        product_id=None,
+        product_name=None,
+    ):
+        """
+        Initializes a new instance of ClientReport object.
+
+        :param string external_client: The external client.
+        :param int total_orders: The client closed orders total.
+        :param int total_quantity: The client bought total quantity.
+        :param int total_price: The client bought total price.
+        :param uuid4 product_id: The product identifier, when grouped by product.
+        :param string product_name: The product name, when grouped by product.
+        """
+        self.external_client = external_client
+        self.total_orders = total_orders
+        self.total_quantity = total_quantity
+        self.total_price = total_price
+        self.product_id = product_id
+        self.product_name = product_name
+
+    def __str__(self):
+        """
+        Represents the object ClientReport.
+        """
+        return str(self.external_client)
@@ -5,6 +5,7 @@ Creation date: 2021-12-08
 """
 from uuid import uuid4
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator
 from django.db import models
 from django.utils.timezone import now
@@ -50,6 +51,11 @@ class Order(models.Model):
     The closing data, determines when order was closed.
     """
 
+    snapshot = models.JSONField(default=None, null=True, encoder=DjangoJSONEncoder)
+    """
+    The order response written on closure, closed orders never change.
+    """
+
     created_at = models.DateTimeField(default=now, editable=False)
     """
     The creation date.
@@ -0,0 +1,66 @@
+"""
+File name: product_comparison.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+
+
+class ProductComparison:
+    """
+    The product period over period comparison object.
+    """
+
+    def __init__(
+        self,
+        id,
+        name,
+        description,
+        total_quantity,
+        total_price,
+        compare_total_quantity,
+        compare_total_price,
+    ):
+        """
+        Initializes a new instance of ProductComparison object.
+
+        :param uuid4 id: The product identifier.
+        :param string name: The product name.
+        :param string description: The product description.
+        :param int total_quantity: The product sold total quantity.
+        :param int total_price: The product sold total price.
+        :param int compare_total_quantity: The compared period sold total quantity.
+        :param int compare_total_price: The compared period sold total price.
+        """
+        self.id = id
+        self.name = name
+        self.description = description
+        self.total_quantity = total_quantity
+        self.total_price = total_price
+        self.compare_total_quantity = compare_total_quantity
+        self.compare_total_price = compare_total_price
+        self.quantity_delta = total_quantity - compare_total_quantity
+        self.price_delta = total_price - compare_total_price
+        self.quantity_delta_percentage = self.__percentage(
+            self.quantity_delta, compare_total_quantity
+        )
+        self.price_delta_percentage = self.__percentage(
+            self.price_delta, compare_total_price
+        )
+
+    def __percentage(self, delta, total):
+        """
+        Gets the delta percentage over a total, None when total is zero.
+
+        :param int delta: The delta.
+        :param int total: The total the delta is relative to.
+        """
+        if total == 0:
+            return None
+
+        return round(delta * 100 / total, 2)
+
+    def __str__(self):
+        """
+        Represents the object ProductComparison.
+        """
+        return str(self.id)
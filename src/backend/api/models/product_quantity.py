@@ -43,6 +43,16 @@ class ProductQuantity(models.Model):
     The product quantity.
     """
 
+    unit_price = models.IntegerField(default=0)
+    """
+    The product price when the line was written.
+    """
+
+    line_total = models.IntegerField(default=0)
+    """
+    The line total, quantity times unit price.
+    """
+
     created_at = models.DateTimeField(default=now, editable=False)
     """
     The creation date.
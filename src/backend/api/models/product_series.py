@@ -0,0 +1,29 @@
+"""
+File name: product_series.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+
+
+class ProductSeries:
+    """
+    The product series object.
+    """
+
+    def __init__(self, date, total_quantity, total_price):
+        """
+        Initializes a new instance of ProductSeries object.
+
+        :param datetime date: The series bucket start date.
+        :param int total_quantity: The bucket sold total quantity.
+        :param int total_price: The bucket sold total price.
+        """
+        self.date = date
+        self.total_quantity = total_quantity
+        self.total_price = total_price
+
+    def __str__(self):
+        """
+        Represents the object ProductSeries.
+        """
+        return str(self.date)
@@ -52,19 +52,60 @@ class OrderRepository:
 
         return order
 
-    def get_order_by_id(self, id):
+    def get_order_by_id(
+        self, id, only=None, with_product_quantities=True, with_products=True
+    ):
         """
         Gets an order by identifier.
 
         :param uuid4 id: The order identifier.
+        :param string[] only: The optional order fields to load, others are deferred.
+        :param bool with_product_quantities: Whether the product quantities are prefetched.
+        :param bool with_products: Whether the product quantity products are joined.
         """
         self.validator.is_null(id)
 
-        return Order.objects.filter(id=id, deleted_at=None).prefetch_related(
-            Prefetch(
-                "product_quantities",
-                queryset=ProductQuantity.objects.filter(deleted_at=None),
-            )
+        return self.__get_orders(
+            Order.objects.filter(id=id, deleted_at=None),
+            only,
+            with_product_quantities,
+            with_products,
+        )
+
+    def get_orders_by_ids(
+        self, ids, only=None, with_product_quantities=True, with_products=True
+    ):
+        """
+        Gets the orders by identifiers, with one query plus one prefetch.
+
+        :param uuid4[] ids: The order identifiers.
+        :param string[] only: The optional order fields to load, others are deferred.
+        :param bool with_product_quantities: Whether the product quantities are prefetched.
+        :param bool with_products: Whether the product quantity products are joined.
+        """
+        self.validator.is_null(ids)
+
+        return self.__get_orders(
+            Order.objects.filter(id__in=ids, deleted_at=None),
+            only,
+            with_product_quantities,
+            with_products,
+        )
+
+    def get_order_snapshot_by_id(self, id):
+        """
+        Gets the closure snapshot of an order by identifier.
+
+        Returns None when the order does not exist or has no snapshot.
+
+        :param uuid4 id: The order identifier.
+        """
+        self.validator.is_null(id)
+
+        return (
+            Order.objects.filter(id=id, deleted_at=None)
+            .values_list(GenericConstants.SNAPSHOT, flat=True)
+            .first()
         )
 
     def update_order_external_client(self, order, external_client):
@@ -83,6 +124,21 @@ class OrderRepository:
 
         return order
 
+    def update_order_snapshot(self, order, snapshot):
+        """
+        Updates the order closure snapshot.
+
+        :param Order order: The order to be updated.
+        :param dict snapshot: The order response snapshot.
+        """
+        self.validator.is_null(order)
+        self.validator.is_null(snapshot)
+
+        Order.objects.filter(id=order.id).update(snapshot=snapshot)
+        order.snapshot = snapshot
+
+        return order
+
     def update_order_total_price(self, order, total_price):
         """
         Updates the order total price.
@@ -124,3 +180,28 @@ class OrderRepository:
             raise UnprocessableEntityException(
                 ExceptionConstants.ORDER_IS_CLOSED % {GenericConstants.ID: order.id}
             )
+
+    def __get_orders(self, orders, only, with_product_quantities, with_products):
+        """
+        Trims the loading of an order query.
+
+        :param QuerySet orders: The order query.
+        :param string[] only: The optional order fields to load, others are deferred.
+        :param bool with_product_quantities: Whether the product quantities are prefetched.
+        :param bool with_products: Whether the product quantity products are joined.
+        """
+        if only is not None:
+            orders = orders.only(*only)
+
+        if not with_product_quantities:
+            return orders
+
+        product_quantities = ProductQuantity.objects.filter(deleted_at=None)
+        if with_products:
+            product_quantities = product_quantities.select_related(
+                GenericConstants.PRODUCT
+            )
+
+        return orders.prefetch_related(
+            Prefetch(GenericConstants.PRODUCT_QUANTITIES, queryset=product_quantities)
+        )
@@ -3,8 +3,12 @@ File name: product_quantity_repository.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum, Value
+from django.db.models.functions import Coalesce, ExtractHour, ExtractIsoWeekDay, Trunc
 from django.utils.timezone import now
 
+from api.models.product import Product
 from api.models.product_quantity import ProductQuantity
 from utils.configurations.constants import GenericConstants
 from utils.validations.api_validations import ApiValidations
@@ -23,24 +27,319 @@ class ProductQuantityRepository:
         """
         self.validator = ApiValidations()
 
-    def create_product_quantity(self, product_quantity, order_id, product_id):
+    def create_product_quantity(
+        self, product_quantity, order_id, product_id, unit_price
+    ):
         """
         Creates a product quantity:
 
         :param ProductQuantitySerializer.dataproduct_quantity: The product quentity to be created.
         :pram uuid4 order_id: The order identifier
         :pram uuid4 product_id: The product identifier
+        :param int unit_price: The product price captured on the line.
         """
         self.validator.is_null(product_quantity)
         self.validator.is_null(order_id)
         self.validator.is_null(product_id)
+        self.validator.is_null(unit_price)
+
+        quantity = product_quantity.get(GenericConstants.QUANTITY)
 
         return ProductQuantity.objects.create(
             product_id=product_id,
-            quantity=product_quantity.get(GenericConstants.QUANTITY),
+            quantity=quantity,
+            unit_price=unit_price,
+            line_total=quantity * unit_price,
             order_id=order_id,
         )
 
+    def get_client_totals_by_order_closure_date(
+        self, start_date, end_date, by_product=False
+    ):
+        """
+        Gets the external client totals by order closure start and end dates.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param bool by_product: Whether totals are also grouped by product.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+
+        group_by = ["order__external_client"]
+        if by_product:
+            group_by = group_by + ["product_id", "product__name"]
+
+        return (
+            ProductQuantity.objects.filter(
+                deleted_at=None,
+                order__closed_at__range=[
+                    start_date,
+                    end_date,
+                ],
+            )
+            .values(*group_by)
+            .annotate(
+                total_orders=Count("order_id", distinct=True),
+                total_quantity=Coalesce(Sum("quantity"), Value(0)),
+                total_price=Coalesce(Sum("line_total"), Value(0)),
+            )
+            .order_by("-total_price", *group_by)
+        )
+
+    def get_closure_date_bounds_by_order_closure_date(self, start_date, end_date):
+        """
+        Gets the first and last order closure dates by closure start and end dates.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+
+        return ProductQuantity.objects.filter(
+            deleted_at=None,
+            order__closed_at__range=[
+                start_date,
+                end_date,
+            ],
+        ).aggregate(
+            first_closed_at=Min("order__closed_at"),
+            last_closed_at=Max("order__closed_at"),
+        )
+
+    def get_data_version_by_order_closure_date(self, start_date, end_date):
+        """
+        Gets the version of the product quantities by order closure start and end
+        dates, deleted ones included, that changes with any line or order write.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+
+        return ProductQuantity.objects.filter(
+            order__closed_at__range=[
+                start_date,
+                end_date,
+            ],
+        ).aggregate(
+            lines=Count("id"),
+            last_updated_at=Max("updated_at"),
+            last_deleted_at=Max("deleted_at"),
+            last_order_updated_at=Max("order__updated_at"),
+        )
+
+    def get_dimension_totals_by_order_closure_date(
+        self, start_date, end_date, dimensions, tzinfo
+    ):
+        """
+        Gets the totals grouped by several dimensions at once.
+
+        Rows are returned as value tuples holding the dimension columns in the
+        given order followed by the total quantity and total price.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param string[] dimensions: The product, client, hour or weekday dimensions.
+        :param tzinfo tzinfo: The timezone hours and weekdays are extracted in.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+        self.validator.is_null(dimensions)
+        self.validator.is_null(tzinfo)
+
+        dimension_expressions = {
+            GenericConstants.CLIENT: F("order__external_client"),
+            GenericConstants.HOUR: ExtractHour("order__closed_at", tzinfo=tzinfo),
+            GenericConstants.WEEKDAY: ExtractIsoWeekDay(
+                "order__closed_at", tzinfo=tzinfo
+            ),
+        }
+        columns = [
+            GenericConstants.PRODUCT_ID
+            if dimension == GenericConstants.PRODUCT
+            else dimension
+            for dimension in dimensions
+        ]
+
+        return (
+            ProductQuantity.objects.filter(
+                deleted_at=None,
+                order__closed_at__range=[
+                    start_date,
+                    end_date,
+                ],
+            )
+            .annotate(
+                **{
+                    dimension: dimension_expressions[dimension]
+                    for dimension in dimensions
+                    if dimension != GenericConstants.PRODUCT
+                }
+            )
+            .values(*columns)
+            .annotate(
+                total_quantity=Coalesce(Sum("quantity"), Value(0)),
+                total_price=Coalesce(Sum("line_total"), Value(0)),
+            )
+            .order_by(*columns)
+            .values_list(*columns, "total_quantity", "total_price")
+        )
+
+    def get_product_comparison_by_order_closure_date(
+        self, start_date, end_date, compare_start_date, compare_end_date
+    ):
+        """
+        Gets the product totals of two order closure periods in a single scan.
+
+        Each period total is a conditional aggregation over the rows of both
+        periods, so products sold in only one of them get a zero total.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param datetime compare_start_date: The compared period start date.
+        :param datetime compare_end_date: The compared period end date.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+        self.validator.is_null(compare_start_date)
+        self.validator.is_null(compare_end_date)
+
+        period = Q(order__closed_at__range=[start_date, end_date])
+        compare_period = Q(
+            order__closed_at__range=[compare_start_date, compare_end_date]
+        )
+        return (
+            ProductQuantity.objects.filter(period | compare_period, deleted_at=None)
+            .values("product_id", "product__name", "product__description")
+            .annotate(
+                total_quantity=Coalesce(Sum("quantity", filter=period), Value(0)),
+                total_price=Coalesce(Sum("line_total", filter=period), Value(0)),
+                compare_total_quantity=Coalesce(
+                    Sum("quantity", filter=compare_period), Value(0)
+                ),
+                compare_total_price=Coalesce(
+                    Sum("line_total", filter=compare_period), Value(0)
+                ),
+            )
+            .order_by("-total_quantity", "product_id")
+        )
+
+    def get_product_partial_totals_by_order_closure_date(
+        self, start_date, end_date, include_end_date
+    ):
+        """
+        Gets the unordered product totals of an order closure date partition.
+
+        Partitions are half open unless the end date is included, so adjacent
+        partitions never count the same order.
+
+        :param datetime start_date: The partition start date.
+        :param datetime end_date: The partition end date.
+        :param bool include_end_date: Whether orders closed at the end date are included.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+
+        closure_filter = {"order__closed_at__lt": end_date}
+        if include_end_date:
+            closure_filter = {"order__closed_at__lte": end_date}
+
+        return (
+            ProductQuantity.objects.filter(
+                deleted_at=None,
+                order__closed_at__gte=start_date,
+                **closure_filter,
+            )
+            .values("product_id")
+            .annotate(
+                total_quantity=Coalesce(Sum("quantity"), Value(0)),
+                total_price=Coalesce(Sum("line_total"), Value(0)),
+            )
+            .order_by()
+        )
+
+    def get_product_totals_by_order_closure_date_partitions(
+        self, partitions, order_by, limit=None, cursor=None
+    ):
+        """
+        Gets the product totals over order closure date partitions, in a single
+        query.
+
+        Each partition is aggregated by a branch of a UNION ALL the database
+        runs on up to a parallel worker per partition, then the partial totals
+        are merged, ordered and limited in database, as the product totals by
+        order closure date are.
+
+        :param tuple[] partitions: The start date, end date and whether the end date is included.
+        :param string order_by: The total to order by, total_quantity or total_price.
+        :param int limit: The optional maximum number of totals.
+        :param tuple cursor: The optional last read total and product identifier.
+        """
+        self.validator.is_null(partitions)
+        self.validator.is_null_or_empty_string(order_by)
+
+        using = router.db_for_read(ProductQuantity) or DEFAULT_DB_ALIAS
+        connection = connections[using]
+        quote_name = connection.ops.quote_name
+
+        branches = []
+        params = []
+        for partition in partitions:
+            partial_totals = self.get_product_partial_totals_by_order_closure_date(
+                *partition
+            ).using(using)
+            branch_sql, branch_params = partial_totals.query.sql_with_params()
+            branches.append(branch_sql)
+            params += branch_params
+
+        filter_sql = ""
+        if cursor is not None:
+            filter_sql = (
+                "WHERE %(total)s < %%s OR (%(total)s = %%s AND %(id)s > %%s)"
+                % {
+                    "total": quote_name(order_by),
+                    "id": quote_name("product_id"),
+                }
+            )
+            total, product_id = cursor
+            params += [total, total, product_id]
+
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT %s"
+            params.append(limit)
+
+        sql = (
+            "SELECT * FROM ("
+            "SELECT partial_totals.product_id, product.name AS product__name, "
+            "product.description AS product__description, "
+            "CAST(SUM(partial_totals.total_quantity) AS bigint) AS total_quantity, "
+            "CAST(SUM(partial_totals.total_price) AS bigint) AS total_price "
+            "FROM (%(branches)s) AS partial_totals "
+            "JOIN %(product)s AS product ON product.id = partial_totals.product_id "
+            "GROUP BY partial_totals.product_id, product.name, product.description"
+            ") AS product_totals %(filter)s "
+            "ORDER BY %(total)s DESC, product_id %(limit)s"
+        ) % {
+            "branches": " UNION ALL ".join("(%s)" % branch for branch in branches),
+            "product": quote_name(Product._meta.db_table),
+            "filter": filter_sql,
+            "total": quote_name(order_by),
+            "limit": limit_sql,
+        }
+
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            cursor.execute(
+                "SET LOCAL max_parallel_workers_per_gather = %s", [len(partitions)]
+            )
+            cursor.execute(sql, params)
+            columns = [column.name for column in cursor.description]
+
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
     def get_product_quantity_by_id(self, order_id, id):
         """
         Gets a product quantity by identifier.
@@ -93,6 +392,95 @@ class ProductQuantityRepository:
 
         return product_quantities
 
+    def get_product_quantity_series_by_order_closure_date(
+        self, start_date, end_date, group_by, tzinfo, product_id=None
+    ):
+        """
+        Gets the product quantity totals grouped by order closure date buckets.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param string group_by: The bucket size, hour, day, week or month.
+        :param tzinfo tzinfo: The timezone the buckets are truncated in.
+        :param uuid4 product_id: The optional product identifier.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+        self.validator.is_null_or_empty_string(group_by)
+        self.validator.is_null(tzinfo)
+
+        product_quantities = ProductQuantity.objects.filter(
+            deleted_at=None,
+            order__closed_at__range=[
+                start_date,
+                end_date,
+            ],
+        )
+
+        if product_id is not None:
+            product_quantities = product_quantities.filter(product_id=product_id)
+
+        return (
+            product_quantities.annotate(
+                date=Trunc("order__closed_at", group_by, tzinfo=tzinfo)
+            )
+            .values("date")
+            .annotate(
+                total_quantity=Sum("quantity"),
+                total_price=Sum("line_total"),
+            )
+            .order_by("date")
+        )
+
+    def get_product_totals_by_order_closure_date(
+        self, start_date, end_date, order_by, limit=None, cursor=None
+    ):
+        """
+        Gets the product totals by order closure start and end dates.
+
+        Totals are grouped, ordered and limited in database, descending by the
+        order by total and ascending by product identifier. The cursor holds
+        the order by total and product identifier of the last row already read.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param string order_by: The total to order by, total_quantity or total_price.
+        :param int limit: The optional maximum number of totals.
+        :param tuple cursor: The optional last read total and product identifier.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+        self.validator.is_null_or_empty_string(order_by)
+
+        product_totals = (
+            ProductQuantity.objects.filter(
+                deleted_at=None,
+                order__closed_at__range=[
+                    start_date,
+                    end_date,
+                ],
+            )
+            .values("product_id", "product__name", "product__description")
+            .annotate(
+                total_quantity=Coalesce(Sum("quantity"), Value(0)),
+                total_price=Coalesce(Sum("line_total"), Value(0)),
+            )
+        )
+
+        if cursor is not None:
+            total, product_id = cursor
+            product_totals = product_totals.filter(
+                Q(**{order_by + "__lt": total})
+                | Q(**{order_by: total, "product_id__gt": product_id})
+            )
+
+        product_totals = product_totals.order_by("-" + order_by, "product_id")
+
+        if limit is not None:
+            product_totals = product_totals[:limit]
+
+        return product_totals
+
     def delete_product_quantity(self, product_quantity):
         """
         Deletes a product quantity.
@@ -132,6 +520,7 @@ class ProductQuantityRepository:
         self.validator.is_null(new_quantity)
 
         product_quantity.quantity = new_quantity
+        product_quantity.line_total = new_quantity * product_quantity.unit_price
         product_quantity.updated_at = now()
         product_quantity.save()
 
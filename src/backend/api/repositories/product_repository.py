@@ -59,6 +59,16 @@ class ProductRepository:
 
         return Product.objects.filter(id=id, deleted_at=None)
 
+    def get_products_by_ids(self, ids):
+        """
+        Gets the products by identifiers.
+
+        :param uuid4[] ids: The product identifiers.
+        """
+        self.validator.is_null(ids)
+
+        return Product.objects.filter(id__in=ids, deleted_at=None)
+
     def get_product_by_name(self, name):
         """
         Gets products by name.
@@ -0,0 +1,42 @@
+"""
+File name: client_report_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework import serializers
+
+
+class ClientReportResponseSerializer(serializers.Serializer):
+    """
+    The external client report response serializer.
+    """
+
+    external_client = serializers.CharField(read_only=True)
+    """
+    The external client.
+    """
+
+    product_id = serializers.UUIDField(read_only=True)
+    """
+    The product identifier, when grouped by product.
+    """
+
+    product_name = serializers.CharField(read_only=True)
+    """
+    The product name, when grouped by product.
+    """
+
+    total_orders = serializers.IntegerField(read_only=True)
+    """
+    The client closed orders total.
+    """
+
+    total_quantity = serializers.IntegerField(read_only=True)
+    """
+    The client bought total quantity.
+    """
+
+    total_price = serializers.IntegerField(read_only=True)
+    """
+    The client bought total price.
+    """
@@ -0,0 +1,25 @@
+"""
+File name: dimension_report_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework import serializers
+
+
+class DimensionReportResponseSerializer(serializers.Serializer):
+    """
+    The dimension report response serializer.
+
+    The report is a columnar block, each column is a list of values with one
+    position per group.
+    """
+
+    dimensions = serializers.ListField(child=serializers.CharField(), read_only=True)
+    """
+    The grouping dimensions, in column order.
+    """
+
+    columns = serializers.DictField(child=serializers.ListField(), read_only=True)
+    """
+    The dimension columns followed by the total_quantity and total_price columns.
+    """
@@ -0,0 +1,24 @@
+"""
+File name: order_multi_get_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework import serializers
+
+from api.serializers.responses.order_response_serializer import OrderResponseSerializer
+
+
+class OrderMultiGetResponseSerializer(serializers.Serializer):
+    """
+    The order multi-get response serializer.
+    """
+
+    items = serializers.DictField(child=OrderResponseSerializer(), read_only=True)
+    """
+    The found orders, keyed by identifier.
+    """
+
+    missing = serializers.ListField(child=serializers.UUIDField(), read_only=True)
+    """
+    The requested identifiers without order.
+    """
@@ -3,15 +3,16 @@ File name: order_response_serializer.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
-from rest_framework.serializers import ModelSerializer
-
 from api.models.order import Order
 from api.serializers.responses.product_quantity_response_serializer import (
     ProductQuantityResponseSerializer,
 )
+from api.serializers.responses.sparse_fieldset_response_serializer import (
+    SparseFieldsetResponseSerializer,
+)
 
 
-class OrderResponseSerializer(ModelSerializer):
+class OrderResponseSerializer(SparseFieldsetResponseSerializer):
     """
     The order response serializer.
     """
@@ -0,0 +1,67 @@
+"""
+File name: product_comparison_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework import serializers
+
+
+class ProductComparisonResponseSerializer(serializers.Serializer):
+    """
+    The product comparison response serializer.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    """
+    The product identifier.
+    """
+
+    name = serializers.CharField(read_only=True)
+    """
+    The prodcut name.
+    """
+
+    description = serializers.CharField(read_only=True)
+    """
+    The product description.
+    """
+
+    total_quantity = serializers.IntegerField(read_only=True)
+    """
+    The product total sold quantity.
+    """
+
+    total_price = serializers.IntegerField(read_only=True)
+    """
+    The product total sold price.
+    """
+
+    compare_total_quantity = serializers.IntegerField(read_only=True)
+    """
+    The compared period total sold quantity.
+    """
+
+    compare_total_price = serializers.IntegerField(read_only=True)
+    """
+    The compared period total sold price.
+    """
+
+    quantity_delta = serializers.IntegerField(read_only=True)
+    """
+    The total sold quantity delta against the compared period.
+    """
+
+    price_delta = serializers.IntegerField(read_only=True)
+    """
+    The total sold price delta against the compared period.
+    """
+
+    quantity_delta_percentage = serializers.FloatField(read_only=True)
+    """
+    The total sold quantity delta percentage, null when nothing was compared.
+    """
+
+    price_delta_percentage = serializers.FloatField(read_only=True)
+    """
+    The total sold price delta percentage, null when nothing was compared.
+    """
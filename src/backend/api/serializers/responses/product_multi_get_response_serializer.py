@@ -0,0 +1,26 @@
+"""
+File name: product_multi_get_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework import serializers
+
+from api.serializers.responses.product_response_serializer import (
+    ProductResponseSerializer,
+)
+
+
+class ProductMultiGetResponseSerializer(serializers.Serializer):
+    """
+    The product multi-get response serializer.
+    """
+
+    items = serializers.DictField(child=ProductResponseSerializer(), read_only=True)
+    """
+    The found products, keyed by identifier.
+    """
+
+    missing = serializers.ListField(child=serializers.UUIDField(), read_only=True)
+    """
+    The requested identifiers without product.
+    """
@@ -3,15 +3,16 @@ File name: product_quantity_serializer.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
-from rest_framework.serializers import ModelSerializer
-
 from api.models.product_quantity import ProductQuantity
 from api.serializers.responses.product_response_serializer import (
     ProductResponseSerializer,
 )
+from api.serializers.responses.sparse_fieldset_response_serializer import (
+    SparseFieldsetResponseSerializer,
+)
 
 
-class ProductQuantityResponseSerializer(ModelSerializer):
+class ProductQuantityResponseSerializer(SparseFieldsetResponseSerializer):
     """
     The product quantity response serializer.
     """
@@ -24,5 +25,7 @@ class ProductQuantityResponseSerializer(ModelSerializer):
             "id",
             "product",
             "quantity",
+            "unit_price",
+            "line_total",
         ]
         depth = 1
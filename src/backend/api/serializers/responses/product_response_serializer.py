@@ -3,12 +3,13 @@ File name: product_response_serializer.py
 Author: Fernando Rivera
 Creation date: 2021-12-07
 """
-from rest_framework.serializers import ModelSerializer
-
 from api.models.product import Product
+from api.serializers.responses.sparse_fieldset_response_serializer import (
+    SparseFieldsetResponseSerializer,
+)
 
 
-class ProductResponseSerializer(ModelSerializer):
+class ProductResponseSerializer(SparseFieldsetResponseSerializer):
     """
     The product response serializer.
     """
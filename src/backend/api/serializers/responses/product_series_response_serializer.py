@@ -0,0 +1,27 @@
+"""
+File name: product_series_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework import serializers
+
+
+class ProductSeriesResponseSerializer(serializers.Serializer):
+    """
+    The product series response serializer.
+    """
+
+    date = serializers.DateTimeField(read_only=True)
+    """
+    The series bucket start date.
+    """
+
+    total_quantity = serializers.IntegerField(read_only=True)
+    """
+    The bucket total sold quantity.
+    """
+
+    total_price = serializers.IntegerField(read_only=True)
+    """
+    The bucket total sold price.
+    """
@@ -0,0 +1,146 @@
+"""
+File name: sparse_fieldset_response_serializer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.serializers import ListSerializer, ModelSerializer, UUIDField
+
+from utils.configurations.constants import GenericConstants
+
+
+class SparseFieldsetResponseSerializer(ModelSerializer):
+    """
+    The sparse fieldset response serializer.
+
+    Keeps only the requested fields and embeds only the expanded nested
+    serializers, the nested serializers not expanded are rendered as their
+    identifiers. A dot separated expansion expands its parents too. Without
+    fields every field is kept, and without expand every nested serializer is
+    embedded.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        """
+        Creates a new instance of SparseFieldsetResponseSerializer class.
+
+        :param string[] fields: The optional fields to keep.
+        :param string[] expand: The optional nested fields to embed, dot separated.
+        """
+        super().__init__(*args, **kwargs)
+        self.sparse_fields = fields
+        self.expand = expand
+
+    @classmethod
+    def get_expandable_fields(cls):
+        """
+        Gets the nested fields that can be expanded, dot separated.
+        """
+        expandable_fields = []
+
+        for name, field in cls().fields.items():
+            serializer = getattr(field, "child", field)
+            if isinstance(serializer, SparseFieldsetResponseSerializer):
+                expandable_fields.append(name)
+                expandable_fields += [
+                    name + GenericConstants.DOT + nested_name
+                    for nested_name in type(serializer).get_expandable_fields()
+                ]
+
+        return expandable_fields
+
+    def get_fields(self):
+        """
+        Gets the serializer fields, trimmed to the fields and expansions.
+        """
+        fields = super().get_fields()
+
+        if self.sparse_fields is not None:
+            for name in list(fields):
+                if name not in self.sparse_fields:
+                    fields.pop(name)
+
+        if self.expand is not None:
+            for name, field in fields.items():
+                serializer = getattr(field, "child", field)
+                if not isinstance(serializer, SparseFieldsetResponseSerializer):
+                    continue
+
+                many = isinstance(field, ListSerializer)
+                if self.__is_expanded(self.expand, name):
+                    fields[name] = type(serializer)(
+                        many=many,
+                        read_only=True,
+                        expand=self.__get_nested_expand(self.expand, name),
+                    )
+                else:
+                    fields[name] = PrimaryKeyRelatedField(
+                        many=many, read_only=True, pk_field=UUIDField()
+                    )
+
+        return fields
+
+    @classmethod
+    def trim_representation(cls, representation, fields=None, expand=None):
+        """
+        Trims an already serialized representation, as the serializer does.
+
+        :param dict representation: The serialized representation.
+        :param string[] fields: The optional fields to keep.
+        :param string[] expand: The optional nested fields to embed, dot separated.
+        """
+        serializer_fields = cls().fields
+        trimmed_representation = {}
+
+        for name, value in representation.items():
+            if fields is not None and name not in fields:
+                continue
+
+            field = serializer_fields.get(name)
+            serializer = getattr(field, "child", field)
+            if (
+                expand is not None
+                and value is not None
+                and isinstance(serializer, SparseFieldsetResponseSerializer)
+            ):
+                nested_expand = cls.__get_nested_expand(expand, name)
+                values = value if isinstance(field, ListSerializer) else [value]
+                values = [
+                    type(serializer).trim_representation(item, None, nested_expand)
+                    if cls.__is_expanded(expand, name)
+                    else item.get(GenericConstants.ID)
+                    for item in values
+                ]
+                value = values if isinstance(field, ListSerializer) else values[0]
+
+            trimmed_representation[name] = value
+
+        return trimmed_representation
+
+    @classmethod
+    def __get_nested_expand(cls, expand, name):
+        """
+        Gets the expansions of a nested field, relative to it.
+
+        :param string[] expand: The nested fields to embed, dot separated.
+        :param string name: The nested field name.
+        """
+        return [
+            path.split(GenericConstants.DOT, 1)[1]
+            for path in expand
+            if path.startswith(name + GenericConstants.DOT)
+        ]
+
+    @classmethod
+    def __is_expanded(cls, expand, name):
+        """
+        Validates whether a nested field is expanded, by itself or by one of its
+        nested fields.
+
+        :param string[] expand: The nested fields to embed, dot separated.
+        :param string name: The nested field name.
+        """
+        return any(
+            path == name or path.startswith(name + GenericConstants.DOT)
+            for path in expand
+        )
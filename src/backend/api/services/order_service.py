@@ -3,10 +3,15 @@ File name: order_service.py
 Author: Fernando Rivera
 Creation date: 2021-12-07
 """
+from api.models.client_report import ClientReport
 from api.repositories.order_repository import OrderRepository
 from api.repositories.product_quantity_repository import ProductQuantityRepository
 from api.repositories.product_repository import ProductRepository
+from api.serializers.responses.client_report_response_serializer import (
+    ClientReportResponseSerializer,
+)
 from api.serializers.responses.order_response_serializer import OrderResponseSerializer
+from utils.asynchronous.loop_aware_sync_to_async import loop_aware_sync_to_async
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import (
     NotFoundException,
@@ -51,6 +56,7 @@ class OrderService:
             product_quantity_quantity = self.__create_product_quantity(
                 created_order.id,
                 product_id,
+                product_price,
                 product_quantity,
             )
 
@@ -80,18 +86,117 @@ class OrderService:
 
         return OrderResponseSerializer(deleted_order, many=False)
 
-    def get_order_by_id(self, id):
+    def get_client_report_by_order_closure_date(
+        self, start_date, end_date, by_product=False
+    ):
+        """
+        Gets the external client report by order closure start and end dates.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param bool by_product: Whether totals are also grouped by product.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+
+        client_totals = list(
+            self.product_quantity_repository.get_client_totals_by_order_closure_date(
+                start_date,
+                end_date,
+                by_product,
+            )
+        )
+
+        if len(client_totals) == 0:
+            raise NotFoundException(
+                ExceptionConstants.QUANTITY_FOR_PRODUCT_NOT_FOUND_BY_DATE
+                % {
+                    GenericConstants.START_DATE: start_date,
+                    GenericConstants.END_DATE: end_date,
+                }
+            )
+
+        client_reports = [
+            ClientReport(
+                external_client=client_total.get("order__external_client"),
+                total_orders=client_total.get(GenericConstants.TOTAL_ORDERS),
+                total_quantity=client_total.get(GenericConstants.TOTAL_QUANTITY),
+                total_price=client_total.get(GenericConstants.TOTAL_PRICE),
+                product_id=client_total.get(GenericConstants.PRODUCT_ID),
+                product_name=client_total.get("product__name"),
+            )
+            for client_total in client_totals
+        ]
+
+        return ClientReportResponseSerializer(client_reports, many=True).data
+
+    def get_order_by_id(self, id, fields=None, expand=None):
         """
         Gets an order by identifier.
 
+        Closed orders are served from the snapshot written on closure. Only the
+        requested fields and expansions are loaded and serialized.
+
         :param uuid4 id:The order identifier.
+        :param string[] fields: The optional fields to keep.
+        :param string[] expand: The optional nested fields to embed.
         """
         self.validator.is_null(id)
 
-        orders = self.repository.get_order_by_id(id)
+        snapshot = self.repository.get_order_snapshot_by_id(id)
+        if snapshot is not None:
+            return OrderResponseSerializer.trim_representation(snapshot, fields, expand)
+
+        orders = self.repository.get_order_by_id(
+            id, *self.__get_order_loading(fields, expand)
+        )
         self.__validate_order_exists(orders, id)
 
-        return OrderResponseSerializer(orders.first(), many=False)
+        return OrderResponseSerializer(
+            orders.first(), many=False, fields=fields, expand=expand
+        ).data
+
+    async def get_order_by_id_async(self, id, fields=None, expand=None):
+        """
+        Gets an order by identifier, from the event loop on the thread of the
+        synchronous code.
+
+        :param uuid4 id:The order identifier.
+        :param string[] fields: The optional fields to keep.
+        :param string[] expand: The optional nested fields to embed.
+        """
+        return await loop_aware_sync_to_async(self.get_order_by_id)(id, fields, expand)
+
+    def get_orders_by_ids(self, ids, fields=None, expand=None):
+        """
+        Gets orders by identifiers, keyed by identifier.
+
+        Closed orders are served from the snapshot written on closure, the
+        identifiers without an order are reported as missing.
+
+        :param uuid4[] ids: The order identifiers.
+        :param string[] fields: The optional fields to keep.
+        :param string[] expand: The optional nested fields to embed.
+        """
+        self.validator.is_null(ids)
+
+        orders = {}
+        for order in self.repository.get_orders_by_ids(
+            ids, *self.__get_order_loading(fields, expand)
+        ):
+            if order.snapshot is not None:
+                orders[str(order.id)] = OrderResponseSerializer.trim_representation(
+                    order.snapshot, fields, expand
+                )
+            else:
+                orders[str(order.id)] = OrderResponseSerializer(
+                    order, many=False, fields=fields, expand=expand
+                ).data
+
+        return {
+            GenericConstants.ITEMS: orders,
+            GenericConstants.MISSING: [str(id) for id in ids if str(id) not in orders],
+        }
 
     def update_order_by_id(self, order, id):
         """
@@ -131,11 +236,13 @@ class OrderService:
         self.repository.validate_order_closed(orders.first())
 
         closed_order = self.repository.update_order_closure(orders.first())
-
-        return OrderResponseSerializer(
+        closed_order_response = OrderResponseSerializer(
             closed_order,
             many=False,
         )
+        self.repository.update_order_snapshot(closed_order, closed_order_response.data)
+
+        return closed_order_response
 
     def __create_product(self, product):
         """
@@ -158,12 +265,15 @@ class OrderService:
 
             return existing_product.first().id, existing_product.first().price
 
-    def __create_product_quantity(self, order_id, product_id, product_quantity):
+    def __create_product_quantity(
+        self, order_id, product_id, product_price, product_quantity
+    ):
         """
         Creates a product quantity or updates the quantity.
 
         :param uuid4 order_id: The order identifier.
         :param uuid4 product_id: The product identifier.
+        :param int product_price: The product price captured on the line.
         :param ProductQuantitySerializer.data product_quantity: The product quantity.
         """
         quantity = product_quantity.get(GenericConstants.QUANTITY)
@@ -182,6 +292,7 @@ class OrderService:
                 product_quantity,
                 order_id,
                 product_id,
+                product_price,
             ).quantity
         else:
             new_quantity = (
@@ -195,6 +306,37 @@ class OrderService:
 
             return product_quantity.get(GenericConstants.QUANTITY)
 
+    def __get_order_loading(self, fields, expand):
+        """
+        Gets the order loading that serves the requested fields and expansions.
+
+        Returns the order fields to load, whether the product quantities are
+        prefetched and whether their products are joined.
+
+        :param string[] fields: The optional fields to keep.
+        :param string[] expand: The optional nested fields to embed.
+        """
+        only = None
+        if fields is not None:
+            only = [GenericConstants.ID, GenericConstants.SNAPSHOT] + [
+                field
+                for field in fields
+                if field != GenericConstants.PRODUCT_QUANTITIES
+            ]
+
+        with_product_quantities = (
+            fields is None or GenericConstants.PRODUCT_QUANTITIES in fields
+        )
+        with_products = (
+            expand is None
+            or GenericConstants.PRODUCT_QUANTITIES
+            + GenericConstants.DOT
+            + GenericConstants.PRODUCT
+            in expand
+        )
+
+        return only, with_product_quantities, with_products
+
     def __update_order_total_price(self, order, total_price):
         """
         Updates an order total price.
@@ -3,20 +3,41 @@ File name: product_quantity_service.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
-from operator import attrgetter
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime, timedelta
+from json import dumps, loads
+from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.timezone import is_naive, make_aware, now, override
+
+from api.models.product_comparison import ProductComparison
 from api.models.product_report import ProductReport
+from api.models.product_series import ProductSeries
 from api.repositories.order_repository import OrderRepository
 from api.repositories.product_quantity_repository import ProductQuantityRepository
 from api.repositories.product_repository import ProductRepository
+from api.serializers.responses.dimension_report_response_serializer import (
+    DimensionReportResponseSerializer,
+)
+from api.serializers.responses.product_comparison_response_serializer import (
+    ProductComparisonResponseSerializer,
+)
 from api.serializers.responses.product_quantity_response_serializer import (
     ProductQuantityResponseSerializer,
 )
 from api.serializers.responses.product_report_response_serializer import (
     ProductReportResponseSerializer,
 )
+from api.serializers.responses.product_series_response_serializer import (
+    ProductSeriesResponseSerializer,
+)
+from utils.asynchronous.loop_aware_sync_to_async import loop_aware_sync_to_async
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import (
+    BadRequestException,
     NotFoundException,
     UnprocessableEntityException,
 )
@@ -49,21 +70,18 @@ class ProductQuantityService:
         self.validator.is_null(product_quantity)
         self.validator.is_null(order_id)
 
-        self.__validate_product_quantity(product_quantity, order_id)
+        product = self.__validate_product_quantity(product_quantity, order_id)
         order = self.__get_order(order_id)
         self.order_repository.validate_order_closed(order)
 
         created_product_quantity = self.repository.create_product_quantity(
             product_quantity,
             order_id,
-            product_quantity.get(GenericConstants.PRODUCT).get(GenericConstants.ID),
+            product.id,
+            product.price,
         )
 
-        self.__increase_total_price(
-            created_product_quantity.product.id,
-            created_product_quantity.quantity,
-            order,
-        )
+        self.__increase_total_price(created_product_quantity.line_total, order)
 
         return ProductQuantityResponseSerializer(
             created_product_quantity,
@@ -88,8 +106,7 @@ class ProductQuantityService:
             product_quantity
         )
         self.__increase_total_price(
-            deleted_product_quantity.product.id,
-            deleted_product_quantity.quantity * GenericConstants.NEGATIVE_INDEX,
+            deleted_product_quantity.line_total * GenericConstants.NEGATIVE_INDEX,
             order,
         )
 
@@ -98,6 +115,142 @@ class ProductQuantityService:
             many=False,
         )
 
+    def get_dimension_report_by_order_closure_date(
+        self, start_date, end_date, dimensions, tzinfo
+    ):
+        """
+        Gets the totals grouped by several dimensions as a columnar block.
+
+        Reports over a settled range, one ending in the past, are cached for
+        REPORT_CACHE_TIMEOUT seconds, by the version of the range data, so a
+        later change of its lines or orders is read again.
+
+        Returns the dimension report and its cache key, the key is None when
+        the range is not settled.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param string[] dimensions: The product, client, hour or weekday dimensions.
+        :param tzinfo tzinfo: The timezone hours and weekdays are extracted in.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+        self.validator.is_null(dimensions)
+        self.validator.is_null(tzinfo)
+
+        if is_naive(start_date):
+            start_date = make_aware(start_date, tzinfo, is_dst=False)
+        if is_naive(end_date):
+            end_date = make_aware(end_date, tzinfo, is_dst=False)
+
+        cache_key = None
+
+        if end_date < now():
+            data_version = self.repository.get_data_version_by_order_closure_date(
+                start_date, end_date
+            )
+            cache_key = GenericConstants.REPORT_CACHE_KEY % {
+                GenericConstants.REPORT: GenericConstants.DIMENSIONS,
+                GenericConstants.KEY: GenericConstants.COMMA.join(
+                    [start_date.isoformat(), end_date.isoformat(), str(tzinfo)]
+                    + dimensions
+                    + [str(value) for value in data_version.values()]
+                ),
+            }
+            dimension_report = cache.get(cache_key)
+            if dimension_report is not None:
+                return dimension_report, cache_key
+
+        dimension_totals = list(
+            self.repository.get_dimension_totals_by_order_closure_date(
+                start_date,
+                end_date,
+                dimensions,
+                tzinfo,
+            )
+        )
+        self.__validate_product_totals_exist(dimension_totals, start_date, end_date)
+
+        column_names = dimensions + [
+            GenericConstants.TOTAL_QUANTITY,
+            GenericConstants.TOTAL_PRICE,
+        ]
+        dimension_report = DimensionReportResponseSerializer(
+            {
+                GenericConstants.DIMENSIONS: dimensions,
+                GenericConstants.COLUMNS: {
+                    column_name: list(column)
+                    for column_name, column in zip(column_names, zip(*dimension_totals))
+                },
+            }
+        ).data
+
+        if cache_key is not None:
+            cache.set(cache_key, dimension_report, settings.REPORT_CACHE_TIMEOUT)
+
+        return dimension_report, cache_key
+
+    def get_product_comparison_by_order_closure_date(
+        self, start_date, end_date, compare_start_date, compare_end_date
+    ):
+        """
+        Gets the product totals of a period compared against another period.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param datetime compare_start_date: The compared period start date.
+        :param datetime compare_end_date: The compared period end date.
+        """
+        self.validator.is_null(start_date)
+        self.validator.is_null(end_date)
+        self.validator.is_null(compare_start_date)
+        self.validator.is_null(compare_end_date)
+
+        product_totals = list(
+            self.repository.get_product_comparison_by_order_closure_date(
+                start_date,
+                end_date,
+                compare_start_date,
+                compare_end_date,
+            )
+        )
+        self.__validate_product_totals_exist(product_totals, start_date, end_date)
+
+        product_comparisons = [
+            ProductComparison(
+                id=product_total.get(GenericConstants.PRODUCT_ID),
+                name=product_total.get("product__name"),
+                description=product_total.get("product__description"),
+                total_quantity=product_total.get(GenericConstants.TOTAL_QUANTITY),
+                total_price=product_total.get(GenericConstants.TOTAL_PRICE),
+                compare_total_quantity=product_total.get(
+                    GenericConstants.COMPARE_TOTAL_QUANTITY
+                ),
+                compare_total_price=product_total.get(
+                    GenericConstants.COMPARE_TOTAL_PRICE
+                ),
+            )
+            for product_total in product_totals
+        ]
+
+        return ProductComparisonResponseSerializer(product_comparisons, many=True).data
+
+    async def get_product_comparison_by_order_closure_date_async(
+        self, start_date, end_date, compare_start_date, compare_end_date
+    ):
+        """
+        Gets the product totals of a period compared against another period,
+        from the event loop on the thread of the synchronous code.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param datetime compare_start_date: The compared period start date.
+        :param datetime compare_end_date: The compared period end date.
+        """
+        return await loop_aware_sync_to_async(
+            self.get_product_comparison_by_order_closure_date
+        )(start_date, end_date, compare_start_date, compare_end_date)
+
     def get_product_quantity_by_id(self, order_id, id):
         """
         Gets the product quantity by identifier.
@@ -113,44 +266,189 @@ class ProductQuantityService:
             many=False,
         )
 
-    def get_product_quantity_by_order_closure_date(self, start_date, end_date):
+    def get_product_quantity_by_order_closure_date(
+        self, start_date, end_date, order_by=None, limit=None, cursor=None
+    ):
         """
         Gets the product quantity by order closure start and end dates.
 
+        Returns the product report and the cursor of the next page, the cursor
+        is None when there are no further pages.
+
         :param datetime start_date: The filter start date.
         :param datetime end_date: The filter end date.
+        :param string order_by: The report order, quantity or revenue.
+        :param int limit: The optional maximum number of products.
+        :param string cursor: The optional cursor of the page to get.
         """
         self.validator.is_null(start_date)
         self.validator.is_null(end_date)
 
-        product_quantities = self.repository.get_product_quantity_by_order_closure_date(
-            start_date,
-            end_date,
+        total_field = self.__get_total_field(order_by)
+
+        if settings.REPORT_PARALLELISM > 1:
+            product_totals = self.__get_partitioned_product_totals(
+                start_date,
+                end_date,
+                total_field,
+                limit,
+                self.__decode_cursor(cursor),
+            )
+        else:
+            product_totals = list(
+                self.repository.get_product_totals_by_order_closure_date(
+                    start_date,
+                    end_date,
+                    total_field,
+                    limit,
+                    self.__decode_cursor(cursor),
+                )
+            )
+
+        if cursor is None:
+            self.__validate_product_totals_exist(
+                product_totals,
+                start_date,
+                end_date,
+            )
+
+        next_cursor = None
+        if limit is not None and len(product_totals) == limit:
+            next_cursor = self.__encode_cursor(product_totals[-1], total_field)
+
+        product_reports = [
+            self.__create_product_total(product_total)
+            for product_total in product_totals
+        ]
+
+        return (
+            ProductReportResponseSerializer(product_reports, many=True).data,
+            next_cursor,
         )
-        self.__validate_product_quantity_exists(
-            product_quantities,
-            start_date,
-            end_date,
+
+    async def get_product_quantity_by_order_closure_date_async(
+        self, start_date, end_date, order_by=None, limit=None, cursor=None
+    ):
+        """
+        Gets the product quantity by order closure start and end dates, from the
+        event loop on the thread of the synchronous code.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param string order_by: The report order, quantity or revenue.
+        :param int limit: The optional maximum number of products.
+        :param string cursor: The optional cursor of the page to get.
+        """
+        return await loop_aware_sync_to_async(
+            self.get_product_quantity_by_order_closure_date
+        )(start_date, end_date, order_by, limit, cursor)
+
+    def get_product_quantity_series_by_order_closure_date(
+        self, start_date, end_date, group_by, tzinfo, product_id=None
+    ):
+        """
+        Gets the product quantity totals by order closure date buckets.
+
+        Buckets without sales are filled with zero totals, from the start date
+        bucket, or the first bucket with sales when no start date is given,
+        up to the end date bucket. Ranges over SERIES_MAX_BUCKETS buckets are
+        rejected.
+
+        :param datetime start_date: The optional filter start date.
+        :param datetime end_date: The filter end date.
+        :param string group_by: The bucket size, hour, day, week or month.
+        :param tzinfo tzinfo: The timezone the buckets are truncated in.
+        :param uuid4 product_id: The optional product identifier.
+        """
+        self.validator.is_null(end_date)
+        self.validator.is_null_or_empty_string(group_by)
+        self.validator.is_null(tzinfo)
+
+        if start_date is not None and is_naive(start_date):
+            start_date = make_aware(start_date, tzinfo, is_dst=False)
+        if is_naive(end_date):
+            end_date = make_aware(end_date, tzinfo, is_dst=False)
+
+        buckets = list(
+            self.repository.get_product_quantity_series_by_order_closure_date(
+                start_date or make_aware(datetime.min),
+                end_date,
+                group_by,
+                tzinfo,
+                product_id,
+            )
         )
 
-        product_totals = []
+        if len(buckets) == 0:
+            raise NotFoundException(
+                ExceptionConstants.QUANTITY_FOR_PRODUCT_NOT_FOUND_BY_DATE
+                % {
+                    GenericConstants.START_DATE: start_date,
+                    GenericConstants.END_DATE: end_date,
+                }
+            )
+
+        bucket_totals = {
+            bucket.get(GenericConstants.DATE)
+            .astimezone(tzinfo)
+            .replace(tzinfo=None): bucket
+            for bucket in buckets
+        }
+
+        date = min(bucket_totals)
+        if start_date is not None:
+            date = self.__truncate_date(
+                start_date.astimezone(tzinfo).replace(tzinfo=None), group_by
+            )
+        last_date = self.__truncate_date(
+            end_date.astimezone(tzinfo).replace(tzinfo=None), group_by
+        )
 
-        for product_quantity in product_quantities:
-            found_product_total = self.__find_product_total(
-                product_totals, product_quantity.product.id
+        if (
+            self.__count_buckets(date, last_date, group_by)
+            > GenericConstants.SERIES_MAX_BUCKETS
+        ):
+            raise BadRequestException(
+                ExceptionConstants.SERIES_EXCEEDS_MAX_BUCKETS
+                % {
+                    GenericConstants.START_DATE: date,
+                    GenericConstants.END_DATE: last_date,
+                    GenericConstants.MAX_LENGTH: GenericConstants.SERIES_MAX_BUCKETS,
+                }
             )
 
-            if found_product_total is not None:
-                self.__update_product_total(
-                    product_totals,
-                    found_product_total,
-                    product_quantity,
+        product_series = []
+
+        while date <= last_date:
+            bucket = bucket_totals.get(date, {})
+            product_series.append(
+                ProductSeries(
+                    date=make_aware(date, tzinfo, is_dst=False),
+                    total_quantity=bucket.get(GenericConstants.TOTAL_QUANTITY, 0),
+                    total_price=bucket.get(GenericConstants.TOTAL_PRICE, 0),
                 )
-            else:
-                product_totals.append(self.__create_product_total(product_quantity))
-        product_totals.sort(key=attrgetter("total_quantity"), reverse=True)
+            )
+            date = self.__next_date(date, group_by)
 
-        return ProductReportResponseSerializer(product_totals, many=True).data
+        with override(tzinfo):
+            return ProductSeriesResponseSerializer(product_series, many=True).data
+
+    async def get_product_quantity_series_by_order_closure_date_async(
+        self, start_date, end_date, group_by, tzinfo, product_id=None
+    ):
+        """
+        Gets the product quantity totals by order closure date buckets, from the
+        event loop on the thread of the synchronous code.
+
+        :param datetime start_date: The optional filter start date.
+        :param datetime end_date: The filter end date.
+        :param string group_by: The bucket size, hour, day, week or month.
+        :param tzinfo tzinfo: The timezone the buckets are truncated in.
+        :param uuid4 product_id: The optional product identifier.
+        """
+        return await loop_aware_sync_to_async(
+            self.get_product_quantity_series_by_order_closure_date
+        )(start_date, end_date, group_by, tzinfo, product_id)
 
     def update_product_quantity_by_id(self, new_product_quantity, order_id, id):
         """
@@ -166,7 +464,7 @@ class ProductQuantityService:
 
         self.__validate_product_quantity_quantity(new_product_quantity)
         product_quantity = self.__get_product_quantity_by_id(order_id, id)
-        old_quantity = product_quantity.quantity
+        old_line_total = product_quantity.line_total
 
         order = self.__get_order(order_id)
         self.order_repository.validate_order_closed(order)
@@ -176,8 +474,7 @@ class ProductQuantityService:
         )
 
         self.__increase_total_price(
-            updated_product_quantity.product.id,
-            updated_product_quantity.quantity - old_quantity,
+            updated_product_quantity.line_total - old_line_total,
             order,
         )
 
@@ -186,40 +483,73 @@ class ProductQuantityService:
             many=False,
         )
 
-    def __create_product_total(self, product_quantity):
+    def __count_buckets(self, date, last_date, group_by):
+        """
+        Counts the buckets from a bucket start date to another, both included.
+
+        :param datetime date: The first bucket start date.
+        :param datetime last_date: The last bucket start date.
+        :param string group_by: The bucket size, hour, day, week or month.
+        """
+        if group_by == GenericConstants.HOUR:
+            return (last_date - date) // timedelta(hours=1) + 1
+        if group_by == GenericConstants.DAY:
+            return (last_date - date) // timedelta(days=1) + 1
+        if group_by == GenericConstants.WEEK:
+            return (last_date - date) // timedelta(weeks=1) + 1
+
+        return (last_date.year - date.year) * 12 + last_date.month - date.month + 1
+
+    def __create_product_total(self, product_total):
         """
         Creates a product report object.
 
-        :param ProductQuantity product_quantity: The product quantity.
+        :param dict product_total: The product total row.
         """
-        self.validator.is_null(product_quantity)
+        self.validator.is_null(product_total)
 
         return ProductReport(
-            id=product_quantity.product.id,
-            name=product_quantity.product.name,
-            description=product_quantity.product.description,
-            total_quantity=product_quantity.quantity,
-            total_price=product_quantity.quantity * product_quantity.product.price,
+            id=product_total.get(GenericConstants.PRODUCT_ID),
+            name=product_total.get("product__name"),
+            description=product_total.get("product__description"),
+            total_quantity=product_total.get(GenericConstants.TOTAL_QUANTITY),
+            total_price=product_total.get(GenericConstants.TOTAL_PRICE),
         )
 
-    def __find_product_total(self, product_totals, product_id):
+    def __decode_cursor(self, cursor):
         """
-        Finds a product total form list.
+        Decodes a report page cursor.
 
-        :param ProductReport[] prodcut_totals: The product totals list.
-        :param uuid4 product_id: The product identifier.
+        :param string cursor: The encoded cursor.
         """
-        self.validator.is_null(product_totals)
-        self.validator.is_null(product_id)
+        if cursor is None:
+            return None
 
-        return next(
-            (
-                product_total
-                for product_total in product_totals
-                if product_total.id == product_id
-            ),
-            None,
-        )
+        try:
+            total, product_id = loads(urlsafe_b64decode(cursor.encode()))
+
+            return int(total), UUID(product_id)
+        except (TypeError, ValueError, BinasciiError):
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_MUST_BE_CURSOR
+                % {GenericConstants.PARAMETER: cursor}
+            )
+
+    def __encode_cursor(self, product_total, total_field):
+        """
+        Encodes a report page cursor from the last product total of a page.
+
+        :param dict product_total: The last product total row.
+        :param string total_field: The total the report is ordered by.
+        """
+        return urlsafe_b64encode(
+            dumps(
+                [
+                    product_total.get(total_field),
+                    str(product_total.get(GenericConstants.PRODUCT_ID)),
+                ]
+            ).encode()
+        ).decode()
 
     def __get_order(self, id):
         """
@@ -236,21 +566,55 @@ class ProductQuantityService:
 
         return orders.first()
 
-    def __get_product_price(self, id):
+    def __get_partitioned_product_totals(
+        self, start_date, end_date, total_field, limit, cursor
+    ):
         """
-        Gets the product price.
+        Gets the product totals aggregated in parallel over closure date partitions.
 
-        :param uuid4 id: The product identifier.
+        The range is narrowed to its first and last closure dates and split in
+        REPORT_PARALLELISM partitions, aggregated, merged, ordered and
+        paginated in a single query, as the single partition report is.
+
+        :param datetime start_date: The filter start date.
+        :param datetime end_date: The filter end date.
+        :param string total_field: The total the report is ordered by.
+        :param int limit: The optional maximum number of products.
+        :param tuple cursor: The optional last read total and product identifier.
         """
-        self.validator.is_null(id)
+        closure_date_bounds = (
+            self.repository.get_closure_date_bounds_by_order_closure_date(
+                start_date, end_date
+            )
+        )
+        first_closed_at = closure_date_bounds.get(GenericConstants.FIRST_CLOSED_AT)
+        last_closed_at = closure_date_bounds.get(GenericConstants.LAST_CLOSED_AT)
+
+        if first_closed_at is None:
+            return []
+
+        partitions = self.__split_closure_date_range(
+            first_closed_at, last_closed_at, settings.REPORT_PARALLELISM
+        )
+
+        return self.repository.get_product_totals_by_order_closure_date_partitions(
+            partitions, total_field, limit, cursor
+        )
 
+    def __get_product(self, id):
+        """
+        Gets a product.
+
+        :param uuid4 id: The product identifier.
+        """
         products = self.product_repository.get_product_by_id(id)
+
         if products.count() == 0:
-            raise UnprocessableEntityException(
-                ExceptionConstants.PRODUCT_NOT_AVAILABLE % {GenericConstants.ID: id}
+            raise NotFoundException(
+                ExceptionConstants.PRODUCT_BY_ID_NOT_FOUND % {GenericConstants.ID: id}
             )
 
-        return products.first().price
+        return products.first()
 
     def __get_product_quantity_by_id(self, order_id, id):
         """
@@ -272,57 +636,90 @@ class ProductQuantityService:
 
         return product_quantity.first()
 
-    def __increase_total_price(self, id, quantity, order):
+    def __get_total_field(self, order_by):
+        """
+        Gets the product total field a report is ordered by.
+
+        :param string order_by: The report order, quantity or revenue.
+        """
+        if order_by == GenericConstants.REVENUE:
+            return GenericConstants.TOTAL_PRICE
+
+        return GenericConstants.TOTAL_QUANTITY
+
+    def __increase_total_price(self, line_total, order):
         """
         Increases th total price of the order.
 
-        :param uuid id: The product quantity identifier.
-        :param int quantity: The product_quantity quantity.
+        :param int line_total: The line total to be added, negative to decrease.
         :param Order order: The order to be updated.
         """
-        product_price = self.__get_product_price(id)
-        decreased_price = quantity * product_price
-
         self.order_repository.update_order_total_price(
-            order, order.total_price + decreased_price
+            order, order.total_price + line_total
         )
 
-    def __update_product_total(
-        self, product_totals, found_product_total, product_quantity
-    ):
+    def __next_date(self, date, group_by):
         """
-        Updates a product total.
+        Gets the start date of the bucket following the given one.
 
-        :param ProductReport[] product totals: The product totals list.
-        :param ProductReport found_product_total: The found product total in list.
-        :param ProductQuantity product_quantity: The product quantity to be updated.
+        :param datetime date: The bucket start date.
+        :param string group_by: The bucket size, hour, day, week or month.
         """
-        self.validator.is_null(product_totals)
-        self.validator.is_null(found_product_total)
-        self.validator.is_null(product_quantity)
+        if group_by == GenericConstants.HOUR:
+            return date + timedelta(hours=1)
+        if group_by == GenericConstants.DAY:
+            return date + timedelta(days=1)
+        if group_by == GenericConstants.WEEK:
+            return date + timedelta(weeks=1)
 
-        index = product_totals.index(found_product_total)
-        product_totals[index].total_quantity = (
-            product_totals[index].total_quantity + product_quantity.quantity
-        )
-        product_totals[index].total_price = product_totals[index].total_price + (
-            product_quantity.quantity * product_quantity.product.price
-        )
+        if date.month == 12:
+            return date.replace(year=date.year + 1, month=1)
+
+        return date.replace(month=date.month + 1)
 
-    def __validate_product_exists(self, id):
+    def __split_closure_date_range(self, first_closed_at, last_closed_at, partitions):
         """
-        Validates if product by identifier exsits.
+        Splits a closure date range in contiguous partitions of equal length.
 
-        :param uuid4 id: The product identifier.
+        Only the last partition includes its end date.
+
+        :param datetime first_closed_at: The first closure date.
+        :param datetime last_closed_at: The last closure date.
+        :param int partitions: The number of partitions.
         """
-        if self.product_repository.get_product_by_id(id).count() == 0:
-            raise NotFoundException(
-                ExceptionConstants.PRODUCT_BY_ID_NOT_FOUND % {GenericConstants.ID: id}
-            )
+        step = (last_closed_at - first_closed_at) / partitions
+        dates = [first_closed_at + step * index for index in range(partitions)]
+        dates.append(last_closed_at)
+
+        return [
+            (dates[index], dates[index + 1], index == partitions - 1)
+            for index in range(partitions)
+        ]
+
+    def __truncate_date(self, date, group_by):
+        """
+        Truncates a date to the start of its bucket, as date_trunc does.
+
+        :param datetime date: The date to be truncated.
+        :param string group_by: The bucket size, hour, day, week or month.
+        """
+        date = date.replace(minute=0, second=0, microsecond=0)
+
+        if group_by == GenericConstants.HOUR:
+            return date
+
+        date = date.replace(hour=0)
+
+        if group_by == GenericConstants.DAY:
+            return date
+        if group_by == GenericConstants.WEEK:
+            return date - timedelta(days=date.weekday())
+
+        return date.replace(day=1)
 
     def __validate_product_quantity(self, product_quantity, order_id):
         """
-        Validates a product quantity.
+        Validates a product quantity, returning its product.
 
         :param ProductQuantitySerializers.data product_quantity: The product quantity.
         :param uuid4 order_id: The order identifier.
@@ -336,7 +733,7 @@ class ProductQuantityService:
             GenericConstants.ID
         )
 
-        self.__validate_product_exists(product_id)
+        product = self.__get_product(product_id)
 
         product_quantities = (
             self.repository.get_product_quantity_by_order_id_and_product_id(
@@ -350,24 +747,7 @@ class ProductQuantityService:
                 % {GenericConstants.ID: product_id}
             )
 
-    def __validate_product_quantity_exists(
-        self, product_quantities, start_date, end_date
-    ):
-        """
-        Validates if product quantities exist.
-
-        :param ProductQauntity[] product_quantities: The product quantities to be verified.
-        :param datetime start_date: The start date.
-        :param datetime end_date: The end date.
-        """
-        if product_quantities.count() == 0:
-            raise NotFoundException(
-                ExceptionConstants.QUANTITY_FOR_PRODUCT_NOT_FOUND_BY_DATE
-                % {
-                    GenericConstants.START_DATE: start_date,
-                    GenericConstants.END_DATE: end_date,
-                }
-            )
+        return product
 
     def __validate_product_quantity_quantity(self, product_quantity):
         """
@@ -381,3 +761,20 @@ class ProductQuantityService:
             raise UnprocessableEntityException(
                 ExceptionConstants.VALID_QUANTITY_MUST_BE_SET
             )
+
+    def __validate_product_totals_exist(self, product_totals, start_date, end_date):
+        """
+        Validates if product totals exist.
+
+        :param dict[] product_totals: The product totals to be verified.
+        :param datetime start_date: The start date.
+        :param datetime end_date: The end date.
+        """
+        if len(product_totals) == 0:
+            raise NotFoundException(
+                ExceptionConstants.QUANTITY_FOR_PRODUCT_NOT_FOUND_BY_DATE
+                % {
+                    GenericConstants.START_DATE: start_date,
+                    GenericConstants.END_DATE: end_date,
+                }
+            )
@@ -7,6 +7,7 @@ from api.repositories.product_repository import ProductRepository
 from api.serializers.responses.product_response_serializer import (
     ProductResponseSerializer,
 )
+from utils.asynchronous.loop_aware_sync_to_async import loop_aware_sync_to_async
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import (
     NotFoundException,
@@ -61,17 +62,59 @@ class ProductService:
             self.repository.delete_product(products.first()), many=False
         )
 
-    def get_product_by_id(self, id):
+    def get_product_by_id(self, id, fields=None):
         """
         Gets product by identifier.
 
         :param uuid4 id: The product identifier.
+        :param string[] fields: The optional fields to keep.
         """
         self.validator.is_null(id)
 
         products = self.__validate_product_by_id(id)
+        if fields is not None:
+            products = products.only(GenericConstants.ID, *fields)
 
-        return ProductResponseSerializer(products.first(), many=False)
+        return ProductResponseSerializer(products.first(), many=False, fields=fields)
+
+    async def get_product_by_id_async(self, id, fields=None):
+        """
+        Gets the serialized product by identifier, from the event loop on the
+        thread of the synchronous code.
+
+        :param uuid4 id: The product identifier.
+        :param string[] fields: The optional fields to keep.
+        """
+        return await loop_aware_sync_to_async(self.__get_product_data_by_id)(id, fields)
+
+    def get_products_by_ids(self, ids, fields=None):
+        """
+        Gets products by identifiers, keyed by identifier.
+
+        The identifiers without a product are reported as missing.
+
+        :param uuid4[] ids: The product identifiers.
+        :param string[] fields: The optional fields to keep.
+        """
+        self.validator.is_null(ids)
+
+        products = self.repository.get_products_by_ids(ids)
+        if fields is not None:
+            products = products.only(GenericConstants.ID, *fields)
+
+        products = {
+            str(product.id): ProductResponseSerializer(
+                product, many=False, fields=fields
+            ).data
+            for product in products
+        }
+
+        return {
+            GenericConstants.ITEMS: products,
+            GenericConstants.MISSING: [
+                str(id) for id in ids if str(id) not in products
+            ],
+        }
 
     def update_product(self, product, id):
         """
@@ -94,6 +137,15 @@ class ProductService:
             self.repository.update_product(product, products.first()), many=False
         )
 
+    def __get_product_data_by_id(self, id, fields):
+        """
+        Gets the serialized product by identifier.
+
+        :param uuid4 id: The product identifier.
+        :param string[] fields: The optional fields to keep.
+        """
+        return self.get_product_by_id(id, fields).data
+
     def __validate_product_by_id(self, id):
         """
         Validates if product exists.
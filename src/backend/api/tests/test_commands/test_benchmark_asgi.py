@@ -0,0 +1,37 @@
+"""
+File name: test_benchmark_asgi.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from api.models.order import Order
+from auth_api.models import User
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkAsgiCommand:
+    """
+    The test benchmark ASGI command class.
+
+    Tests the benchmark_asgi command.
+    """
+
+    def test_benchmark_asgi(self):
+        """
+        Tests the benchmark_asgi command runs every handler and removes its rows.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command("benchmark_asgi", requests=2, concurrency=2, stdout=stdout)
+
+        # assert
+        assert "health wsgi" in stdout.getvalue()
+        assert "report asgi" in stdout.getvalue()
+        assert Order.objects.count() == 0
+        assert User.objects.count() == 0
@@ -0,0 +1,31 @@
+"""
+File name: test_benchmark_formats.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class TestBenchmarkFormatsCommand:
+    """
+    The test benchmark formats command class.
+
+    Tests the benchmark_formats command.
+    """
+
+    def test_benchmark_formats(self):
+        """
+        Tests the benchmark_formats command runs every format.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command("benchmark_formats", orders=2, lines=2, repeat=1, stdout=stdout)
+
+        # assert
+        assert "orders native fast json" in stdout.getvalue()
+        assert "report msgpack" in stdout.getvalue()
+        assert "users json" in stdout.getvalue()
@@ -0,0 +1,37 @@
+"""
+File name: test_benchmark_middleware.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from api.models.order import Order
+from auth_api.models import User
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkMiddlewareCommand:
+    """
+    The test benchmark middleware command class.
+
+    Tests the benchmark_middleware command.
+    """
+
+    def test_benchmark_middleware(self):
+        """
+        Tests the benchmark_middleware command runs every stack and removes its rows.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command("benchmark_middleware", requests=2, repeat=1, stdout=stdout)
+
+        # assert
+        assert "health session" in stdout.getvalue()
+        assert "order stateless" in stdout.getvalue()
+        assert Order.objects.count() == 0
+        assert User.objects.count() == 0
@@ -0,0 +1,35 @@
+"""
+File name: test_benchmark_pool.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkPoolCommand:
+    """
+    The test benchmark pool command class.
+
+    Tests the benchmark_pool command.
+    """
+
+    def test_benchmark_pool(self):
+        """
+        Tests the benchmark_pool command opens no more connections than the pool size.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command(
+            "benchmark_pool", requests=20, threads=4, pool_size=2, stdout=stdout
+        )
+
+        # assert
+        assert "connect" in stdout.getvalue()
+        assert "pool" in stdout.getvalue()
+        assert "2 created" in stdout.getvalue()
@@ -0,0 +1,93 @@
+"""
+File name: test_benchmark_reports.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from api.models.order import Order
+from api.models.product import Product
+from api.models.product_quantity import ProductQuantity
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkReportsCommand:
+    """
+    The test benchmark reports command class.
+
+    Tests the benchmark_reports command.
+    """
+
+    def test_benchmark_reports(self):
+        """
+        Tests the benchmark_reports command runs and removes its rows.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command(
+            "benchmark_reports",
+            rows=100,
+            products=5,
+            repeat=1,
+            parallelism=[1, 2],
+            allow_database_writes=True,
+            stdout=stdout,
+        )
+
+        # assert
+        assert "legacy loop" in stdout.getvalue()
+        assert "dimension report" in stdout.getvalue()
+        assert "product report x2" in stdout.getvalue()
+        assert ProductQuantity.objects.count() == 0
+
+    def test_benchmark_reports_keeps_other_rows(self):
+        """
+        Tests the benchmark_reports command removes only the rows it seeded.
+        """
+        # arrange
+        order = Order.objects.create(
+            id=uuid4(), external_client="benchmark client 0", total_price=0
+        )
+        product = Product.objects.create(
+            id=uuid4(),
+            name="benchmark product",
+            description="benchmark product",
+            price=100,
+        )
+
+        # act
+        call_command(
+            "benchmark_reports",
+            rows=100,
+            products=5,
+            repeat=1,
+            parallelism=[1],
+            skip_legacy=True,
+            allow_database_writes=True,
+            stdout=StringIO(),
+        )
+
+        # assert
+        assert list(Order.objects.values_list("id", flat=True)) == [order.id]
+        assert list(Product.objects.values_list("id", flat=True)) == [product.id]
+
+    def test_benchmark_reports_database_writes_not_allowed(self):
+        """
+        Tests the benchmark_reports command seeds nothing unless the database
+        writes are allowed.
+        """
+        # arrange
+        # act
+        with pytest.raises(CommandError):
+            call_command("benchmark_reports", rows=100, stdout=StringIO())
+
+        # assert
+        assert Order.objects.count() == 0
+        assert Product.objects.count() == 0
@@ -0,0 +1,180 @@
+"""
+File name: test_replica_routing_middleware.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from multiprocessing import get_context
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.models.product import Product
+from auth_api.models import User
+from backend.middleware import ReplicaRoutingMiddleware
+from utils.databases.replica_router import ReplicaRouter
+
+
+@pytest.mark.django_db(transaction=True)
+class TestReplicaRoutingMiddleware:
+    """
+    The test replica routing middleware class.
+
+    Tests the ReplicaRoutingMiddleware class.
+    """
+
+    def setup(self):
+        """
+        TestReplicaRoutingMiddleware class setup.
+        """
+        caches["shared"].clear()
+
+        self.client = APIClient()
+        self.databases = []
+
+        self.user = User.objects.create(
+            id=uuid4(),
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=2,
+        )
+
+        self.product = Product.objects.create(
+            id=uuid4(),
+            name="test_product_name",
+            description="test_product_description",
+            price=100,
+        )
+
+        self.url = reverse("products_id", kwargs={"id": self.product.id})
+        self.client.force_authenticate(user=self.user)
+
+    def spy_db_for_read(self):
+        """
+        Records the databases the product reads are routed to, reading them
+        from the primary database as the replica alias is not configured. The
+        writes made at the end of the request, such as the deferred last login
+        dates, are not recorded.
+        """
+        db_for_read = ReplicaRouter.db_for_read
+
+        def spy(router, model, **hints):
+            database = db_for_read(router, model, **hints)
+            if model is Product:
+                self.databases.append(database)
+
+        return mock.patch.object(ReplicaRouter, "db_for_read", spy)
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_get_reads_replica(self):
+        """
+        Tests a safe request reads from a replica.
+        """
+        # arrange
+        self.setup()
+
+        # act
+        with self.spy_db_for_read():
+            response = self.client.get(self.url)
+
+        # assert
+        assert response.status_code == 200
+        assert self.databases
+        assert set(self.databases) == {"replica"}
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_get_reads_primary_when_user_pinned(self):
+        """
+        Tests a safe request reads from the primary database after a write of the
+        user, also without the pin cookie.
+        """
+        # arrange
+        self.setup()
+        self.client.put(
+            self.url,
+            {"name": "test_update", "description": "test_update", "price": 101},
+        )
+        self.client.cookies.clear()
+
+        # act
+        with self.spy_db_for_read():
+            response = self.client.get(self.url)
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("name") == "test_update"
+        assert self.databases
+        assert set(self.databases) == {"default"}
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_get_reads_primary_when_user_pinned_by_other_process(self):
+        """
+        Tests a safe request in another worker process reads from the primary
+        database after a write of the user.
+        """
+        # arrange
+        self.setup()
+        context = get_context("fork")
+        written = context.Event()
+        results = context.Queue()
+
+        def get_database():
+            written.wait(10)
+            middleware = ReplicaRoutingMiddleware(
+                lambda request: HttpResponse(ReplicaRouter().db_for_read(Product))
+            )
+            request = RequestFactory().get(self.url)
+            request.user = self.user
+            results.put(middleware(request).content.decode())
+
+        process = context.Process(target=get_database)
+        process.start()
+
+        # act
+        self.client.put(
+            self.url,
+            {"name": "test_update", "description": "test_update", "price": 101},
+        )
+        written.set()
+        database = results.get(timeout=10)
+        process.join()
+
+        # assert
+        assert database == "default"
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_get_reads_replica_when_other_user_pinned(self):
+        """
+        Tests a safe request reads from a replica after a write of another user.
+        """
+        # arrange
+        self.setup()
+        self.client.put(
+            self.url,
+            {"name": "test_update", "description": "test_update", "price": 101},
+        )
+        other_user = User.objects.create(
+            id=uuid4(),
+            email="other@test.com",
+            password="test",
+            first_name="other_name",
+            last_name="other_last_name",
+            role=2,
+        )
+        client = APIClient()
+        client.force_authenticate(user=other_user)
+
+        # act
+        with self.spy_db_for_read():
+            response = client.get(self.url)
+
+        # assert
+        assert response.status_code == 200
+        assert set(self.databases) == {"replica"}
@@ -0,0 +1,32 @@
+"""
+File name: test_client_report_model.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import pytest
+
+from api.models.client_report import ClientReport
+
+
+@pytest.mark.django_db
+class TestClientReportModel:
+    """
+    The test client_report object class.
+
+    Tests the ClientReport object.
+    """
+
+    def test_client_report_str(self):
+        """
+        Tests the ClientReport object __str__ method.
+        """
+        # arrange
+        created_client_report = ClientReport(
+            external_client="test_external_client",
+            total_orders=1,
+            total_quantity=2,
+            total_price=3,
+        )
+
+        # assert
+        assert created_client_report.__str__() == "test_external_client"
@@ -0,0 +1,42 @@
+"""
+File name: test_product_comparison_model.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from uuid import uuid4
+
+import pytest
+
+from api.models.product_comparison import ProductComparison
+
+
+@pytest.mark.django_db
+class TestProductComparisonModel:
+    """
+    The test product_comparison object class.
+
+    Tests the ProductComparison object.
+    """
+
+    def test_product_comparison_str(self):
+        """
+        Tests the ProductComparison object __str__ method.
+        """
+        # arrange
+        product_id = uuid4()
+
+        created_product_comparison = ProductComparison(
+            id=product_id,
+            name="test_name",
+            description="test_description",
+            total_quantity=3,
+            total_price=30,
+            compare_total_quantity=2,
+            compare_total_price=0,
+        )
+
+        # assert
+        assert created_product_comparison.__str__() == str(product_id)
+        assert created_product_comparison.quantity_delta == 1
+        assert created_product_comparison.quantity_delta_percentage == 50.0
+        assert created_product_comparison.price_delta_percentage is None
@@ -0,0 +1,34 @@
+"""
+File name: test_product_series_model.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import pytest
+from django.utils.timezone import now
+
+from api.models.product_series import ProductSeries
+
+
+@pytest.mark.django_db
+class TestProductSeriesModel:
+    """
+    The test product_series object class.
+
+    Tests the ProductSeries object.
+    """
+
+    def test_product_series_str(self):
+        """
+        Tests the ProductSeries object __str__ method.
+        """
+        # arrange
+        date = now()
+
+        created_product_series = ProductSeries(
+            date=date,
+            total_quantity=1,
+            total_price=2,
+        )
+
+        # assert
+        assert created_product_series.__str__() == str(date)
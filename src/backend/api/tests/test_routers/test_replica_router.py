@@ -0,0 +1,94 @@
+"""
+File name: test_replica_router.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import pytest
+from django.db import transaction
+from django.test import override_settings
+
+from api.models.product import Product
+from utils.databases.replica_router import ReplicaRouter
+
+
+@pytest.mark.django_db(transaction=True)
+class TestReplicaRouter:
+    """
+    The test replica router class.
+
+    Tests the ReplicaRouter class.
+    """
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_db_for_read(self):
+        """
+        Tests the reads out of a replica block go to the primary database.
+        """
+        # arrange
+        router = ReplicaRouter()
+
+        # act
+        database = router.db_for_read(Product)
+
+        # assert
+        assert database is None
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_db_for_read_replica(self):
+        """
+        Tests the reads of a replica block go to a replica.
+        """
+        # arrange
+        router = ReplicaRouter()
+
+        # act
+        with ReplicaRouter.use_replicas():
+            database = router.db_for_read(Product)
+
+        # assert
+        assert database == "replica"
+        assert router.db_for_read(Product) is None
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_db_for_read_replica_in_transaction(self):
+        """
+        Tests the reads of a replica block within a transaction go to the primary
+        database.
+        """
+        # arrange
+        router = ReplicaRouter()
+
+        # act
+        with ReplicaRouter.use_replicas(), transaction.atomic():
+            database = router.db_for_read(Product)
+
+        # assert
+        assert database == "default"
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_db_for_write_replica(self):
+        """
+        Tests the writes of a replica block go to the primary database.
+        """
+        # arrange
+        router = ReplicaRouter()
+
+        # act
+        with ReplicaRouter.use_replicas():
+            database = router.db_for_write(Product, instance=Product())
+
+        # assert
+        assert database == "default"
+
+    @override_settings(DATABASE_REPLICAS=["replica"])
+    def test_allow_migrate_replica(self):
+        """
+        Tests the migrations do not run on a replica.
+        """
+        # arrange
+        router = ReplicaRouter()
+
+        # act
+        # assert
+        assert router.allow_migrate("replica", "api") is False
+        assert router.allow_migrate("default", "api") is None
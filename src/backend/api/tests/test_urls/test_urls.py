@@ -104,3 +104,19 @@ class TestUrls:
         path = reverse("products_reports")
 
         assert resolve(path).view_name == "products_reports"
+
+    def test_orders_reports_url(self):
+        """
+        Tests the orders_reports url.
+        """
+        path = reverse("orders_reports")
+
+        assert resolve(path).view_name == "orders_reports"
+
+    def test_products_reports_dimensions_url(self):
+        """
+        Tests the products_reports_dimensions url.
+        """
+        path = reverse("products_reports_dimensions")
+
+        assert resolve(path).view_name == "products_reports_dimensions"
@@ -0,0 +1,152 @@
+"""
+File name: test_order_report_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from uuid import uuid4
+
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+
+from api.models.order import Order
+from api.models.product import Product
+from api.models.product_quantity import ProductQuantity
+from auth_api.models import User
+
+
+class TestOrderReportView(APITestCase):
+    """
+    The test order report view class.
+
+    Tests the OrderReportView class.
+    """
+
+    def setup(self):
+        """
+        TestOrderReportView class setup.
+        """
+        self.product_id = uuid4()
+        self.other_product_id = uuid4()
+
+        Product.objects.create(
+            id=self.product_id,
+            name="test_product_name",
+            description="test_product_description",
+            price=100,
+        )
+        Product.objects.create(
+            id=self.other_product_id,
+            name="test_other_product_name",
+            description="test_product_description",
+            price=10,
+        )
+
+        self.create_order("test_external_client", self.product_id, 100, now())
+        self.create_order("test_external_client", self.other_product_id, 10, now())
+        self.create_order("test_other_external_client", self.product_id, 100, now())
+        self.create_order("test_open_external_client", self.product_id, 100, None)
+
+        self.user_id = uuid4()
+
+        self.user = User.objects.create(
+            id=self.user_id,
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=2,
+        )
+
+    def create_order(self, external_client, product_id, unit_price, closed_at):
+        """
+        Creates an order with a product quantity.
+
+        :param string external_client: The order external client.
+        :param uuid4 product_id: The product identifier.
+        :param int unit_price: The product price.
+        :param datetime closed_at: The order closing date.
+        """
+        order = Order.objects.create(
+            id=uuid4(),
+            external_client=external_client,
+            total_price=100,
+            closed_at=closed_at,
+        )
+        ProductQuantity.objects.create(
+            id=uuid4(),
+            product_id=product_id,
+            order_id=order.id,
+            quantity=10,
+            unit_price=unit_price,
+            line_total=10 * unit_price,
+        )
+
+        return order
+
+    def test_order_report_get(self):
+        """
+        Tests the GET method of order report view.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert len(response.data) == 2
+        assert response.data[0].get("external_client") == "test_external_client"
+        assert response.data[0].get("total_orders") == 2
+        assert response.data[0].get("total_quantity") == 20
+        assert response.data[0].get("total_price") == 1100
+
+    def test_order_report_get_by_product(self):
+        """
+        Tests the GET method of order report view grouped by product.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"by_product": "true"})
+
+        # assert
+        assert response.status_code == 200
+        assert len(response.data) == 3
+        assert all(report.get("product_id") for report in response.data)
+
+    def test_order_report_get_bad_request(self):
+        """
+        Tests the GET method of order report view with an invalid flag.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"by_product": "maybe"})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_order_report_get_not_found(self):
+        """
+        Tests the GET method of order report view.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"end_date": "2020-01-01T03:02:01.023"})
+
+        # assert
+        assert response.status_code == 404
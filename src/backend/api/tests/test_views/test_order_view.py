@@ -3,16 +3,32 @@ File name: test_order_view.py
 Author: Fernando Rivera
 Creation date: 2021-12-12
 """
+import gzip
+import os
+import tempfile
+from json import loads
+from unittest import mock
 from uuid import uuid4
 
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from django.utils.timezone import now
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.tokens import AccessToken
+
 from api.models.order import Order
 from api.models.product import Product
 from api.models.product_quantity import ProductQuantity
 from auth_api.models import User
+from utils.renderers.fast_json_renderer import FastJSONRenderer
+from utils.throttles.shared_memory_rate_throttle import SharedMemoryRateThrottle
+from utils.throttles.token_bucket_table import TokenBucketTable
+from utils.throttles.write_rate_throttle import WriteRateThrottle
 
 
 class TestOrderByIdView(APITestCase):
@@ -112,6 +128,8 @@ class TestOrderByIdView(APITestCase):
                 product_id=product_id,
                 order_id=order_id,
                 quantity=10,
+                unit_price=100,
+                line_total=1000,
             ),
         )
 
@@ -131,6 +149,290 @@ class TestOrderByIdView(APITestCase):
         assert response.status_code == 200
         assert response.data.get("id") == str(self.order_id)
 
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    async def test_order_by_id_get_asgi(self):
+        """
+        Tests the GET method order by identifier view through the ASGI handler.
+        """
+        # arrange
+        await sync_to_async(self.setup)()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+        token = AccessToken.for_user(self.user)
+
+        # act
+        response = await self.async_client.get(
+            url, authorization="Bearer %s" % token, accept_encoding="gzip"
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == "gzip"
+        assert loads(gzip.decompress(response.content)).get("id") == str(self.order_id)
+
+    def test_order_by_id_get_without_event_loop(self):
+        """
+        Tests the GET method order by identifier view runs with no event loop
+        through the WSGI handler.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        with mock.patch("asgiref.sync.AsyncToSync.__call__") as async_to_sync:
+            response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("id") == str(self.order_id)
+        assert not async_to_sync.called
+
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    def test_order_by_id_get_gzip(self):
+        """
+        Tests the GET method order by identifier view compresses the response.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="br;q=0, gzip")
+
+        # assert
+        assert response.status_code == 200
+        assert response["Content-Encoding"] == "gzip"
+        assert loads(gzip.decompress(response.content)).get("id") == str(self.order_id)
+
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    def test_order_by_id_get_gzip_cached_when_closed(self):
+        """
+        Tests the GET method order by identifier view reuses compressed bodies.
+        """
+        # arrange
+        self.setup()
+        cache.clear()
+        url = reverse("orders_id", kwargs={"id": self.closed_order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        with mock.patch(
+            "backend.middleware.gzip.compress", wraps=gzip.compress
+        ) as compress, mock.patch(
+            "utils.renderers.fast_json_renderer.FastJSONRenderer.render",
+            autospec=True,
+            side_effect=FastJSONRenderer.render,
+        ) as render:
+            first_response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+            second_response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+        # assert
+        assert compress.call_count == 1
+        assert render.call_count == 1
+        assert first_response.content == second_response.content
+        assert second_response["Content-Type"] == first_response["Content-Type"]
+        assert second_response["Content-Encoding"] == "gzip"
+
+    @override_settings(
+        MIDDLEWARE=settings.STATELESS_MIDDLEWARE, USE_I18N=False, USE_L10N=False
+    )
+    def test_order_by_id_get_stateless(self):
+        """
+        Tests the GET method order by identifier view with the stateless stack.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("id") == str(self.order_id)
+        assert response["X-Frame-Options"] == "DENY"
+        assert response["X-Content-Type-Options"] == "nosniff"
+        assert not response.cookies
+
+    def test_order_by_id_get_not_compressed_when_small(self):
+        """
+        Tests the GET method order by identifier view under the size threshold.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+        # assert
+        assert response.status_code == 200
+        assert not response.has_header("Content-Encoding")
+        assert "Accept-Encoding" in response["Vary"]
+
+    def test_order_by_id_get_json(self):
+        """
+        Tests the GET method order by identifier view renders as the JSONRenderer.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert response.content == JSONRenderer().render(response.data)
+
+    def test_order_by_id_get_fields(self):
+        """
+        Tests the GET method order by identifier view with sparse fields.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {"fields": "id,total_price,closed_at"})
+
+        # assert
+        assert response.status_code == 200
+        assert list(response.data) == ["id", "closed_at", "total_price"]
+
+    def test_order_by_id_get_fields_bad_request(self):
+        """
+        Tests the GET method order by identifier view with an unknown field.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"fields": "id,password"})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_order_by_id_get_expand(self):
+        """
+        Tests the GET method order by identifier view without expanded products.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"expand": "product_quantities"})
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("product_quantities")[0].get("product") == str(
+            self.product_id
+        )
+
+    def test_order_by_id_get_expand_nested(self):
+        """
+        Tests the GET method order by identifier view with expanded products,
+        expanding their product quantities too.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"expand": "product_quantities.product"})
+
+        # assert
+        assert response.status_code == 200
+        product_quantity = response.data.get("product_quantities")[0]
+        assert product_quantity.get("id") == str(self.product_quantity_id)
+        assert product_quantity.get("product").get("id") == str(self.product_id)
+
+    def test_order_by_id_get_expand_nested_snapshot(self):
+        """
+        Tests the GET method order by identifier view with expanded products of a
+        closed order snapshot, expanding their product quantities too.
+        """
+        # arrange
+        self.setup()
+        Order.objects.filter(id=self.order_id).update(
+            closed_at=now(),
+            snapshot={
+                "id": str(self.order_id),
+                "total_price": 100,
+                "product_quantities": [
+                    {
+                        "id": str(self.product_quantity_id),
+                        "quantity": 10,
+                        "product": {"id": str(self.product_id), "price": 100},
+                    }
+                ],
+            },
+        )
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url,
+            {"fields": "id,product_quantities", "expand": "product_quantities.product"},
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert response.data == {
+            "id": str(self.order_id),
+            "product_quantities": [
+                {
+                    "id": str(self.product_quantity_id),
+                    "quantity": 10,
+                    "product": {"id": str(self.product_id), "price": 100},
+                }
+            ],
+        }
+
+    def test_order_by_id_get_expand_snapshot(self):
+        """
+        Tests the GET method order by identifier view trims closed order snapshots.
+        """
+        # arrange
+        self.setup()
+        Order.objects.filter(id=self.order_id).update(
+            closed_at=now(),
+            snapshot={
+                "id": str(self.order_id),
+                "total_price": 100,
+                "product_quantities": [
+                    {"id": str(self.product_quantity_id), "quantity": 10}
+                ],
+            },
+        )
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url, {"fields": "id,product_quantities", "expand": ""}
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert response.data == {
+            "id": str(self.order_id),
+            "product_quantities": [str(self.product_quantity_id)],
+        }
+
     def test_order_by_id_get_not_found(self):
         """
         Tests the GET method order by identifier view.
@@ -344,6 +646,102 @@ class TestOrderView(APITestCase):
             deleted_at=now(),
         )
 
+    def test_order_get_by_ids(self):
+        """
+        Tests the GET method of order view.
+        """
+        # arrange
+        self.setup()
+        order = Order.objects.create(
+            external_client="test_external_client",
+            total_price=1000,
+        )
+        ProductQuantity.objects.create(
+            product_id=self.product_id,
+            order_id=order.id,
+            quantity=10,
+            unit_price=100,
+            line_total=1000,
+        )
+        missing_id = uuid4()
+        url = reverse("orders")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"ids": "%s,%s" % (order.id, missing_id)})
+
+        # assert
+        assert response.status_code == 200
+        assert list(response.data.get("items")) == [str(order.id)]
+        assert (
+            len(response.data.get("items").get(str(order.id)).get("product_quantities"))
+            == 1
+        )
+        assert response.data.get("missing") == [str(missing_id)]
+
+    def test_order_get_by_ids_bad_request(self):
+        """
+        Tests the GET method of order view with an invalid identifier.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"ids": "%s,not_an_id" % uuid4()})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_order_get_by_ids_bad_request_when_ids_missing(self):
+        """
+        Tests the GET method of order view without identifiers.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 400
+
+    def test_order_post_throttled_across_workers(self):
+        """
+        Tests the POST method order view throttled by a bucket shared by workers.
+        """
+        # arrange
+        self.setup()
+        url = reverse("orders")
+        file_descriptor, path = tempfile.mkstemp()
+        os.close(file_descriptor)
+        TokenBucketTable.create(path, 64)
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        with mock.patch.object(
+            WriteRateThrottle, "THROTTLE_RATES", {"write": "1/minute"}
+        ):
+            with mock.patch.object(
+                SharedMemoryRateThrottle, "table", TokenBucketTable(path, 64)
+            ):
+                first_response = self.client.post(url, {}, format="json")
+            with mock.patch.object(
+                SharedMemoryRateThrottle, "table", TokenBucketTable(path, 64)
+            ):
+                second_response = self.client.post(url, {}, format="json")
+                get_response = self.client.get(url)
+        os.remove(path)
+
+        # assert
+        assert first_response.status_code == 400
+        assert second_response.status_code == 429
+        assert 0 < int(second_response["Retry-After"]) <= 60
+        assert get_response.status_code != 429
+
     def test_order_post(self):
         """
         Tests the POST method order view.
@@ -663,6 +1061,8 @@ class TestOrderClosuresView(APITestCase):
                 product_id=product_id,
                 order_id=order_id,
                 quantity=10,
+                unit_price=100,
+                line_total=1000,
             ),
         )
 
@@ -682,6 +1082,29 @@ class TestOrderClosuresView(APITestCase):
         assert response.status_code == 200
         assert response.data.get("closed_at") is not None
 
+    def test_order_closure_patch_snapshot(self):
+        """
+        Tests the PATCH method order closure view snapshots the closed order.
+        """
+        # arrange
+        self.setup()
+        closure_url = reverse("orders_id_closures", kwargs={"id": self.order_id})
+        url = reverse("orders_id", kwargs={"id": self.order_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        closure_response = self.client.patch(closure_url)
+        Product.objects.filter(id=self.product_id).update(name="test_renamed_name")
+        response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert response.data == closure_response.data
+        assert (
+            response.data.get("product_quantities")[0].get("product").get("name")
+            == "test_product_name"
+        )
+
     def test_order_closure_patch_not_found(self):
         """
         Tests the PATCH method order closure view.
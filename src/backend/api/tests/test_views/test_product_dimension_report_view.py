@@ -0,0 +1,181 @@
+"""
+File name: test_product_dimension_report_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import gzip
+from datetime import timedelta
+from json import loads
+from unittest import mock
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+
+from api.models.order import Order
+from api.models.product import Product
+from api.models.product_quantity import ProductQuantity
+from auth_api.models import User
+
+
+class TestProductDimensionReportView(APITestCase):
+    """
+    The test product dimension report view class.
+
+    Tests the ProductDimensionReportView class.
+    """
+
+    def setup(self):
+        """
+        TestProductDimensionReportView class setup.
+        """
+        cache.clear()
+
+        self.product_id = uuid4()
+        self.closed_at = now() - timedelta(hours=1)
+
+        Product.objects.create(
+            id=self.product_id,
+            name="test_product_name",
+            description="test_product_description",
+            price=100,
+        )
+
+        for external_client in ["test_external_client", "test_other_client"]:
+            order = Order.objects.create(
+                id=uuid4(),
+                external_client=external_client,
+                total_price=1000,
+                closed_at=self.closed_at,
+            )
+            ProductQuantity.objects.create(
+                id=uuid4(),
+                product_id=self.product_id,
+                order_id=order.id,
+                quantity=10,
+                unit_price=100,
+                line_total=1000,
+            )
+
+        self.user = User.objects.create(
+            id=uuid4(),
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=2,
+        )
+
+    def test_product_dimension_report_get(self):
+        """
+        Tests the GET method of product dimension report view.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports_dimensions")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"dimensions": "product,client,hour,weekday"})
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("dimensions") == [
+            "product",
+            "client",
+            "hour",
+            "weekday",
+        ]
+        columns = response.data.get("columns")
+        assert columns.get("client") == ["test_external_client", "test_other_client"]
+        assert columns.get("hour") == [self.closed_at.hour] * 2
+        assert columns.get("weekday") == [self.closed_at.isoweekday()] * 2
+        assert columns.get("total_quantity") == [10, 10]
+        assert columns.get("total_price") == [1000, 1000]
+
+    def test_product_dimension_report_get_cached(self):
+        """
+        Tests the GET method of product dimension report view on a settled range.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports_dimensions")
+        end_date = now().strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        first_response = self.client.get(url, {"end_date": end_date})
+        ProductQuantity.objects.update(quantity=1)
+        second_response = self.client.get(url, {"end_date": end_date})
+
+        # assert
+        assert first_response.status_code == 200
+        assert second_response.data == first_response.data
+
+    def test_product_dimension_report_get_cached_changed(self):
+        """
+        Tests the GET method of product dimension report view on a settled range
+        whose lines changed once cached.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports_dimensions")
+        end_date = now().strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        first_response = self.client.get(url, {"end_date": end_date})
+        ProductQuantity.objects.update(quantity=1, updated_at=now())
+        second_response = self.client.get(url, {"end_date": end_date})
+
+        # assert
+        assert first_response.data.get("columns").get("total_quantity") == [20]
+        assert second_response.data.get("columns").get("total_quantity") == [2]
+
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    def test_product_dimension_report_get_cached_compressed(self):
+        """
+        Tests the GET method of product dimension report view reuses the
+        compressed body of a settled range.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports_dimensions")
+        end_date = now().strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        with mock.patch(
+            "backend.middleware.gzip.compress", wraps=gzip.compress
+        ) as compress:
+            first_response = self.client.get(
+                url, {"end_date": end_date}, HTTP_ACCEPT_ENCODING="gzip"
+            )
+            second_response = self.client.get(
+                url, {"end_date": end_date}, HTTP_ACCEPT_ENCODING="gzip"
+            )
+
+        # assert
+        assert compress.call_count == 1
+        assert second_response["Content-Encoding"] == "gzip"
+        assert loads(gzip.decompress(second_response.content)) == loads(
+            gzip.decompress(first_response.content)
+        )
+
+    def test_product_dimension_report_get_bad_request(self):
+        """
+        Tests the GET method of product dimension report view with a bad dimension.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports_dimensions")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"dimensions": "product,year"})
+
+        # assert
+        assert response.status_code == 400
@@ -85,6 +85,8 @@ class TestProductQuantityByIdView(APITestCase):
             product_id=self.product_id,
             order_id=self.closed_order_id,
             quantity=10,
+            unit_price=100,
+            line_total=1000,
         )
 
         self.deleted_product_quantity = ProductQuantity.objects.create(
@@ -92,6 +94,8 @@ class TestProductQuantityByIdView(APITestCase):
             product_id=self.deleted_product_id,
             order_id=self.deleted_order_id,
             quantity=10,
+            unit_price=100,
+            line_total=1000,
             deleted_at=now(),
         )
 
@@ -100,6 +104,8 @@ class TestProductQuantityByIdView(APITestCase):
             product_id=self.product_id,
             order_id=self.order_id,
             quantity=10,
+            unit_price=100,
+            line_total=1000,
         )
 
     def test_product_quantity_by_id_get(self):
@@ -178,6 +184,30 @@ class TestProductQuantityByIdView(APITestCase):
         assert response.status_code == 200
         assert response.data.get("id") == str(self.product_quantity_id)
 
+    def test_product_quantity_by_id_put_keeps_unit_price(self):
+        """
+        Tests the PUT method of product quantity view keeps the captured price.
+        """
+        # arrange
+        self.setup()
+        url = reverse(
+            "orders_product_quantities_id",
+            kwargs={"order_id": self.order_id, "id": self.product_quantity_id},
+        )
+
+        request_payload = {"quantity": 20}
+        Product.objects.filter(id=self.product_id).update(price=500)
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put(url, request_payload, format="json")
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("unit_price") == 100
+        assert response.data.get("line_total") == 2000
+        assert Order.objects.get(id=self.order_id).total_price == 1100
+
     def test_product_quantity_by_id_put_not_found(self):
         """
         Tests the PUT method of product quantity view.
@@ -464,6 +494,8 @@ class TestProductQuantityView(APITestCase):
             product_id=self.product_id,
             order_id=self.closed_order_id,
             quantity=10,
+            unit_price=100,
+            line_total=1000,
         )
 
         self.deleted_product_quantity = ProductQuantity.objects.create(
@@ -471,6 +503,8 @@ class TestProductQuantityView(APITestCase):
             product_id=self.deleted_product_id,
             order_id=self.deleted_order_id,
             quantity=10,
+            unit_price=100,
+            line_total=1000,
             deleted_at=now(),
         )
 
@@ -479,6 +513,8 @@ class TestProductQuantityView(APITestCase):
             product_id=self.product_id,
             order_id=self.order_id,
             quantity=10,
+            unit_price=100,
+            line_total=1000,
         )
 
     def test_product_quantity_post(self):
@@ -504,6 +540,8 @@ class TestProductQuantityView(APITestCase):
         # assert
         assert response.status_code == 201
         assert response.data.get("quantity") == request_payload.get("quantity")
+        assert response.data.get("unit_price") == 100
+        assert response.data.get("line_total") == 1000
 
     def test_product_quantity_post_unprocessable_entity_when_product_not_found(self):
         """
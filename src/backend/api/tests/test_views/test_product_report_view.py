@@ -3,12 +3,17 @@ File name: test_product_report_view.py
 Author: Fernando Rivera
 Creation date: 2021-12-12
 """
+from datetime import timedelta
 from uuid import uuid4
 
+from django.test import override_settings
 from django.urls import reverse
 from django.utils.timezone import now
 from rest_framework.test import APITestCase
 
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.tokens import AccessToken
+
 from api.models.order import Order
 from api.models.product import Product
 from api.models.product_quantity import ProductQuantity
@@ -104,6 +109,8 @@ class TestProductReportView(APITestCase):
                 product_id=product_id,
                 order_id=order_id,
                 quantity=10,
+                unit_price=100,
+                line_total=1000,
             ),
         )
 
@@ -126,6 +133,26 @@ class TestProductReportView(APITestCase):
         # assert
         assert response.status_code == 200
 
+    async def test_product_report_get_series_asgi(self):
+        """
+        Tests the GET method of product report view series through the ASGI
+        handler.
+        """
+        # arrange
+        await sync_to_async(self.setup)()
+        url = reverse("products_reports")
+        token = AccessToken.for_user(self.user)
+
+        # act
+        response = await self.async_client.get(
+            url + "?group_by=day", authorization="Bearer %s" % token
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert len(response.data) == 1
+        assert response.data[0].get("total_quantity") == 30
+
     def test_product_report_get_not_found(self):
         """
         Tests the GET method of product report view.
@@ -140,3 +167,352 @@ class TestProductReportView(APITestCase):
 
         # assert
         assert response.status_code == 404
+
+    def test_product_report_get_series(self):
+        """
+        Tests the GET method of product report view with group_by.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"group_by": "day"})
+
+        # assert
+        assert response.status_code == 200
+        assert len(response.data) == 1
+        assert response.data[0].get("total_quantity") == 30
+        assert response.data[0].get("total_price") == 3000
+
+    def test_product_report_get_series_zero_filled(self):
+        """
+        Tests the GET method of product report view with group_by and start_date.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+        start_date = (now() - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url,
+            {
+                "group_by": "day",
+                "start_date": start_date,
+                "product_id": str(self.product_id),
+                "timezone": "America/Mexico_City",
+            },
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert len(response.data) in (4, 5)
+        assert response.data[0].get("total_quantity") == 0
+        assert response.data[-1].get("total_quantity") == 10
+
+    def test_product_report_get_series_bad_request(self):
+        """
+        Tests the GET method of product report view with an invalid group_by.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"group_by": "year"})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_product_report_get_series_bad_request_too_many_buckets(self):
+        """
+        Tests the GET method of product report view with a range over the
+        maximum buckets.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url,
+            {"group_by": "hour", "start_date": "1990-01-01T00:00:00.000000"},
+        )
+
+        # assert
+        assert response.status_code == 400
+
+    def test_product_report_get_series_bad_request_timezone(self):
+        """
+        Tests the GET method of product report view with an invalid timezone.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"group_by": "day", "timezone": "Mars/Base"})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_product_report_get_limit(self):
+        """
+        Tests the GET method of product report view with limit and cursor.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        first_response = self.client.get(url, {"limit": 2, "order_by": "revenue"})
+        second_response = self.client.get(
+            url,
+            {
+                "limit": 2,
+                "order_by": "revenue",
+                "cursor": first_response["X-Next-Cursor"],
+            },
+        )
+
+        # assert
+        assert first_response.status_code == 200
+        assert len(first_response.data) == 2
+        assert second_response.status_code == 200
+        assert len(second_response.data) == 1
+        assert not second_response.has_header("X-Next-Cursor")
+        assert {report.get("id") for report in first_response.data}.isdisjoint(
+            {report.get("id") for report in second_response.data}
+        )
+
+    def test_product_report_get_limit_bad_request(self):
+        """
+        Tests the GET method of product report view with an invalid limit.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"limit": 0})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_product_report_get_cursor_bad_request(self):
+        """
+        Tests the GET method of product report view with an invalid cursor.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+
+        # assert
+        assert response.status_code == 400
+
+    def test_product_report_get_comparison(self):
+        """
+        Tests the GET method of product report view with compare_start_date.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+        date_format = "%Y-%m-%dT%H:%M:%S.%f"
+
+        Order.objects.filter(id=self.closed_order_id).update(
+            closed_at=now() - timedelta(days=5)
+        )
+        ProductQuantity.objects.filter(id=self.closed_product_quantity_id).update(
+            product_id=self.product_id
+        )
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url,
+            {
+                "start_date": (now() - timedelta(days=1)).strftime(date_format),
+                "compare_start_date": (now() - timedelta(days=7)).strftime(date_format),
+            },
+        )
+        product_comparison = next(
+            comparison
+            for comparison in response.data
+            if comparison.get("id") == str(self.product_id)
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert product_comparison.get("total_quantity") == 10
+        assert product_comparison.get("compare_total_quantity") == 10
+        assert product_comparison.get("quantity_delta") == 0
+        assert product_comparison.get("quantity_delta_percentage") == 0.0
+
+
+@override_settings(REPORT_PARALLELISM=3)
+class TestProductReportViewPartitioned(APITestCase):
+    """
+    The test product report view partitioned class.
+
+    Tests the ProductReportView class aggregating over closure date partitions.
+    """
+
+    def setup(self):
+        """
+        TestProductReportViewPartitioned class setup.
+        """
+        self.product_id = uuid4()
+        self.other_product_id = uuid4()
+
+        for product_id in [self.product_id, self.other_product_id]:
+            Product.objects.create(
+                id=product_id,
+                name="test_product_name",
+                description="test_product_description",
+                price=100,
+            )
+
+        closed_at = now()
+
+        for days in range(4):
+            order = Order.objects.create(
+                external_client="test_external_client",
+                total_price=100,
+                closed_at=closed_at - timedelta(days=days),
+            )
+            ProductQuantity.objects.create(
+                product_id=self.product_id,
+                order_id=order.id,
+                quantity=10,
+                unit_price=100,
+                line_total=1000,
+            )
+
+        order = Order.objects.create(
+            external_client="test_external_client",
+            total_price=100,
+            closed_at=closed_at,
+        )
+        ProductQuantity.objects.create(
+            product_id=self.other_product_id,
+            order_id=order.id,
+            quantity=5,
+            unit_price=100,
+            line_total=500,
+        )
+
+        self.user = User.objects.create(
+            id=uuid4(),
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=2,
+        )
+
+    def test_product_report_get(self):
+        """
+        Tests the GET method of product report view merges the partitions.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert [report.get("id") for report in response.data] == [
+            str(self.product_id),
+            str(self.other_product_id),
+        ]
+        assert response.data[0].get("total_quantity") == 40
+        assert response.data[0].get("total_price") == 4000
+        assert response.data[1].get("total_quantity") == 5
+
+    def test_product_report_get_limit(self):
+        """
+        Tests the GET method of product report view paginates the merged partitions.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        first_response = self.client.get(url, {"limit": 1})
+        second_response = self.client.get(
+            url, {"limit": 1, "cursor": first_response["X-Next-Cursor"]}
+        )
+
+        # assert
+        assert first_response.data[0].get("id") == str(self.product_id)
+        assert second_response.data[0].get("id") == str(self.other_product_id)
+
+    def test_product_report_get_not_found(self):
+        """
+        Tests the GET method of product report view without closed orders.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"end_date": "2020-01-01T03:02:01.023"})
+
+        # assert
+        assert response.status_code == 404
+
+    def test_product_report_get_limit_merged_totals(self):
+        """
+        Tests the GET method of product report view limits the merged totals, not
+        the totals of each partition.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_reports")
+        product = Product.objects.create(
+            id=uuid4(),
+            name="test_product_name",
+            description="test_product_description",
+            price=100,
+        )
+        order = Order.objects.create(
+            external_client="test_external_client",
+            total_price=100,
+            closed_at=now(),
+        )
+        ProductQuantity.objects.create(
+            product_id=product.id,
+            order_id=order.id,
+            quantity=25,
+            unit_price=100,
+            line_total=2500,
+        )
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"limit": 2})
+
+        # assert
+        assert response.status_code == 200
+        assert [report.get("id") for report in response.data] == [
+            str(self.product_id),
+            str(product.id),
+        ]
+        assert response.data[0].get("total_quantity") == 40
@@ -3,14 +3,21 @@ File name: test_product_view.py
 Author: Fernando Rivera
 Creation date: 2021-12-11
 """
+from unittest import mock
 from uuid import uuid4
 
+from django.test import override_settings
 from django.urls import reverse
 from django.utils.timezone import now
 from rest_framework.test import APITestCase
 
+from asgiref.sync import sync_to_async
+from msgpack import packb, unpackb
+from rest_framework_simplejwt.tokens import AccessToken
+
 from api.models.product import Product
 from auth_api.models import User
+from utils.databases.replica_router import ReplicaRouter
 
 
 class TestProductByIdView(APITestCase):
@@ -75,6 +82,43 @@ class TestProductByIdView(APITestCase):
         assert response.status_code == 200
         assert response.data.get("name") == expected_data.get("name")
 
+    async def test_product_by_id_get_asgi(self):
+        """
+        Tests the GET method of product by identifier view through the ASGI
+        handler.
+        """
+        # arrange
+        await sync_to_async(self.setup)()
+        url = reverse("products_id", kwargs={"id": self.product_id})
+        token = AccessToken.for_user(self.user)
+
+        # act
+        response = await self.async_client.get(
+            url + "?fields=name", authorization="Bearer %s" % token
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert response.data == {"name": "test_product_name"}
+
+    async def test_product_by_id_get_asgi_not_found(self):
+        """
+        Tests the GET method of product by identifier view through the ASGI
+        handler.
+
+        Should return HTTP status 404 when the product does not exist.
+        """
+        # arrange
+        await sync_to_async(self.setup)()
+        url = reverse("products_id", kwargs={"id": uuid4()})
+        token = AccessToken.for_user(self.user)
+
+        # act
+        response = await self.async_client.get(url, authorization="Bearer %s" % token)
+
+        # assert
+        assert response.status_code == 404
+
     def test_product_by_id_get_not_found(self):
         """
         Tests the GET method of product by identifier view.
@@ -133,6 +177,73 @@ class TestProductByIdView(APITestCase):
         assert response.status_code == 200
         assert response.data.get("name") == expected_data.get("name")
 
+    @override_settings(DATABASE_REPLICAS=["default"])
+    def test_product_by_id_get_reads_replica(self):
+        """
+        Tests the GET method of product by identifier view reads from a replica.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_id", kwargs={"id": self.product_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        with mock.patch.object(
+            ReplicaRouter, "use_replicas", wraps=ReplicaRouter.use_replicas
+        ) as use_replicas:
+            response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        use_replicas.assert_called_once()
+
+    @override_settings(DATABASE_REPLICAS=["default"])
+    def test_product_by_id_get_reads_primary_when_pinned(self):
+        """
+        Tests the GET method of product by identifier view reads from the primary
+        database after a write of the client.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_id", kwargs={"id": self.product_id})
+        self.client.force_authenticate(user=self.user)
+        self.client.put(
+            url,
+            {"name": "test_update", "description": "test_update", "price": 101},
+        )
+
+        # act
+        with mock.patch.object(
+            ReplicaRouter, "use_replicas", wraps=ReplicaRouter.use_replicas
+        ) as use_replicas:
+            response = self.client.get(url)
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("name") == "test_update"
+        use_replicas.assert_not_called()
+
+    @override_settings(DATABASE_REPLICAS=["default"], DATABASE_REPLICA_STICKINESS=10)
+    def test_product_by_id_put_pins_client_to_primary(self):
+        """
+        Tests the PUT method of product by identifier view pins the client to the
+        primary database.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products_id", kwargs={"id": self.product_id})
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put(
+            url,
+            {"name": "test_update", "description": "test_update", "price": 101},
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert response.cookies["primary_pin"]["max-age"] == 10
+
     def test_product_by_id_put_not_found(self):
         """
         Tests the PUT method of product by identifier view.
@@ -349,6 +460,61 @@ class TestProductView(APITestCase):
             price=100,
         )
 
+    def test_product_get_by_ids(self):
+        """
+        Tests the GET method of product view.
+        """
+        # arrange
+        self.setup()
+        missing_id = uuid4()
+        url = reverse("products")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url, {"ids": "%s,%s,%s" % (self.product_id, missing_id, self.product_id)}
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert list(response.data.get("items")) == [str(self.product_id)]
+        assert response.data.get("missing") == [str(missing_id)]
+
+    def test_product_get_by_ids_fields(self):
+        """
+        Tests the GET method of product view with sparse fields.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url, {"ids": self.product_id, "fields": "name"})
+
+        # assert
+        assert response.status_code == 200
+        assert response.data.get("items") == {
+            str(self.product_id): {"name": "test_product_name"}
+        }
+
+    def test_product_get_by_ids_bad_request_when_too_many_ids(self):
+        """
+        Tests the GET method of product view with too many identifiers.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            url, {"ids": ",".join(str(uuid4()) for _ in range(101))}
+        )
+
+        # assert
+        assert response.status_code == 400
+
     def test_product_post(self):
         """
         Tests the POST method of product view.
@@ -370,6 +536,48 @@ class TestProductView(APITestCase):
         assert response.status_code == 201
         assert response.data.get("name") == request_payload.get("name")
 
+    def test_product_post_message_pack(self):
+        """
+        Tests the POST method of product view with MessagePack bodies.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products")
+        request_payload = {
+            "name": "test_product_name_new",
+            "description": "test_description_new",
+            "price": 10,
+        }
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            url,
+            packb(request_payload),
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        # assert
+        assert response.status_code == 201
+        assert response["Content-Type"] == "application/msgpack"
+        assert unpackb(response.content).get("name") == request_payload.get("name")
+
+    def test_product_post_message_pack_bad_request(self):
+        """
+        Tests the POST method of product view with an invalid MessagePack body.
+        """
+        # arrange
+        self.setup()
+        url = reverse("products")
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(url, b"\xc1", content_type="application/msgpack")
+
+        # assert
+        assert response.status_code == 400
+
     def test_product_post_bad_request_when_wrong_characters_in_name(self):
         """
         Tests the POST method of product view.
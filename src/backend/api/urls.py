@@ -5,7 +5,9 @@ Creation date: 2021-12-07
 """
 from django.urls import path
 
+from api.views.order_report_view import OrderReportView
 from api.views.order_view import OrderByIdView, OrderClosureView, OrderView
+from api.views.product_dimension_report_view import ProductDimensionReportView
 from api.views.product_quantity_view import ProductQuantityByIdView, ProductQuantityView
 from api.views.product_report_view import ProductReportView
 from api.views.product_view import ProductByIdView, ProductView
@@ -49,10 +51,21 @@ urlpatterns = [
         ProductQuantityByIdView.as_view(),
         name="orders_product_quantities_id",
     ),
+    # Order report endpoints.
+    path(
+        "orders/reports",
+        OrderReportView.as_view(),
+        name="orders_reports",
+    ),
     # Prodcut report endpoints.
     path(
         "products/reports",
         ProductReportView.as_view(),
         name="products_reports",
     ),
+    path(
+        "products/reports/dimensions",
+        ProductDimensionReportView.as_view(),
+        name="products_reports_dimensions",
+    ),
 ]
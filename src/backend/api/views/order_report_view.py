@@ -0,0 +1,109 @@
+"""
+File name: order_report_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from datetime import datetime
+
+from django.utils.timezone import make_aware, now
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from api.serializers.responses.client_report_response_serializer import (
+    ClientReportResponseSerializer,
+)
+from api.services.order_service import OrderService
+from utils.configurations.constants import GenericConstants
+from utils.exceptions.serializers.api_exception_serializer import ApiExceptionSerializer
+from utils.validations.api_validations import ApiValidations
+
+
+class OrderReportView(APIView):
+    """
+    The order report view.
+
+    Manage requests for external client sales reports.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of OrderReportView.
+        """
+        self.permission_classes = (permissions.IsAuthenticated,)
+        self.service = OrderService()
+        self.validator = ApiValidations()
+
+    @swagger_auto_schema(
+        operation_description="Gets the sales report by external client.",
+        manual_parameters=[
+            openapi.Parameter(
+                "Authorization",
+                openapi.IN_HEADER,
+                "The user authorization.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "start_date",
+                openapi.IN_QUERY,
+                "The order closure start date.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "end_date",
+                openapi.IN_QUERY,
+                "The order closure end date.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "by_product",
+                openapi.IN_QUERY,
+                "Whether client totals are also grouped by product.",
+                type=openapi.TYPE_BOOLEAN,
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                "Client report found.", ClientReportResponseSerializer()
+            ),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
+            401: openapi.Response(
+                "User not authorized.", ApiExceptionSerializer(many=False)
+            ),
+            404: openapi.Response("Not found.", ApiExceptionSerializer(many=False)),
+            500: openapi.Response(
+                "Internal server error.", ApiExceptionSerializer(many=False)
+            ),
+        },
+    )
+    def get(self, request, format=None):
+        """
+        Gets the external client report.
+
+        :param rest_framework.request request: The HTTP request.
+        """
+        start_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.START_DATE),
+            make_aware(datetime.min),
+        )
+        end_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.END_DATE),
+            now(),
+        )
+        by_product = self.validator.validate_boolean(
+            request.GET.get(GenericConstants.BY_PRODUCT),
+            False,
+        )
+
+        client_report = self.service.get_client_report_by_order_closure_date(
+            start_date,
+            end_date,
+            by_product,
+        )
+
+        return Response(client_report, status=status.HTTP_200_OK)
@@ -11,14 +11,19 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from api.serializers.order_serializer import OrderSerializer, OrderUpdateSerializer
+from api.serializers.responses.order_multi_get_response_serializer import (
+    OrderMultiGetResponseSerializer,
+)
 from api.serializers.responses.order_response_serializer import OrderResponseSerializer
 from api.services.order_service import OrderService
+from utils.configurations.constants import GenericConstants
 from utils.exceptions.api_exceptions import BadRequestException
 from utils.exceptions.serializers.api_exception_serializer import ApiExceptionSerializer
 from utils.validations.api_validations import ApiValidations
+from utils.views.async_api_view import AsyncAPIView
 
 
-class OrderByIdView(APIView):
+class OrderByIdView(AsyncAPIView):
     """
     The order by identifier view.
 
@@ -90,9 +95,23 @@ class OrderByIdView(APIView):
                 type=openapi.TYPE_STRING,
                 format=openapi.FORMAT_UUID,
             ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                "The comma separated fields to keep, defaults to all.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "expand",
+                openapi.IN_QUERY,
+                "The comma separated nested fields to embed, defaults to all. "
+                "Nested fields not expanded are rendered as identifiers.",
+                type=openapi.TYPE_STRING,
+            ),
         ],
         responses={
             200: openapi.Response("Order found.", OrderResponseSerializer()),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
             401: openapi.Response(
                 "User not authorized.", ApiExceptionSerializer(many=False)
             ),
@@ -103,16 +122,36 @@ class OrderByIdView(APIView):
             ),
         },
     )
-    def get(self, request, id, format=None):
+    async def get(self, request, id, format=None):
         """
         Gets the order.
 
         :param rest_framework.request request: The request.
         :param uuid id: The order identifier.
         """
-        order = self.service.get_order_by_id(id)
-
-        return Response(order.data, status=status.HTTP_200_OK)
+        fields = self.validator.validate_option_list(
+            request.GET.get(GenericConstants.FIELDS),
+            OrderResponseSerializer.Meta.fields,
+            None,
+        )
+        expand = self.validator.validate_option_list(
+            request.GET.get(GenericConstants.EXPAND),
+            OrderResponseSerializer.get_expandable_fields(),
+            None,
+        )
+
+        order = await self.service.get_order_by_id_async(id, fields, expand)
+
+        response = Response(order, status=status.HTTP_200_OK)
+        # Closed orders never change, so their compressed bodies can be reused.
+        closed_at = order.get(GenericConstants.CLOSED_AT)
+        if closed_at is not None:
+            response.compression_cache_key = GenericConstants.ORDER_CACHE_KEY % {
+                GenericConstants.ID: id,
+                GenericConstants.CLOSED_AT: closed_at,
+            }
+
+        return response
 
     @swagger_auto_schema(
         operation_description="Upates an order.",
@@ -232,6 +271,74 @@ class OrderView(APIView):
         self.service = OrderService()
         self.validator = ApiValidations()
 
+    @swagger_auto_schema(
+        operation_description="Gets orders by identifiers.",
+        manual_parameters=[
+            openapi.Parameter(
+                "Authorization",
+                openapi.IN_HEADER,
+                "The user authorization.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "ids",
+                openapi.IN_QUERY,
+                "The comma separated order identifiers, at most 100.",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                "The comma separated fields to keep, defaults to all.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "expand",
+                openapi.IN_QUERY,
+                "The comma separated nested fields to embed, defaults to all. "
+                "Nested fields not expanded are rendered as identifiers.",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={
+            200: openapi.Response("Orders found.", OrderMultiGetResponseSerializer()),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
+            401: openapi.Response(
+                "User not authorized.", ApiExceptionSerializer(many=False)
+            ),
+            500: openapi.Response(
+                "Internal server error.", ApiExceptionSerializer(many=False)
+            ),
+        },
+    )
+    def get(self, request, format=None):
+        """
+        Gets the orders by identifiers, keyed by identifier.
+
+        :param rest_framework.request request: The request.
+        """
+        ids = self.validator.validate_uuid_list(
+            request.GET.get(GenericConstants.IDS),
+            GenericConstants.IDS,
+            GenericConstants.MULTI_GET_MAX_IDS,
+        )
+
+        fields = self.validator.validate_option_list(
+            request.GET.get(GenericConstants.FIELDS),
+            OrderResponseSerializer.Meta.fields,
+            None,
+        )
+        expand = self.validator.validate_option_list(
+            request.GET.get(GenericConstants.EXPAND),
+            OrderResponseSerializer.get_expandable_fields(),
+            None,
+        )
+
+        orders = self.service.get_orders_by_ids(ids, fields, expand)
+
+        return Response(orders, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         operation_description="Creates an order.",
         manual_parameters=[
@@ -0,0 +1,135 @@
+"""
+File name: product_dimension_report_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from datetime import datetime
+
+from django.utils.timezone import get_current_timezone, make_aware, now
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from api.serializers.responses.dimension_report_response_serializer import (
+    DimensionReportResponseSerializer,
+)
+from api.services.product_quantity_service import ProductQuantityService
+from utils.configurations.constants import GenericConstants
+from utils.exceptions.serializers.api_exception_serializer import ApiExceptionSerializer
+from utils.validations.api_validations import ApiValidations
+
+
+class ProductDimensionReportView(APIView):
+    """
+    The product dimension report view.
+
+    Manage requests for multi-dimensional product reports.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of ProductDimensionReportView.
+        """
+        self.permission_classes = (permissions.IsAuthenticated,)
+        self.service = ProductQuantityService()
+        self.validator = ApiValidations()
+
+    @swagger_auto_schema(
+        operation_description="Gets the sales totals grouped by dimensions.",
+        manual_parameters=[
+            openapi.Parameter(
+                "Authorization",
+                openapi.IN_HEADER,
+                "The user authorization.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "dimensions",
+                openapi.IN_QUERY,
+                "The comma separated product, client, hour or weekday dimensions.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "start_date",
+                openapi.IN_QUERY,
+                "The order closure start date.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "end_date",
+                openapi.IN_QUERY,
+                "The order closure end date.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "timezone",
+                openapi.IN_QUERY,
+                "The hour and weekday timezone name, defaults to UTC.",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                "Dimension report found.", DimensionReportResponseSerializer()
+            ),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
+            401: openapi.Response(
+                "User not authorized.", ApiExceptionSerializer(many=False)
+            ),
+            404: openapi.Response("Not found.", ApiExceptionSerializer(many=False)),
+            500: openapi.Response(
+                "Internal server error.", ApiExceptionSerializer(many=False)
+            ),
+        },
+    )
+    def get(self, request, format=None):
+        """
+        Gets the dimension report.
+
+        :param rest_framework.request request: The HTTP request.
+        """
+        dimensions = []
+        for dimension in request.GET.get(
+            GenericConstants.DIMENSIONS, GenericConstants.PRODUCT
+        ).split(GenericConstants.COMMA):
+            dimension = self.validator.validate_option(
+                dimension.strip(),
+                GenericConstants.DIMENSION_OPTIONS,
+                None,
+            )
+            if dimension not in dimensions:
+                dimensions.append(dimension)
+
+        start_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.START_DATE),
+            make_aware(datetime.min),
+        )
+        end_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.END_DATE),
+            now(),
+        )
+        tzinfo = self.validator.validate_timezone(
+            request.GET.get(GenericConstants.TIMEZONE),
+            get_current_timezone(),
+        )
+
+        (
+            dimension_report,
+            cache_key,
+        ) = self.service.get_dimension_report_by_order_closure_date(
+            start_date,
+            end_date,
+            dimensions,
+            tzinfo,
+        )
+
+        response = Response(dimension_report, status=status.HTTP_200_OK)
+        # Reports over a settled range are cached, as are their compressed bodies.
+        response.compression_cache_key = cache_key
+
+        return response
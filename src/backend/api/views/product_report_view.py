@@ -5,10 +5,9 @@ Creation date: 2021-12-10
 """
 from datetime import datetime
 
-from django.utils.timezone import make_aware, now
+from django.utils.timezone import get_current_timezone, make_aware, now
 from rest_framework import permissions, status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -20,9 +19,10 @@ from api.services.product_quantity_service import ProductQuantityService
 from utils.configurations.constants import GenericConstants
 from utils.exceptions.serializers.api_exception_serializer import ApiExceptionSerializer
 from utils.validations.api_validations import ApiValidations
+from utils.views.async_api_view import AsyncAPIView
 
 
-class ProductReportView(APIView):
+class ProductReportView(AsyncAPIView):
     """
     The product report view.
 
@@ -60,11 +60,65 @@ class ProductReportView(APIView):
                 type=openapi.TYPE_STRING,
                 format=openapi.FORMAT_DATETIME,
             ),
+            openapi.Parameter(
+                "compare_start_date",
+                openapi.IN_QUERY,
+                "The compared order closure start date, returns a comparison instead.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "compare_end_date",
+                openapi.IN_QUERY,
+                "The compared order closure end date, defaults to start_date.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "order_by",
+                openapi.IN_QUERY,
+                "The report order, descending by total quantity or revenue.",
+                type=openapi.TYPE_STRING,
+                enum=list(GenericConstants.REPORT_ORDER_BY_OPTIONS),
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                "The maximum number of products in the report page.",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                "The report page cursor, from the X-Next-Cursor header.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "group_by",
+                openapi.IN_QUERY,
+                "The bucket size, returns a zero filled series of totals instead.",
+                type=openapi.TYPE_STRING,
+                enum=list(GenericConstants.SERIES_GROUP_BY_OPTIONS),
+            ),
+            openapi.Parameter(
+                "timezone",
+                openapi.IN_QUERY,
+                "The series timezone name, defaults to UTC.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "product_id",
+                openapi.IN_QUERY,
+                "The series product identifier.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_UUID,
+            ),
         ],
         responses={
             200: openapi.Response(
                 "Product report found.", ProductReportResponseSerializer()
             ),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
             401: openapi.Response(
                 "User not authorized.", ApiExceptionSerializer(many=False)
             ),
@@ -74,13 +128,18 @@ class ProductReportView(APIView):
             ),
         },
     )
-    def get(self, request, format=None):
+    async def get(self, request, format=None):
         """
         Gets the product report.
 
         :param rest_framework.request request: The HTTP request.
         :param uuid4 id: The product identifier.
         """
+        if request.GET.get(GenericConstants.GROUP_BY) is not None:
+            return await self.__get_series(request)
+        if request.GET.get(GenericConstants.COMPARE_START_DATE) is not None:
+            return await self.__get_comparison(request)
+
         start_date = self.validator.validate_date(
             request.GET.get(GenericConstants.START_DATE),
             make_aware(datetime.min),
@@ -90,9 +149,103 @@ class ProductReportView(APIView):
             now(),
         )
 
-        product_report = self.service.get_product_quantity_by_order_closure_date(
+        order_by = self.validator.validate_option(
+            request.GET.get(GenericConstants.ORDER_BY),
+            GenericConstants.REPORT_ORDER_BY_OPTIONS,
+            GenericConstants.QUANTITY,
+        )
+        limit = self.validator.validate_positive_integer(
+            request.GET.get(GenericConstants.LIMIT),
+            None,
+        )
+
+        (
+            product_report,
+            next_cursor,
+        ) = await self.service.get_product_quantity_by_order_closure_date_async(
             start_date,
             end_date,
+            order_by,
+            limit,
+            request.GET.get(GenericConstants.CURSOR),
+        )
+
+        response = Response(product_report, status=status.HTTP_200_OK)
+        if next_cursor is not None:
+            response[GenericConstants.NEXT_CURSOR_HEADER] = next_cursor
+
+        return response
+
+    async def __get_comparison(self, request):
+        """
+        Gets the product period over period comparison.
+
+        :param rest_framework.request request: The HTTP request.
+        """
+        start_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.START_DATE),
+            make_aware(datetime.min),
+        )
+        end_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.END_DATE),
+            now(),
+        )
+        compare_start_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.COMPARE_START_DATE),
+            None,
+        )
+        compare_end_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.COMPARE_END_DATE),
+            start_date,
+        )
+
+        product_comparison = (
+            await self.service.get_product_comparison_by_order_closure_date_async(
+                start_date,
+                end_date,
+                compare_start_date,
+                compare_end_date,
+            )
+        )
+
+        return Response(product_comparison, status=status.HTTP_200_OK)
+
+    async def __get_series(self, request):
+        """
+        Gets the product series.
+
+        :param rest_framework.request request: The HTTP request.
+        """
+        group_by = self.validator.validate_option(
+            request.GET.get(GenericConstants.GROUP_BY),
+            GenericConstants.SERIES_GROUP_BY_OPTIONS,
+            None,
+        )
+        tzinfo = self.validator.validate_timezone(
+            request.GET.get(GenericConstants.TIMEZONE),
+            get_current_timezone(),
+        )
+        start_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.START_DATE),
+            None,
+        )
+        end_date = self.validator.validate_date(
+            request.GET.get(GenericConstants.END_DATE),
+            now(),
+        )
+        product_id = self.validator.validate_uuid(
+            request.GET.get(GenericConstants.PRODUCT_ID),
+            None,
+        )
+
+        product_series = (
+            await self.service.get_product_quantity_series_by_order_closure_date_async(
+                start_date,
+                end_date,
+                group_by,
+                tzinfo,
+                product_id,
+            )
         )
 
-        return Response(product_report, status=status.HTTP_200_OK)
+        return Response(product_series, status=status.HTTP_200_OK)
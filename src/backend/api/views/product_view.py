@@ -11,16 +11,21 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from api.serializers.product_serializer import ProductSerializer
+from api.serializers.responses.product_multi_get_response_serializer import (
+    ProductMultiGetResponseSerializer,
+)
 from api.serializers.responses.product_response_serializer import (
     ProductResponseSerializer,
 )
 from api.services.product_service import ProductService
+from utils.configurations.constants import GenericConstants
 from utils.exceptions.api_exceptions import BadRequestException
 from utils.exceptions.serializers.api_exception_serializer import ApiExceptionSerializer
 from utils.validations.api_validations import ApiValidations
+from utils.views.async_api_view import AsyncAPIView
 
 
-class ProductByIdView(APIView):
+class ProductByIdView(AsyncAPIView):
     """
     The product by identifier view.
 
@@ -91,9 +96,16 @@ class ProductByIdView(APIView):
                 type=openapi.TYPE_STRING,
                 format=openapi.FORMAT_UUID,
             ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                "The comma separated fields to keep, defaults to all.",
+                type=openapi.TYPE_STRING,
+            ),
         ],
         responses={
             200: openapi.Response("Product found.", ProductResponseSerializer()),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
             401: openapi.Response(
                 "User not authorized.", ApiExceptionSerializer(many=False)
             ),
@@ -103,16 +115,22 @@ class ProductByIdView(APIView):
             ),
         },
     )
-    def get(self, request, id, format=None):
+    async def get(self, request, id, format=None):
         """
         Gets the product by identifier.
 
         :param rest_framework.request request: The HTTP request.
         :param uuid4 id: The product identifier.
         """
-        product = self.service.get_product_by_id(id)
+        fields = self.validator.validate_option_list(
+            request.GET.get(GenericConstants.FIELDS),
+            ProductResponseSerializer.Meta.fields,
+            None,
+        )
 
-        return Response(product.data, status=status.HTTP_200_OK)
+        product = await self.service.get_product_by_id_async(id, fields)
+
+        return Response(product, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         operation_description="Updates a product by identifier.",
@@ -180,6 +198,64 @@ class ProductView(APIView):
         self.service = ProductService()
         self.validator = ApiValidations()
 
+    @swagger_auto_schema(
+        operation_description="Gets products by identifiers.",
+        manual_parameters=[
+            openapi.Parameter(
+                "Authorization",
+                openapi.IN_HEADER,
+                "The user authorization.",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "ids",
+                openapi.IN_QUERY,
+                "The comma separated product identifiers, at most 100.",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "fields",
+                openapi.IN_QUERY,
+                "The comma separated fields to keep, defaults to all.",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                "Products found.", ProductMultiGetResponseSerializer()
+            ),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
+            401: openapi.Response(
+                "User not authorized.", ApiExceptionSerializer(many=False)
+            ),
+            500: openapi.Response(
+                "Internal server error.", ApiExceptionSerializer(many=False)
+            ),
+        },
+    )
+    def get(self, request, format=None):
+        """
+        Gets the products by identifiers, keyed by identifier.
+
+        :param rest_framework.request request: The request.
+        """
+        ids = self.validator.validate_uuid_list(
+            request.GET.get(GenericConstants.IDS),
+            GenericConstants.IDS,
+            GenericConstants.MULTI_GET_MAX_IDS,
+        )
+
+        fields = self.validator.validate_option_list(
+            request.GET.get(GenericConstants.FIELDS),
+            ProductResponseSerializer.Meta.fields,
+            None,
+        )
+
+        products = self.service.get_products_by_ids(ids, fields)
+
+        return Response(products, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         operation_description="Creates a product.",
         manual_parameters=[
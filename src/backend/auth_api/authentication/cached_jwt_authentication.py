@@ -0,0 +1,74 @@
+"""
+File name: cached_jwt_authentication.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from django.conf import settings
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from auth_api.repositories.user_repository import UserRepository
+from auth_api.services.token_revocation_service import TokenRevocationService
+from utils.configurations.constants import ExceptionConstants, GenericConstants
+from utils.exceptions.api_exceptions import UnauthorizedException
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    The cached JWT authentication.
+
+    Resolves the token user from the user cache, so most requests make no
+    user query. With AUTH_TRUST_TOKEN_CLAIMS, the token role claim is trusted
+    when the user is not cached. Revoked tokens are rejected.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates a new instance of CachedJWTAuthentication.
+        """
+        super().__init__(*args, **kwargs)
+        self.token_revocation_service = TokenRevocationService()
+        self.user_repository = UserRepository()
+
+    def get_user(self, validated_token):
+        """
+        Gets the user of a validated token.
+
+        :param rest_framework_simplejwt.tokens.Token validated_token: The token.
+        """
+        id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if id is None:
+            raise InvalidToken(ExceptionConstants.TOKEN_WITHOUT_USER_ID)
+
+        role = None
+        if settings.AUTH_TRUST_TOKEN_CLAIMS:
+            role = validated_token.get(GenericConstants.ROLE)
+
+        user = self.user_repository.get_authenticated_user(id, role)
+        if user is None:
+            raise UnauthorizedException(
+                ExceptionConstants.USER_BY_ID_NOT_FOUND % {GenericConstants.ID: id}
+            )
+
+        if not user.is_active:
+            raise UnauthorizedException(
+                ExceptionConstants.USER_BY_ID_INACTIVE % {GenericConstants.ID: id}
+            )
+
+        return user
+
+    def get_validated_token(self, raw_token):
+        """
+        Gets a validated token, unless revoked.
+
+        :param bytes raw_token: The raw token.
+        """
+        validated_token = super().get_validated_token(raw_token)
+
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti is not None and self.token_revocation_service.is_revoked(jti):
+            raise InvalidToken(ExceptionConstants.TOKEN_REVOKED)
+
+        return validated_token
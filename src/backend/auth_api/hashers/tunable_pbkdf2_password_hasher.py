@@ -0,0 +1,23 @@
+"""
+File name: tunable_pbkdf2_password_hasher.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    The tunable PBKDF2 password hasher.
+
+    Hashes with PASSWORD_HASHING_ITERATIONS iterations. Hashes made with a
+    different cost are upgraded on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        """
+        Gets the hashing iterations.
+        """
+        return settings.PASSWORD_HASHING_ITERATIONS
@@ -0,0 +1,72 @@
+"""
+File name: benchmark_hashing.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from auth_api.services.password_hashing_service import PasswordHashingService
+
+
+class Command(BaseCommand):
+    """
+    The benchmark hashing command.
+
+    Times a password hash for each PBKDF2 cost, then the hashing throughput of
+    concurrent logins through hashing thread pools of each size, so the cost
+    can be tuned to the login latency and CPUs available.
+    """
+
+    help = "Benchmarks the password hashing cost and pool throughput."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument(
+            "--iterations", type=int, nargs="+", default=[65000, 130000, 260000]
+        )
+        parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+        parser.add_argument("--hashes", type=int, default=16)
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        for iterations in options["iterations"]:
+            with override_settings(PASSWORD_HASHING_ITERATIONS=iterations):
+                service = PasswordHashingService()
+                start = perf_counter()
+                service.make_password("benchmark")
+                self.stdout.write(
+                    "%-24s %10.1f ms/hash"
+                    % ("iterations %s" % iterations, (perf_counter() - start) * 1000)
+                )
+
+        for workers in options["workers"]:
+            with override_settings(
+                PASSWORD_HASHING_ITERATIONS=options["iterations"][0],
+                PASSWORD_HASHING_WORKERS=workers,
+                PASSWORD_HASHING_QUEUE_DEPTH=options["hashes"],
+            ):
+                service = PasswordHashingService()
+                start = perf_counter()
+                with ThreadPoolExecutor(max_workers=options["hashes"]) as executor:
+                    list(
+                        executor.map(
+                            service.make_password, ["benchmark"] * options["hashes"]
+                        )
+                    )
+                self.stdout.write(
+                    "%-24s %10.1f hashes/s"
+                    % (
+                        "workers %s" % workers,
+                        options["hashes"] / (perf_counter() - start),
+                    )
+                )
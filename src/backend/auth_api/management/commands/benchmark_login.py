@@ -0,0 +1,188 @@
+"""
+File name: benchmark_login.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import update_last_login
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from auth_api.models import User
+from auth_api.repositories.user_repository import UserRepository
+from auth_api.serializers.user_login import UserLoginSerializer
+from auth_api.services.user_service import UserService
+
+
+class Command(BaseCommand):
+    """
+    The benchmark login command.
+
+    Seeds users, times login storms through the former and the current login
+    pipelines on concurrent threads and removes the seeded users. Password
+    hashing dominates a login, so --fast-hasher swaps in a cheap hasher to
+    expose the pipeline overhead.
+    """
+
+    help = "Benchmarks the login throughput and latency over seeded users."
+
+    def add_arguments(self, parser):
+        """
+        Adds the command arguments.
+
+        :param argparse.ArgumentParser parser: The argument parser.
+        """
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--logins", type=int, default=200)
+        parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+        parser.add_argument("--fast-hasher", action="store_true")
+
+    def handle(self, *args, **options):
+        """
+        Handles the command.
+        """
+        password_hashers = settings.PASSWORD_HASHERS
+        if options["fast_hasher"]:
+            password_hashers = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+        with override_settings(PASSWORD_HASHERS=password_hashers):
+            emails = self.__seed(options["users"])
+
+            try:
+                self.service = UserService()
+                pipelines = [
+                    ("legacy login", self.__legacy_login),
+                    ("login", self.__login),
+                ]
+
+                self.stdout.write(
+                    "users: %s, logins: %s, hasher: %s"
+                    % (len(emails), options["logins"], password_hashers[0])
+                )
+                for threads in options["threads"]:
+                    for name, login in pipelines:
+                        throughput, p99 = self.__time(
+                            login, emails, options["logins"], threads
+                        )
+                        self.stdout.write(
+                            "%-24s %10.1f logins/s %10.2f ms p99"
+                            % (name + " x%s" % threads, throughput, p99)
+                        )
+            finally:
+                UserRepository.flush_last_logins()
+                self.__clear(emails)
+
+    def __clear(self, emails):
+        """
+        Removes the seeded users.
+
+        :param string[] emails: The seeded user emails.
+        """
+        User.objects.filter(email__in=emails).delete()
+
+    def __legacy_login(self, email):
+        """
+        Logs a user in, as the login used to.
+
+        :param string email: The user email.
+        """
+        User.objects.filter(email=email, deleted_at=None).count()
+        User.objects.filter(email=email, deleted_at=None).first()
+        user = authenticate(email=email, password="benchmark")
+
+        access_token_data = AccessToken.for_user(user)
+        refresh_token = str(RefreshToken.for_user(user))
+        access_token = str(AccessToken.for_user(user))
+        int(access_token_data.lifetime.total_seconds())
+        update_last_login(None, user)
+
+        return access_token, refresh_token
+
+    def __login(self, email):
+        """
+        Logs a user in through the user service.
+
+        :param string email: The user email.
+        """
+        serializer = UserLoginSerializer(data={"email": email, "password": "benchmark"})
+        serializer.is_valid()
+
+        return self.service.validate_user(serializer)
+
+    def __login_all(self, login, emails):
+        """
+        Logs users in on a worker thread, then closes its database connection.
+
+        :param function login: The login pipeline.
+        :param string[] emails: The emails of the users to log in.
+        """
+        timings = []
+
+        try:
+            for email in emails:
+                start = perf_counter()
+                login(email)
+                timings.append(perf_counter() - start)
+        finally:
+            connection.close()
+
+        return timings
+
+    def __seed(self, users):
+        """
+        Seeds users sharing a single password hash.
+
+        :param int users: The users to seed.
+        """
+        password = make_password("benchmark")
+        User.objects.bulk_create(
+            [
+                User(
+                    email="benchmark%s@benchmark.com" % user,
+                    password=password,
+                    first_name="benchmark",
+                    last_name="user %s" % user,
+                    role=2,
+                )
+                for user in range(users)
+            ]
+        )
+
+        return ["benchmark%s@benchmark.com" % user for user in range(users)]
+
+    def __time(self, login, emails, logins, threads):
+        """
+        Gets the throughput, in logins per second, and the p99 latency, in
+        milliseconds, of a login storm.
+
+        :param function login: The login pipeline.
+        :param string[] emails: The seeded user emails.
+        :param int logins: The logins in the storm.
+        :param int threads: The concurrent threads logging users in.
+        """
+        storm = [emails[login % len(emails)] for login in range(logins)]
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            timings = [
+                timing
+                for thread_timings in executor.map(
+                    lambda thread: self.__login_all(login, storm[thread::threads]),
+                    range(threads),
+                )
+                for timing in thread_timings
+            ]
+        elapsed = perf_counter() - start
+
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+
+        return logins / elapsed, p99 * 1000
@@ -5,6 +5,7 @@ Creation date: 2021-12-08
 """
 from django.contrib.auth.base_user import BaseUserManager
 
+from auth_api.services.password_hashing_service import PasswordHashingService
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import UnprocessableEntityException
 from utils.validations.api_validations import ApiValidations
@@ -27,7 +28,7 @@ class CustomUserManager(BaseUserManager):
         email = self.normalize_email(email)
 
         user = self.model(email=email, **extra_fields)
-        user.set_password(password)
+        user.password = PasswordHashingService().make_password(password)
         user.save()
         return user
 
@@ -49,8 +50,13 @@ class CustomUserManager(BaseUserManager):
         Gets user by natural key.
 
         This method adds the 'deleted:at: None' filter for soft deleted
-        records in database.
+        records in database, and matches the email in lowercase, as its
+        unique index does.
         """
         return self.get(
-            **{self.model.USERNAME_FIELD: email, GenericConstants.DELETED_AT: None}
+            **{
+                self.model.USERNAME_FIELD
+                + GenericConstants.LOWER_LOOKUP: email.lower(),
+                GenericConstants.DELETED_AT: None,
+            }
         )
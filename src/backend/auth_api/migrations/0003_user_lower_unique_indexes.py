@@ -0,0 +1,28 @@
+# Generated by Django 3.2.9 on 2021-12-13 12:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth_api", "0002_revokedtoken"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                'CREATE UNIQUE INDEX "user_lower_email_uniq" ON "user" '
+                '(LOWER("email")) WHERE "deleted_at" IS NULL;'
+            ),
+            reverse_sql='DROP INDEX "user_lower_email_uniq";',
+        ),
+        migrations.RunSQL(
+            sql=(
+                'CREATE UNIQUE INDEX "user_lower_name_uniq" ON "user" '
+                '(LOWER("first_name"), LOWER("last_name")) '
+                'WHERE "deleted_at" IS NULL;'
+            ),
+            reverse_sql='DROP INDEX "user_lower_name_uniq";',
+        ),
+    ]
@@ -8,11 +8,15 @@ from uuid import uuid4
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 from auth_api.managers import CustomUserManager
 from utils.configurations.constants import GenericConstants
 
+# Lowercase lookups, as in "email__lower", match the lowercase unique indexes.
+models.CharField.register_lookup(Lower)
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """
@@ -84,6 +88,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     The user deletion date.
     """
 
+    # The lowercase email and the lowercase first and last names are unique
+    # among the users not deleted, through partial unique indexes.
+
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
@@ -97,3 +104,38 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = GenericConstants.USER
+
+
+class RevokedToken(models.Model):
+    """
+    The revoked token object.
+    """
+
+    id = models.UUIDField(default=uuid4, primary_key=True)
+    """
+    The revoked token identifier.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    """
+    The token identifier claim.
+    """
+
+    expires_at = models.DateTimeField(db_index=True)
+    """
+    The token expiration date, the revocation is kept until then.
+    """
+
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    """
+    The revocation date.
+    """
+
+    def __str__(self):
+        """
+        Returns a string representation
+        """
+        return self.jti
+
+    class Meta:
+        db_table = GenericConstants.REVOKED_TOKEN
@@ -0,0 +1,70 @@
+"""
+File name: revoked_token_repository.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from django.utils import timezone
+
+from auth_api.models import RevokedToken
+from utils.configurations.constants import GenericConstants
+from utils.validations.api_validations import ApiValidations
+
+
+class RevokedTokenRepository:
+    """
+    The revoked token repository.
+
+    Handles transactions between services and repositories.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of RevokedTokenRepository.
+        """
+        self.validator = ApiValidations()
+
+    def create_revoked_token(self, jti, expires_at):
+        """
+        Creates a revoked token, unless already revoked.
+
+        :param string jti: The token identifier claim.
+        :param datetime expires_at: The token expiration date.
+        """
+        self.validator.is_null_or_empty_string(jti)
+        self.validator.is_null(expires_at)
+
+        revoked_token, _ = RevokedToken.objects.get_or_create(
+            jti=jti, defaults={GenericConstants.EXPIRES_AT: expires_at}
+        )
+
+        return revoked_token
+
+    def delete_expired_revoked_tokens(self):
+        """
+        Deletes the revoked tokens already expired.
+        """
+        return RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+
+    def get_revoked_token_jtis(self, created_at=None):
+        """
+        Gets the identifier claims of the revoked tokens not expired.
+
+        :param datetime created_at: The optional revocation date to start from.
+        """
+        revoked_tokens = RevokedToken.objects.filter(expires_at__gt=timezone.now())
+        if created_at is not None:
+            revoked_tokens = revoked_tokens.filter(created_at__gte=created_at)
+
+        return list(revoked_tokens.values_list(GenericConstants.JTI, flat=True))
+
+    def is_token_revoked(self, jti):
+        """
+        Validates whether a token is revoked.
+
+        :param string jti: The token identifier claim.
+        """
+        self.validator.is_null_or_empty_string(jti)
+
+        return RevokedToken.objects.filter(
+            jti=jti, expires_at__gt=timezone.now()
+        ).exists()
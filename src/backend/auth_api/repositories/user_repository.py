@@ -3,12 +3,19 @@ File name: user_repository.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
-from django.contrib.auth.models import update_last_login
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 
-from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from auth_api.models import User
+from auth_api.services.password_hashing_service import PasswordHashingService
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import (
     NotFoundException,
@@ -24,12 +31,27 @@ class UserRepository:
     Handles transactions between services and repositories.
     """
 
+    __last_logins = {}
+    """
+    The deferred last login dates, by user identifier.
+    """
+
+    __last_logins_flushed_at = monotonic()
+    """
+    The last time the deferred last login dates were written.
+    """
+
+    __last_logins_lock = Lock()
+    """
+    The deferred last login dates lock.
+    """
+
     def __init__(self):
         """
         Creates a new instance of UserRepository.
         """
+        self.password_hashing_service = PasswordHashingService()
         self.validator = ApiValidations()
-        pass
 
     def create_user(self, user):
         """
@@ -39,12 +61,126 @@ class UserRepository:
         """
         self.validator.is_null(user)
 
-        self.__validate_entity_not_exists(user.validated_data)
-        user.save()
+        try:
+            with transaction.atomic():
+                return user.save()
+        except IntegrityError as error:
+            raise UnprocessableEntityException(
+                self.__get_entity_error(error, user.validated_data)
+            )
 
-        return self.__get_user_by_credentials_email(
-            user.validated_data.get(GenericConstants.EMAIL)
-        )
+    def create_users(self, users_data):
+        """
+        Creates users in a single insert.
+
+        :param dict[] users_data: The users data, with their passwords hashed.
+        """
+        self.validator.is_null(users_data)
+
+        users = [
+            User(
+                **{
+                    **user_data,
+                    GenericConstants.EMAIL: User.objects.normalize_email(
+                        user_data.get(GenericConstants.EMAIL)
+                    ),
+                }
+            )
+            for user_data in users_data
+        ]
+
+        try:
+            with transaction.atomic():
+                return User.objects.bulk_create(users)
+        except IntegrityError as error:
+            raise UnprocessableEntityException(self.__get_entity_error(error, None))
+
+    @classmethod
+    def flush_due_last_logins(cls):
+        """
+        Writes the deferred last login dates once LAST_LOGIN_FLUSH_INTERVAL
+        seconds passed since the last write.
+        """
+        if not cls.has_due_last_logins():
+            return
+
+        cls.flush_last_logins()
+
+    @classmethod
+    def flush_last_logins(cls):
+        """
+        Writes the deferred last login dates in a single batch.
+        """
+        with cls.__last_logins_lock:
+            last_logins = cls.__last_logins
+            cls.__last_logins = {}
+            cls.__last_logins_flushed_at = monotonic()
+
+        if len(last_logins) > 0:
+            User.objects.bulk_update(
+                [
+                    User(id=id, last_login=last_login)
+                    for id, last_login in last_logins.items()
+                ],
+                [GenericConstants.LAST_LOGIN],
+            )
+
+    @classmethod
+    def has_due_last_logins(cls):
+        """
+        Validates whether deferred last login dates are pending and
+        LAST_LOGIN_FLUSH_INTERVAL seconds passed since the last write.
+        """
+        return len(cls.__last_logins) > 0 and cls.__is_flush_due()
+
+    def get_authenticated_user(self, id, role=None):
+        """
+        Gets the user of an authenticated request.
+
+        The user identifier, email, role and active flag are cached for
+        AUTH_USER_CACHE_TIMEOUT seconds, in the cache every worker shares, so
+        an invalidation reaches them all. Without a cached user, a role trusted
+        from the token builds the user with no query.
+
+        :param uuid id: The user identifier.
+        :param int role: The optional trusted role.
+        """
+        self.validator.is_null(id)
+
+        cache_key = GenericConstants.AUTH_USER_CACHE_KEY % {GenericConstants.ID: id}
+        cache = caches[GenericConstants.SHARED_CACHE]
+        user_data = cache.get(cache_key)
+
+        if user_data is None and role is not None:
+            user_data = {
+                GenericConstants.ID: User._meta.pk.to_python(id),
+                GenericConstants.ROLE: role,
+                GenericConstants.IS_ACTIVE: True,
+            }
+
+        if user_data is None:
+            user = (
+                User.objects.filter(id=id)
+                .only(
+                    GenericConstants.ID,
+                    GenericConstants.EMAIL,
+                    GenericConstants.ROLE,
+                    GenericConstants.IS_ACTIVE,
+                )
+                .first()
+            )
+            if user is None:
+                return None
+
+            user_data = {
+                GenericConstants.ID: user.id,
+                GenericConstants.EMAIL: user.email,
+                GenericConstants.ROLE: user.role,
+                GenericConstants.IS_ACTIVE: user.is_active,
+            }
+            cache.set(cache_key, user_data, settings.AUTH_USER_CACHE_TIMEOUT)
+
+        return User(**user_data)
 
     def get_user(self, id):
         """
@@ -81,6 +217,8 @@ class UserRepository:
         user.deleted_at = timezone.now()
         user.save()
 
+        self.__invalidate_authenticated_user(user)
+
         return user
 
     def update_password(self, user_data, id):
@@ -95,11 +233,83 @@ class UserRepository:
 
         user = self.__get_user(id)
         user.updated_at = timezone.now()
-        user.set_password(user_data.validated_data.get(GenericConstants.PASSWORD))
+        user.password = self.password_hashing_service.make_password(
+            user_data.validated_data.get(GenericConstants.PASSWORD)
+        )
         user.save()
 
+        self.__invalidate_authenticated_user(user)
+
         return user
 
+    def validate_entities_not_exist(self, users_data):
+        """
+        Validates whether entities exist, with one query for every email and
+        one for every name.
+
+        Gets the errors of each user, a user also conflicts with the users
+        before it.
+
+        :param dict[] users_data: The users data.
+        """
+        self.validator.is_null(users_data)
+
+        emails = [
+            User.objects.normalize_email(user_data.get(GenericConstants.EMAIL))
+            for user_data in users_data
+        ]
+        names = [
+            (
+                user_data.get(GenericConstants.FIRST_NAME, GenericConstants.EMPTY_CHAR),
+                user_data.get(GenericConstants.LAST_NAME, GenericConstants.EMPTY_CHAR),
+            )
+            for user_data in users_data
+        ]
+
+        taken_emails = set(
+            email.lower()
+            for email in User.objects.filter(
+                email__lower__in={email.lower() for email in emails}, deleted_at=None
+            ).values_list(GenericConstants.EMAIL, flat=True)
+        )
+        taken_names = set(
+            User.objects.annotate(
+                lower_first_name=Lower(GenericConstants.FIRST_NAME),
+                lower_last_name=Lower(GenericConstants.LAST_NAME),
+            )
+            .filter(
+                lower_first_name__in={first_name.lower() for first_name, _ in names},
+                lower_last_name__in={last_name.lower() for _, last_name in names},
+                deleted_at=None,
+            )
+            .values_list(
+                GenericConstants.LOWER_FIRST_NAME, GenericConstants.LOWER_LAST_NAME
+            )
+        )
+
+        users_errors = []
+        for email, (first_name, last_name) in zip(emails, names):
+            user_errors = []
+
+            if email.lower() in taken_emails:
+                user_errors.append(ExceptionConstants.EMAIL_ALREADY_EXISTS)
+
+            if (first_name.lower(), last_name.lower()) in taken_names:
+                user_errors.append(
+                    ExceptionConstants.NAME_ALREADY_IN_USE
+                    % {
+                        GenericConstants.NAME: (
+                            first_name + GenericConstants.SPACE + last_name
+                        )
+                    }
+                )
+
+            taken_emails.add(email.lower())
+            taken_names.add((first_name.lower(), last_name.lower()))
+            users_errors.append(user_errors)
+
+        return users_errors
+
     def validate_user(self, user):
         """
         Validates users for log-in
@@ -108,16 +318,16 @@ class UserRepository:
         """
         self.validator.is_null(user)
 
-        access_token_data = AccessToken.for_user(user)
-        refresh_token = str(RefreshToken.for_user(user))
-        access_token = str(AccessToken.for_user(user))
-        expires_in = int(access_token_data.lifetime.total_seconds())
+        refresh_token = RefreshToken.for_user(user)
+        access_token = refresh_token.access_token
+        access_token[GenericConstants.ROLE] = user.role
+        expires_in = int(access_token.lifetime.total_seconds())
 
-        update_last_login(None, user)
+        self.__defer_last_login(user)
 
         validation = {
-            GenericConstants.ACCESS_TOKEN: access_token,
-            GenericConstants.REFRESH_TOKEN: refresh_token,
+            GenericConstants.ACCESS_TOKEN: str(access_token),
+            GenericConstants.REFRESH_TOKEN: str(refresh_token),
             GenericConstants.EXPIRES_IN: expires_in,
             GenericConstants.EMAIL: user.email,
             GenericConstants.ROLE: user.role,
@@ -125,6 +335,31 @@ class UserRepository:
 
         return validation
 
+    def __defer_last_login(self, user):
+        """
+        Defers the write of a user last login date.
+
+        The dates are written in a batch once LAST_LOGIN_BATCH_SIZE users are
+        pending or LAST_LOGIN_FLUSH_INTERVAL seconds passed since the last one,
+        checked on login and at the end of every request, by the
+        LastLoginFlushMiddleware.
+
+        :param User user: The logged in user.
+        """
+        self.validator.is_null(user)
+
+        user.last_login = timezone.now()
+
+        with self.__last_logins_lock:
+            self.__last_logins[user.id] = user.last_login
+            flush = (
+                len(self.__last_logins) >= settings.LAST_LOGIN_BATCH_SIZE
+                or self.__is_flush_due()
+            )
+
+        if flush:
+            self.flush_last_logins()
+
     def __get_user(self, id):
         """
         Gets a user.
@@ -133,13 +368,13 @@ class UserRepository:
         """
         self.validator.is_null(id)
 
-        users = User.objects.filter(id=id, deleted_at=None)
-        if users.count() < 1:
+        user = User.objects.filter(id=id, deleted_at=None).first()
+        if user is None:
             raise NotFoundException(
                 ExceptionConstants.USER_BY_ID_NOT_FOUND % {GenericConstants.ID: id}
             )
 
-        return users.first()
+        return user
 
     def __get_user_by_credentials_email(self, email):
         """
@@ -149,54 +384,86 @@ class UserRepository:
         """
         self.validator.is_null_or_empty_string(email)
 
-        users = User.objects.filter(email=email, deleted_at=None)
-        if users.count() < 1:
+        user = User.objects.filter(email__lower=email.lower(), deleted_at=None).first()
+        if user is None:
             raise NotFoundException(
                 ExceptionConstants.USER_BY_EMAIL_NOT_FOUND
                 % {GenericConstants.EMAIL: email}
             )
 
-        return users.first()
+        return user
 
-    def __validate_entity_not_exists(self, user_data):
+    def __invalidate_authenticated_user(self, user):
         """
-        Validates whether entity exists.
+        Invalidates the cached user of authenticated requests.
+
+        An inactive user is cached as such for the access token lifetime, so
+        tokens trusted by their role claim are rejected too.
 
-        :param dict user_data: The user data.
+        :param User user: The user.
         """
-        self.validator.is_null(user_data)
+        self.validator.is_null(user)
 
-        user_errors = []
+        cache_key = GenericConstants.AUTH_USER_CACHE_KEY % {
+            GenericConstants.ID: user.id
+        }
 
-        if (
-            User.objects.filter(
-                email=user_data.get(GenericConstants.EMAIL), deleted_at=None
-            ).count()
-            > 0
-        ):
-            user_errors.append(ExceptionConstants.EMAIL_ALREADY_EXISTS)
+        cache = caches[GenericConstants.SHARED_CACHE]
+        if user.is_active:
+            cache.delete(cache_key)
+        else:
+            cache.set(
+                cache_key,
+                {
+                    GenericConstants.ID: user.id,
+                    GenericConstants.EMAIL: user.email,
+                    GenericConstants.ROLE: user.role,
+                    GenericConstants.IS_ACTIVE: False,
+                },
+                settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds(),
+            )
 
-        first_name = user_data.get(GenericConstants.FIRST_NAME)
-        last_name = user_data.get(GenericConstants.LAST_NAME)
+    @classmethod
+    def __is_flush_due(cls):
+        """
+        Validates whether LAST_LOGIN_FLUSH_INTERVAL seconds passed since the
+        deferred last login dates were last written.
+        """
+        return (
+            monotonic() - cls.__last_logins_flushed_at
+            >= settings.LAST_LOGIN_FLUSH_INTERVAL
+        )
 
-        if (
-            User.objects.filter(
-                first_name__iexact=first_name,
-                last_name__iexact=last_name,
-                deleted_at=None,
-            ).count()
-            > 0
-        ):
-            user_errors.append(
-                ExceptionConstants.NAME_ALREADY_IN_USE
-                % {
-                    GenericConstants.NAME: (
-                        first_name + GenericConstants.SPACE + last_name
+    def __get_entity_error(self, error, user_data):
+        """
+        Gets the error of a user violating a unique index.
+
+        :param IntegrityError error: The unique index violation.
+        :param dict user_data: The optional user data.
+        """
+        self.validator.is_null(error)
+
+        constraint_name = getattr(
+            getattr(error.__cause__, "diag", None), "constraint_name", None
+        )
+
+        if constraint_name == GenericConstants.USER_EMAIL_UNIQUE_INDEX:
+            return ExceptionConstants.EMAIL_ALREADY_EXISTS
+
+        if constraint_name == GenericConstants.USER_NAME_UNIQUE_INDEX:
+            if user_data is None:
+                return ExceptionConstants.NAMES_ALREADY_IN_USE
+
+            return ExceptionConstants.NAME_ALREADY_IN_USE % {
+                GenericConstants.NAME: (
+                    user_data.get(
+                        GenericConstants.FIRST_NAME, GenericConstants.EMPTY_CHAR
                     )
-                }
-            )
+                    + GenericConstants.SPACE
+                    + user_data.get(
+                        GenericConstants.LAST_NAME, GenericConstants.EMPTY_CHAR
+                    )
+                )
+            }
 
-        if len(user_errors) > 0:
-            raise UnprocessableEntityException(
-                GenericConstants.LINE_BREAK.join(user_errors)
-            )
+        raise error
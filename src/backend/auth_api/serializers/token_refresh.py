@@ -0,0 +1,34 @@
+"""
+File name: token_refresh.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from auth_api.services.token_revocation_service import TokenRevocationService
+from utils.configurations.constants import ExceptionConstants
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    The revocable token refresh serializer.
+
+    Refreshes access tokens, unless the refresh token is revoked.
+    """
+
+    def validate(self, attrs):
+        """
+        Validates the refresh token is not revoked.
+
+        :param dict attrs: The refresh data.
+        """
+        refresh_token = RefreshToken(attrs["refresh"])
+        if TokenRevocationService().is_revoked(
+            refresh_token.get(api_settings.JTI_CLAIM)
+        ):
+            raise InvalidToken(ExceptionConstants.TOKEN_REVOKED)
+
+        return super().validate(attrs)
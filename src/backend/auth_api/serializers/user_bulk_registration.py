@@ -0,0 +1,23 @@
+"""
+File name: user_bulk_registration.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from rest_framework import serializers
+
+from utils.configurations.constants import GenericConstants
+
+
+class UserBulkRegistrationSerializer(serializers.Serializer):
+    """
+    The user bulk registration serializer.
+    """
+
+    users = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=GenericConstants.BULK_REGISTRATION_MAX_USERS,
+    )
+    """
+    The users to register, each as the user registration.
+    """
@@ -0,0 +1,34 @@
+"""
+File name: user_bulk_result.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from rest_framework import serializers
+
+from auth_api.serializers.user_list import UserListSerializer
+
+
+class UserBulkResultSerializer(serializers.Serializer):
+    """
+    The user bulk result serializer.
+    """
+
+    index = serializers.IntegerField(read_only=True)
+    """
+    The user position in the request.
+    """
+
+    status = serializers.IntegerField(read_only=True)
+    """
+    The user HTTP status code.
+    """
+
+    user = UserListSerializer(read_only=True, required=False)
+    """
+    The user created.
+    """
+
+    error = serializers.JSONField(read_only=True, required=False)
+    """
+    The user error.
+    """
@@ -0,0 +1,17 @@
+"""
+File name: user_logout.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from rest_framework import serializers
+
+
+class UserLogoutSerializer(serializers.Serializer):
+    """
+    The user logout serializer.
+    """
+
+    refresh_token = serializers.CharField(required=False)
+    """
+    The optional refresh token to revoke.
+    """
@@ -0,0 +1,182 @@
+"""
+File name: password_hashing_service.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    check_password,
+    get_hasher,
+    identify_hasher,
+    make_password,
+)
+
+from utils.configurations.constants import ExceptionConstants, GenericConstants
+from utils.exceptions.api_exceptions import ServiceUnavailableException
+from utils.validations.api_validations import ApiValidations
+
+
+class PasswordHashingService:
+    """
+    The password hashing service.
+
+    Runs password hashes on a process wide pool of PASSWORD_HASHING_WORKERS
+    threads, bounded to PASSWORD_HASHING_QUEUE_DEPTH pending hashes, so a login
+    burst cannot take every worker thread. Without workers, hashes run on the
+    calling thread.
+    """
+
+    __executor = None
+    """
+    The hashing thread pool.
+    """
+
+    __executor_lock = Lock()
+    """
+    The hashing thread pool lock.
+    """
+
+    __executor_settings = None
+    """
+    The workers and queue depth the hashing thread pool was created with.
+    """
+
+    __pending_hashes = None
+    """
+    The pending hashes semaphore.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of PasswordHashingService.
+        """
+        self.validator = ApiValidations()
+
+    def check_password(self, user, password):
+        """
+        Checks a user password.
+
+        A matching password hashed with a hasher or cost other than the
+        preferred ones is hashed again and saved.
+
+        :param User user: The user.
+        :param string password: The raw password.
+        """
+        self.validator.is_null(user)
+
+        is_correct = self.__run(check_password, password, user.password)
+
+        if is_correct and self.__must_update(user.password):
+            user.password = self.make_password(password)
+            user.save(update_fields=[GenericConstants.PASSWORD])
+
+        return is_correct
+
+    def make_password(self, password):
+        """
+        Hashes a password with the preferred hasher.
+
+        :param string password: The raw password.
+        """
+        self.validator.is_null_or_empty_string(password)
+
+        return self.__run(make_password, password)
+
+    def make_passwords(self, passwords):
+        """
+        Hashes passwords with the preferred hasher, concurrently on the hashing
+        thread pool, where the whole batch takes a single pending hash.
+
+        :param string[] passwords: The raw passwords.
+        """
+        self.validator.is_null(passwords)
+        for password in passwords:
+            self.validator.is_null_or_empty_string(password)
+
+        return self.__run_all(make_password, passwords)
+
+    @classmethod
+    def __get_executor(cls):
+        """
+        Gets the hashing thread pool, created for the current settings.
+        """
+        executor_settings = (
+            settings.PASSWORD_HASHING_WORKERS,
+            settings.PASSWORD_HASHING_QUEUE_DEPTH,
+        )
+
+        with cls.__executor_lock:
+            if cls.__executor_settings != executor_settings:
+                if cls.__executor is not None:
+                    cls.__executor.shutdown(wait=False)
+
+                workers, queue_depth = executor_settings
+                cls.__executor = None
+                if workers > 0:
+                    cls.__executor = ThreadPoolExecutor(max_workers=workers)
+                    cls.__pending_hashes = BoundedSemaphore(workers + queue_depth)
+                cls.__executor_settings = executor_settings
+
+            return cls.__executor, cls.__pending_hashes
+
+    def __must_update(self, encoded):
+        """
+        Validates whether a hash is not made with the preferred hasher and cost.
+
+        :param string encoded: The hashed password.
+        """
+        try:
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            return False
+
+        preferred_hasher = get_hasher(GenericConstants.DEFAULT)
+
+        return (
+            hasher.algorithm != preferred_hasher.algorithm
+            or preferred_hasher.must_update(encoded)
+        )
+
+    def __run(self, function, *args):
+        """
+        Runs a hashing function on the hashing thread pool.
+
+        :param function function: The hashing function.
+        """
+        executor, pending_hashes = self.__get_executor()
+        if executor is None:
+            return function(*args)
+
+        if not pending_hashes.acquire(blocking=False):
+            raise ServiceUnavailableException(
+                ExceptionConstants.PASSWORD_HASHING_QUEUE_FULL
+            )
+
+        try:
+            return executor.submit(function, *args).result()
+        finally:
+            pending_hashes.release()
+
+    def __run_all(self, function, args):
+        """
+        Runs a hashing function over arguments on the hashing thread pool.
+
+        :param function function: The hashing function.
+        :param object[] args: The arguments of each run.
+        """
+        executor, pending_hashes = self.__get_executor()
+        if executor is None:
+            return [function(arg) for arg in args]
+
+        if not pending_hashes.acquire(blocking=False):
+            raise ServiceUnavailableException(
+                ExceptionConstants.PASSWORD_HASHING_QUEUE_FULL
+            )
+
+        try:
+            return list(executor.map(function, args))
+        finally:
+            pending_hashes.release()
@@ -0,0 +1,133 @@
+"""
+File name: token_revocation_service.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from datetime import timedelta
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
+from django.utils import timezone
+
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from auth_api.repositories.revoked_token_repository import RevokedTokenRepository
+from utils.filters.bloom_filter import BloomFilter
+from utils.validations.api_validations import ApiValidations
+
+
+class TokenRevocationService:
+    """
+    The token revocation service.
+
+    Stores revoked tokens until they expire and checks them through a process
+    wide Bloom filter, so a token not revoked is told apart with no query. The
+    filter takes the revocations of other processes every
+    TOKEN_REVOCATION_REFRESH_INTERVAL seconds, and only the possibly revoked
+    tokens are confirmed against the database.
+    """
+
+    __filter = None
+    """
+    The revoked token identifier claims filter.
+    """
+
+    __filter_lock = Lock()
+    """
+    The revoked token identifier claims filter lock.
+    """
+
+    __refreshed_at = None
+    """
+    The last time the filter was refreshed.
+    """
+
+    __refreshed_until = None
+    """
+    The revocation date the filter was last refreshed up to.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of TokenRevocationService.
+        """
+        self.revoked_token_repository = RevokedTokenRepository()
+        self.validator = ApiValidations()
+
+    def is_revoked(self, jti):
+        """
+        Validates whether a token is revoked.
+
+        :param string jti: The token identifier claim.
+        """
+        self.validator.is_null_or_empty_string(jti)
+
+        if jti not in self.__get_filter():
+            return False
+
+        return self.revoked_token_repository.is_token_revoked(jti)
+
+    def revoke_token(self, token):
+        """
+        Revokes a token until it expires.
+
+        :param rest_framework_simplejwt.tokens.Token token: The token.
+        """
+        self.validator.is_null(token)
+
+        jti = token.get(api_settings.JTI_CLAIM)
+        self.revoked_token_repository.create_revoked_token(
+            jti, datetime_from_epoch(token.get("exp"))
+        )
+
+        with self.__filter_lock:
+            if self.__filter is not None:
+                self.__filter.add(jti)
+
+    @classmethod
+    def __get_filter(cls):
+        """
+        Gets the revoked token identifier claims filter, refreshed if due.
+
+        The filter is rebuilt from the revoked tokens not expired when first
+        used and once full, and otherwise takes the latest revocations only.
+        """
+        bloom_filter = cls.__filter
+        if (
+            bloom_filter is not None
+            and monotonic() - cls.__refreshed_at
+            < settings.TOKEN_REVOCATION_REFRESH_INTERVAL
+        ):
+            return bloom_filter
+
+        with cls.__filter_lock:
+            repository = RevokedTokenRepository()
+            refreshed_until = timezone.now()
+            bloom_filter = cls.__filter
+
+            if bloom_filter is None or bloom_filter.count >= bloom_filter.capacity:
+                repository.delete_expired_revoked_tokens()
+                jtis = repository.get_revoked_token_jtis()
+                bloom_filter = BloomFilter(
+                    max(settings.TOKEN_REVOCATION_FILTER_CAPACITY, 2 * len(jtis)),
+                    settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+                )
+            else:
+                # The refreshes overlap, so revocations committed late are kept.
+                jtis = repository.get_revoked_token_jtis(
+                    cls.__refreshed_until
+                    - timedelta(seconds=settings.TOKEN_REVOCATION_REFRESH_INTERVAL)
+                )
+
+            for jti in jtis:
+                bloom_filter.add(jti)
+
+            # The filter is published last, once filled and with its refresh
+            # time set, as the filter is read with no lock.
+            cls.__refreshed_at = monotonic()
+            cls.__refreshed_until = refreshed_until
+            cls.__filter = bloom_filter
+
+            return bloom_filter
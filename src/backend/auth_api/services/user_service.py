@@ -3,11 +3,18 @@ File name: user_service.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
-from django.contrib.auth import authenticate
+from rest_framework import status
+
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from auth_api.repositories.user_repository import UserRepository
-from auth_api.serializers import user_authenticated, user_list
-from utils.configurations.constants import GenericConstants
+from auth_api.serializers import user_authenticated, user_list, user_registration
+from auth_api.services.password_hashing_service import PasswordHashingService
+from auth_api.services.token_revocation_service import TokenRevocationService
+from utils.configurations.constants import ExceptionConstants, GenericConstants
+from utils.exceptions.api_exceptions import BadRequestException, UnauthorizedException
 from utils.validations.api_validations import ApiValidations
 
 
@@ -23,7 +30,10 @@ class UserService:
         Creates a new instance of UserService.
         """
         self.auth_serializer = user_authenticated.UserAuthenticatedSerializer
+        self.password_hashing_service = PasswordHashingService()
+        self.register_serializer = user_registration.UserRegistrationSerializer
         self.serializer = user_list.UserListSerializer
+        self.token_revocation_service = TokenRevocationService()
         self.user_repository = UserRepository()
         self.validator = ApiValidations()
 
@@ -39,6 +49,87 @@ class UserService:
 
         return self.__create_user_response(user_created).data
 
+    def create_users(self, users_data, creator_role):
+        """
+        Creates users in bulk.
+
+        The users are validated, checked against the existing users with
+        set-based queries, hashed concurrently and inserted at once. Gets the
+        result of each user, in the request order.
+
+        :param dict[] users_data: The users data.
+        :param int creator_role: The creator role.
+        """
+        self.validator.is_null(users_data)
+
+        results = []
+        valid_users_data = []
+
+        for index, user_data in enumerate(users_data):
+            serializer = self.register_serializer(data=user_data)
+
+            if not serializer.is_valid():
+                results.append(
+                    self.__create_user_result(
+                        index, status.HTTP_400_BAD_REQUEST, serializer.errors
+                    )
+                )
+                continue
+
+            user_role = serializer.validated_data.get(GenericConstants.ROLE)
+            if user_role is not None and user_role <= creator_role:
+                results.append(
+                    self.__create_user_result(
+                        index,
+                        status.HTTP_403_FORBIDDEN,
+                        ExceptionConstants.USER_CREATION_ROLE_NOT_VALID
+                        % {
+                            GenericConstants.CREATOR_ROLE: creator_role,
+                            GenericConstants.USER_ROLE: user_role,
+                        },
+                    )
+                )
+                continue
+
+            results.append(None)
+            valid_users_data.append((index, dict(serializer.validated_data)))
+
+        users_errors = self.user_repository.validate_entities_not_exist(
+            [user_data for _, user_data in valid_users_data]
+        )
+
+        new_users_data = []
+        for (index, user_data), user_errors in zip(valid_users_data, users_errors):
+            if len(user_errors) > 0:
+                results[index] = self.__create_user_result(
+                    index,
+                    status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    GenericConstants.LINE_BREAK.join(user_errors),
+                )
+            else:
+                new_users_data.append((index, user_data))
+
+        passwords = self.password_hashing_service.make_passwords(
+            [
+                user_data.get(GenericConstants.PASSWORD)
+                for _, user_data in new_users_data
+            ]
+        )
+        for (_, user_data), password in zip(new_users_data, passwords):
+            user_data[GenericConstants.PASSWORD] = password
+
+        users = self.user_repository.create_users(
+            [user_data for _, user_data in new_users_data]
+        )
+        for (index, _), user in zip(new_users_data, users):
+            results[index] = {
+                GenericConstants.INDEX: index,
+                GenericConstants.STATUS: status.HTTP_201_CREATED,
+                GenericConstants.USER: self.__create_user_response(user).data,
+            }
+
+        return results
+
     def delete_user(self, id):
         """
         Deletes a user fully.
@@ -63,6 +154,31 @@ class UserService:
 
         return self.__create_user_response(user).data
 
+    def logout_user(self, access_token, refresh_token=None):
+        """
+        Logs a user out, revoking its tokens.
+
+        :param rest_framework_simplejwt.tokens.AccessToken access_token: The access token.
+        :param string refresh_token: The optional refresh token of the same user.
+        """
+        self.validator.is_null(access_token)
+
+        refresh_token_data = None
+        if refresh_token is not None:
+            try:
+                refresh_token_data = RefreshToken(refresh_token)
+            except TokenError:
+                raise BadRequestException(ExceptionConstants.REFRESH_TOKEN_NOT_VALID)
+
+            if refresh_token_data.get(api_settings.USER_ID_CLAIM) != access_token.get(
+                api_settings.USER_ID_CLAIM
+            ):
+                raise BadRequestException(ExceptionConstants.REFRESH_TOKEN_NOT_VALID)
+
+        self.token_revocation_service.revoke_token(access_token)
+        if refresh_token_data is not None:
+            self.token_revocation_service.revoke_token(refresh_token_data)
+
     def update_password(self, user_data, id):
         """
         Updates a user password.
@@ -87,12 +203,29 @@ class UserService:
         password = user.data.get(GenericConstants.PASSWORD)
 
         user = self.user_repository.get_user_by_email(email)
+        if not user.is_active or not self.password_hashing_service.check_password(
+            user, password
+        ):
+            raise UnauthorizedException(ExceptionConstants.INVALID_CREDENTIALS)
 
-        user_authenticated = authenticate(email=email, password=password)
-        user_validated = self.user_repository.validate_user(user_authenticated)
+        user_validated = self.user_repository.validate_user(user)
 
         return self.auth_serializer(user_validated).data
 
+    def __create_user_result(self, index, status_code, error):
+        """
+        Creates the result of a user not created.
+
+        :param int index: The user position in the request.
+        :param int status_code: The HTTP status code.
+        :param object error: The error.
+        """
+        return {
+            GenericConstants.INDEX: index,
+            GenericConstants.STATUS: status_code,
+            GenericConstants.ERROR: error,
+        }
+
     def __create_user_response(self, user):
         """
         Creates a user response.
@@ -0,0 +1,134 @@
+"""
+File name: test_cached_jwt_authentication.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from multiprocessing import get_context
+
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auth_api.authentication.cached_jwt_authentication import CachedJWTAuthentication
+from auth_api.models import User
+from auth_api.repositories.user_repository import UserRepository
+from utils.exceptions.api_exceptions import UnauthorizedException
+
+
+class CachedJWTAuthenticationTestCase(APITestCase):
+    """
+    The cached JWT authentication test case class.
+    """
+
+    def setup(self):
+        """
+        CachedJWTAuthenticationTestCase class setup.
+        """
+        caches["shared"].clear()
+        self.authentication = CachedJWTAuthentication()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+        self.token = AccessToken.for_user(self.user)
+        self.token["role"] = self.user.role
+
+    def test_get_user_cached(self):
+        """
+        Tests the user of a token is resolved with no query once cached.
+        """
+        # arrange
+        self.setup()
+        self.authentication.get_user(self.token)
+
+        # act
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+
+        # assert
+        self.assertEqual(self.user.id, user.id)
+        self.assertEqual(self.user.role, user.role)
+        self.assertTrue(user.is_authenticated)
+
+    def test_get_user_inactive_when_deleted(self):
+        """
+        Tests the user of a token is rejected once deleted.
+
+        Should raise UnauthorizedException even when the role claim is trusted.
+        """
+        # arrange
+        self.setup()
+        self.authentication.get_user(self.token)
+
+        # act
+        UserRepository().delete_user(self.user.id)
+
+        # assert
+        with override_settings(AUTH_TRUST_TOKEN_CLAIMS=True):
+            self.assertRaises(
+                UnauthorizedException, self.authentication.get_user, self.token
+            )
+
+    def test_get_user_inactive_in_other_process_when_deleted(self):
+        """
+        Tests the user of a token is inactive in another worker process once
+        deleted, having been cached there before.
+        """
+        # arrange
+        self.setup()
+        self.authentication.get_user(self.token)
+        context = get_context("fork")
+        deleted = context.Event()
+        results = context.Queue()
+
+        def get_user_is_active():
+            deleted.wait(10)
+            user = UserRepository().get_authenticated_user(self.user.id)
+            results.put(user.is_active)
+
+        process = context.Process(target=get_user_is_active)
+        process.start()
+
+        # act
+        UserRepository().delete_user(self.user.id)
+        deleted.set()
+        is_active = results.get(timeout=10)
+        process.join()
+
+        # assert
+        self.assertFalse(is_active)
+
+    @override_settings(AUTH_TRUST_TOKEN_CLAIMS=True)
+    def test_get_user_trusted_claims(self):
+        """
+        Tests the user of a token is built from its claims with no query.
+        """
+        # arrange
+        self.setup()
+
+        # act
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+
+        # assert
+        self.assertEqual(self.user.id, user.id)
+        self.assertEqual(self.user.role, user.role)
+
+    def test_get_user_not_found(self):
+        """
+        Tests the user of a token not found.
+
+        Should raise UnauthorizedException when the user does not exist.
+        """
+        # arrange
+        self.setup()
+        token = AccessToken.for_user(User(email="missing@test.com"))
+
+        # act
+        # assert
+        self.assertRaises(UnauthorizedException, self.authentication.get_user, token)
@@ -0,0 +1,36 @@
+"""
+File name: test_benchmark_hashing.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class TestBenchmarkHashingCommand:
+    """
+    The test benchmark hashing command class.
+
+    Tests the benchmark_hashing command.
+    """
+
+    def test_benchmark_hashing(self):
+        """
+        Tests the benchmark_hashing command runs every cost and pool size.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command(
+            "benchmark_hashing",
+            iterations=[1000, 2000],
+            workers=[0, 2],
+            hashes=2,
+            stdout=stdout,
+        )
+
+        # assert
+        assert "iterations 2000" in stdout.getvalue()
+        assert "workers 2" in stdout.getvalue()
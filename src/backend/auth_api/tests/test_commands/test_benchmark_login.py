@@ -0,0 +1,42 @@
+"""
+File name: test_benchmark_login.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from auth_api.models import User
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchmarkLoginCommand:
+    """
+    The test benchmark login command class.
+
+    Tests the benchmark_login command.
+    """
+
+    def test_benchmark_login(self):
+        """
+        Tests the benchmark_login command runs every pipeline and removes its users.
+        """
+        # arrange
+        stdout = StringIO()
+
+        # act
+        call_command(
+            "benchmark_login",
+            users=2,
+            logins=4,
+            threads=[1, 2],
+            fast_hasher=True,
+            stdout=stdout,
+        )
+
+        # assert
+        assert "legacy login x1" in stdout.getvalue()
+        assert "login x2" in stdout.getvalue()
+        assert User.objects.count() == 0
@@ -0,0 +1,114 @@
+"""
+File name: test_password_hashing_service.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from threading import Event, Thread
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.test import TestCase, override_settings
+
+from auth_api.models import User
+from auth_api.services.password_hashing_service import PasswordHashingService
+from utils.exceptions.api_exceptions import ServiceUnavailableException
+
+
+@override_settings(PASSWORD_HASHING_ITERATIONS=1000)
+class PasswordHashingServiceTestCase(TestCase):
+    """
+    The password hashing service test case class.
+    """
+
+    def setup(self):
+        """
+        PasswordHashingServiceTestCase class setup.
+        """
+        self.service = PasswordHashingService()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+
+    def test_check_password(self):
+        """
+        Tests a password is checked against its hash.
+        """
+        # arrange
+        self.setup()
+
+        # act
+        is_correct = self.service.check_password(self.user, "test")
+        is_wrong = self.service.check_password(self.user, "wrong")
+
+        # assert
+        self.assertTrue(is_correct)
+        self.assertFalse(is_wrong)
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+    def test_check_password_rehash_when_cost_changed(self):
+        """
+        Tests a password hashed with another cost is upgraded once checked.
+        """
+        # arrange
+        self.setup()
+
+        # act
+        with override_settings(PASSWORD_HASHING_ITERATIONS=2000):
+            is_correct = self.service.check_password(self.user, "test")
+
+        # assert
+        self.user.refresh_from_db()
+        self.assertTrue(is_correct)
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$2000$"))
+
+    @override_settings(PASSWORD_HASHING_WORKERS=1, PASSWORD_HASHING_QUEUE_DEPTH=0)
+    def test_make_password_pool(self):
+        """
+        Tests a password is hashed on the hashing thread pool.
+        """
+        # arrange
+        self.service = PasswordHashingService()
+
+        # act
+        encoded = self.service.make_password("test")
+
+        # assert
+        self.assertTrue(check_password("test", encoded))
+
+    @override_settings(PASSWORD_HASHING_WORKERS=1, PASSWORD_HASHING_QUEUE_DEPTH=0)
+    def test_make_password_queue_full(self):
+        """
+        Tests a password is not hashed when the hashing queue is full.
+
+        Should raise ServiceUnavailableException.
+        """
+        # arrange
+        self.service = PasswordHashingService()
+        started, release = Event(), Event()
+
+        def blocking_make_password(password):
+            started.set()
+            release.wait()
+            return make_password(password)
+
+        # act
+        with mock.patch(
+            "auth_api.services.password_hashing_service.make_password",
+            blocking_make_password,
+        ):
+            thread = Thread(target=self.service.make_password, args=("test",))
+            thread.start()
+            started.wait()
+
+            # assert
+            try:
+                self.assertRaises(
+                    ServiceUnavailableException, self.service.make_password, "test"
+                )
+            finally:
+                release.set()
+                thread.join()
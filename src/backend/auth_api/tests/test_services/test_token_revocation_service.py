@@ -0,0 +1,96 @@
+"""
+File name: test_token_revocation_service.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from datetime import timedelta
+from uuid import uuid4
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from auth_api.models import RevokedToken, User
+from auth_api.services.token_revocation_service import TokenRevocationService
+
+
+class TokenRevocationServiceTestCase(TestCase):
+    """
+    The token revocation service test case class.
+    """
+
+    def setup(self):
+        """
+        TokenRevocationServiceTestCase class setup.
+        """
+        self.service = TokenRevocationService()
+        self.token = AccessToken.for_user(User(email="test@test.com"))
+
+    def test_is_revoked(self):
+        """
+        Tests a revoked token is told apart from the tokens not revoked.
+        """
+        # arrange
+        self.setup()
+        self.service.revoke_token(self.token)
+
+        # act
+        is_revoked = self.service.is_revoked(self.token["jti"])
+        with self.assertNumQueries(0):
+            is_not_revoked = self.service.is_revoked(uuid4().hex)
+
+        # assert
+        self.assertTrue(is_revoked)
+        self.assertFalse(is_not_revoked)
+
+    @override_settings(TOKEN_REVOCATION_REFRESH_INTERVAL=0)
+    def test_is_revoked_by_other_process(self):
+        """
+        Tests a token revoked by another process is revoked once refreshed.
+        """
+        # arrange
+        self.setup()
+        self.service.is_revoked(self.token["jti"])
+
+        # act
+        RevokedToken.objects.create(
+            jti=self.token["jti"], expires_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        # assert
+        self.assertTrue(self.service.is_revoked(self.token["jti"]))
+
+    def test_is_revoked_when_expired(self):
+        """
+        Tests an expired revocation no longer revokes its token.
+        """
+        # arrange
+        self.setup()
+        self.service.revoke_token(self.token)
+
+        # act
+        RevokedToken.objects.update(expires_at=timezone.now())
+
+        # assert
+        self.assertFalse(self.service.is_revoked(self.token["jti"]))
+
+    @override_settings(TOKEN_REVOCATION_REFRESH_INTERVAL=0)
+    def test_is_revoked_refreshes_do_not_fill_filter(self):
+        """
+        Tests the overlapping refreshes do not count a revoked token again.
+        """
+        # arrange
+        self.setup()
+        self.service.revoke_token(self.token)
+        self.service.is_revoked(self.token["jti"])
+        count = self.service._TokenRevocationService__get_filter().count
+
+        # act
+        for _ in range(3):
+            self.service.is_revoked(self.token["jti"])
+
+        # assert
+        self.assertEqual(
+            count, self.service._TokenRevocationService__get_filter().count
+        )
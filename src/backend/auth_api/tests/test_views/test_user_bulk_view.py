@@ -0,0 +1,114 @@
+"""
+File name: test_user_bulk_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from auth_api.models import User
+
+
+class UserBulkTestCase(APITestCase):
+    """
+    The user bulk view test case class.
+    """
+
+    def setup(self):
+        """
+        UserBulkTestCase class setup.
+        """
+        self.user = User.objects.create_user(
+            email="admin@test.com",
+            password="test",
+            first_name="admin_name",
+            last_name="admin_last_name",
+            role=1,
+        )
+
+    def create_user_data(self, index, role=2):
+        """
+        Creates a user registration.
+
+        :param int index: The user index.
+        :param int role: The user role.
+        """
+        return {
+            "email": "test%s@test.com" % index,
+            "password": "test%s" % index,
+            "first_name": "test_name_%s" % index,
+            "last_name": "test_last_name",
+            "role": role,
+        }
+
+    @override_settings(PASSWORD_HASHING_ITERATIONS=1000, PASSWORD_HASHING_WORKERS=2)
+    def test_user_bulk_post(self):
+        """
+        Tests the POST method of UserBulkView.
+
+        Should return HTTP status 201 when every user is created.
+        """
+        # arrange
+        self.setup()
+        request_data = {"users": [self.create_user_data(index) for index in range(5)]}
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post("/users/bulk", request_data, format="json")
+
+        # assert
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([201] * 5, [result.get("status") for result in response.data])
+        self.assertEqual("test3@test.com", response.data[3].get("user").get("email"))
+        self.assertTrue(
+            User.objects.get(email="test3@test.com").check_password("test3")
+        )
+
+    def test_user_bulk_post_multi_status(self):
+        """
+        Tests the POST method of UserBulkView.
+
+        Should return HTTP status 207 with the result of each user.
+        """
+        # arrange
+        self.setup()
+        request_data = {
+            "users": [
+                self.create_user_data(0),
+                {**self.create_user_data(1), "email": "admin@test.com"},
+                {**self.create_user_data(2), "email": "test0@test.com"},
+                {**self.create_user_data(3), "first_name": "TEST_NAME_0"},
+                {**self.create_user_data(4), "email": "not an email"},
+                self.create_user_data(5, role=1),
+            ]
+        }
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post("/users/bulk", request_data, format="json")
+
+        # assert
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(
+            [201, 422, 422, 422, 400, 403],
+            [result.get("status") for result in response.data],
+        )
+        self.assertEqual(2, User.objects.count())
+
+    def test_user_bulk_post_bad_request(self):
+        """
+        Tests the POST method of UserBulkView.
+
+        Should return HTTP status 400 when more users than allowed are sent.
+        """
+        # arrange
+        self.setup()
+        request_data = {"users": [self.create_user_data(index) for index in range(101)]}
+
+        # act
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post("/users/bulk", request_data, format="json")
+
+        # assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(1, User.objects.count())
@@ -3,10 +3,25 @@ File name: test_user_login_view.py
 Author: Fernando Rivera
 Creation date: 2021-12-08
 """
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
 from rest_framework.test import APITestCase
 
+from rest_framework_simplejwt.tokens import AccessToken
+
 from auth_api.models import User
-from utils.exceptions.api_exceptions import BadRequestException, NotFoundException
+from auth_api.repositories.user_repository import UserRepository
+from gunicorn_config import worker_exit
+from utils.exceptions.api_exceptions import (
+    BadRequestException,
+    NotFoundException,
+    UnauthorizedException,
+)
+from utils.throttles.login_rate_throttle import LoginRateThrottle
+from utils.throttles.shared_memory_rate_throttle import SharedMemoryRateThrottle
+from utils.throttles.token_bucket_table import TokenBucketTable
 
 
 class UserLoginTestCase(APITestCase):
@@ -40,6 +55,31 @@ class UserLoginTestCase(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(expected_email, response.data.get("email"))
 
+    def test_user_login_post_email_case(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should return HTTP status 200 when the email is provided with a
+        different case.
+        """
+        # arrange
+        User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+
+        request_data = {"email": "TEST@Test.com", "password": "test"}
+
+        # act
+        response = self.client.post("/users/login", request_data)
+
+        # assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual("test@test.com", response.data.get("email"))
+
     def test_user_login_post_bad_request(self):
         """
         Tests the POST method of UserLoginView.
@@ -79,3 +119,219 @@ class UserLoginTestCase(APITestCase):
         # assert
         self.assertEqual(response.status_code, 404)
         self.assertRaises(NotFoundException)
+
+    def test_user_login_post_unauthorized(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should return HTTP status 401 when the password is not valid.
+        """
+        # arrange
+        User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+
+        request_data = {"email": "test@test.com", "password": "wrong"}
+
+        # act
+        response = self.client.post("/users/login", request_data)
+
+        # assert
+        self.assertEqual(response.status_code, 401)
+        self.assertRaises(UnauthorizedException)
+
+    def test_user_login_post_role_claim(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should return an access token carrying the user role claim.
+        """
+        # arrange
+        user = User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+
+        request_data = {"email": "test@test.com", "password": "test"}
+
+        # act
+        response = self.client.post("/users/login", request_data)
+
+        # assert
+        access_token = AccessToken(response.data.get("access_token"))
+        self.assertEqual(str(user.id), access_token.get("user_id"))
+        self.assertEqual(1, access_token.get("role"))
+
+    @override_settings(LAST_LOGIN_BATCH_SIZE=2, LAST_LOGIN_FLUSH_INTERVAL=3600)
+    def test_user_login_post_last_login_deferred(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should write the last login dates once a batch is complete.
+        """
+        # arrange
+        UserRepository.flush_last_logins()
+        for email in ["test@test.com", "other@test.com"]:
+            User.objects.create_user(
+                email=email,
+                password="test",
+                first_name=email,
+                last_name="test_last_name",
+                role=1,
+            )
+
+        # act
+        self.client.post("/users/login", {"email": "test@test.com", "password": "test"})
+        first_last_login = User.objects.get(email="test@test.com").last_login
+        self.client.post(
+            "/users/login", {"email": "other@test.com", "password": "test"}
+        )
+
+        # assert
+        self.assertIsNone(first_last_login)
+        self.assertEqual(
+            0, User.objects.filter(last_login=None, deleted_at=None).count()
+        )
+
+    @override_settings(LAST_LOGIN_BATCH_SIZE=25, LAST_LOGIN_FLUSH_INTERVAL=3600)
+    def test_user_login_post_last_login_due_on_other_request(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should write the deferred last login dates at the end of the first
+        request once the flush interval passed.
+        """
+        # arrange
+        UserRepository.flush_last_logins()
+        User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+        self.client.post("/users/login", {"email": "test@test.com", "password": "test"})
+        deferred_last_login = User.objects.get(email="test@test.com").last_login
+
+        # act
+        with override_settings(LAST_LOGIN_FLUSH_INTERVAL=0):
+            self.client.get(reverse("health"))
+
+        # assert
+        self.assertIsNone(deferred_last_login)
+        self.assertIsNotNone(User.objects.get(email="test@test.com").last_login)
+
+    def test_user_login_post_last_login_due_written_before_request_finished(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should write the due deferred last login dates before request_finished,
+        while the request database connection is open.
+        """
+        # arrange
+        UserRepository.flush_last_logins()
+        User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+        self.client.post("/users/login", {"email": "test@test.com", "password": "test"})
+
+        # act
+        with override_settings(LAST_LOGIN_FLUSH_INTERVAL=0), mock.patch(
+            "django.http.response.signals.request_finished"
+        ):
+            self.client.get(reverse("health"))
+
+        # assert
+        self.assertIsNotNone(User.objects.get(email="test@test.com").last_login)
+
+    @override_settings(LAST_LOGIN_BATCH_SIZE=25, LAST_LOGIN_FLUSH_INTERVAL=3600)
+    def test_user_login_post_last_login_written_on_worker_exit(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should write the deferred last login dates when the worker exits.
+        """
+        # arrange
+        UserRepository.flush_last_logins()
+        User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+        self.client.post("/users/login", {"email": "test@test.com", "password": "test"})
+        deferred_last_login = User.objects.get(email="test@test.com").last_login
+
+        # act
+        worker_exit(None, None)
+
+        # assert
+        self.assertIsNone(deferred_last_login)
+        self.assertIsNotNone(User.objects.get(email="test@test.com").last_login)
+
+    def test_user_login_post_throttled(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should return HTTP status 429 with Retry-After once the rate is exceeded.
+        """
+        # arrange
+        request_data = {"email": "test@test.com", "password": "test"}
+
+        # act
+        with mock.patch.object(
+            LoginRateThrottle, "THROTTLE_RATES", {"login": "2/minute"}
+        ), mock.patch.object(
+            SharedMemoryRateThrottle, "table", TokenBucketTable(None, 64)
+        ):
+            responses = [
+                self.client.post("/users/login", request_data) for _ in range(3)
+            ]
+
+        # assert
+        self.assertEqual(
+            [404, 404, 429], [response.status_code for response in responses]
+        )
+        self.assertEqual("30", responses[2]["Retry-After"])
+
+    def test_user_login_post_throttled_spoofed_forwarded_for(self):
+        """
+        Tests the POST method of UserLoginView.
+
+        Should return HTTP status 429 once the rate is exceeded, whatever
+        X-Forwarded-For hops the client sends ahead of the proxy one.
+        """
+        # arrange
+        request_data = {"email": "test@test.com", "password": "test"}
+
+        # act
+        with mock.patch.object(
+            LoginRateThrottle, "THROTTLE_RATES", {"login": "2/minute"}
+        ), mock.patch.object(
+            SharedMemoryRateThrottle, "table", TokenBucketTable(None, 64)
+        ):
+            responses = [
+                self.client.post(
+                    "/users/login",
+                    request_data,
+                    HTTP_X_FORWARDED_FOR="10.0.0.%s, 192.0.2.1" % index,
+                )
+                for index in range(3)
+            ]
+
+        # assert
+        self.assertEqual(
+            [404, 404, 429], [response.status_code for response in responses]
+        )
@@ -0,0 +1,76 @@
+"""
+File name: test_user_logout_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-08
+"""
+from rest_framework.test import APITestCase
+
+from auth_api.models import User
+
+
+class UserLogoutTestCase(APITestCase):
+    """
+    The user logout view test case class.
+    """
+
+    def setup(self):
+        """
+        UserLogoutTestCase class setup.
+        """
+        User.objects.create_user(
+            email="test@test.com",
+            password="test",
+            first_name="test_name",
+            last_name="test_last_name",
+            role=1,
+        )
+
+        response = self.client.post(
+            "/users/login", {"email": "test@test.com", "password": "test"}
+        )
+        self.access_token = response.data.get("access_token")
+        self.refresh_token = response.data.get("refresh_token")
+
+    def test_user_logout_post(self):
+        """
+        Tests the POST method of UserLogoutView.
+
+        Should return HTTP status 204 and revoke the access and refresh tokens.
+        """
+        # arrange
+        self.setup()
+        headers = {"HTTP_AUTHORIZATION": "Bearer " + self.access_token}
+
+        # act
+        response = self.client.post(
+            "/users/logout", {"refresh_token": self.refresh_token}, **headers
+        )
+
+        # assert
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get("/users", **headers).status_code, 401)
+        self.assertEqual(
+            self.client.post(
+                "/users/tokens/refresh", {"refresh": self.refresh_token}
+            ).status_code,
+            401,
+        )
+
+    def test_user_logout_post_bad_request(self):
+        """
+        Tests the POST method of UserLogoutView.
+
+        Should return HTTP status 400 when the refresh token is not valid.
+        """
+        # arrange
+        self.setup()
+        headers = {"HTTP_AUTHORIZATION": "Bearer " + self.access_token}
+
+        # act
+        response = self.client.post(
+            "/users/logout", {"refresh_token": "not a token"}, **headers
+        )
+
+        # assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get("/users", **headers).status_code, 200)
@@ -320,6 +320,42 @@ class UserTestCase(APITestCase):
         self.assertEqual(response.status_code, 422)
         self.assertRaises(UnprocessableEntityException)
 
+    def test_user_post_unprocessable_entity_email_case(self):
+        """
+        Tests the POST method of UserView.
+
+        Should return HTTP status 422 when data and authentication provided
+        but email already exists with a different case.
+        """
+        # arrange
+        user_creator = User.objects.create_user(
+            email="creator@creator.com",
+            password="creator",
+            first_name="creator_name",
+            last_name="creator_last_name",
+            role=1,
+        )
+
+        user_data = {
+            "first_name": "test_name",
+            "last_name": "test_last_name",
+            "email": "Creator@Creator.com",
+            "password": "test_password",
+            "role": 2,
+        }
+
+        token = str(AccessToken.for_user(user=user_creator))
+
+        # act
+        self.client.force_authenticate(user=user_creator)
+        response = self.client.post(
+            "/users", user_data, **{"HTTP_AUTHORIZATION": "Bearer " + token}
+        )
+
+        # assert
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(1, User.objects.count())
+
     def test_user_post_forbidden_same_role(self):
         """
         Tests the POST method of UserView.
@@ -7,13 +7,25 @@ from django.urls import path
 
 from rest_framework_simplejwt.views import TokenRefreshView, TokenVerifyView
 
-from auth_api.views.user_view import UserLoginView, UserView
+from auth_api.serializers.token_refresh import RevocableTokenRefreshSerializer
+from auth_api.views.user_view import (
+    UserBulkView,
+    UserLoginView,
+    UserLogoutView,
+    UserView,
+)
 
 urlpatterns = [
     # User endpoints
     path("", UserView.as_view(), name="users"),
+    path("/bulk", UserBulkView.as_view(), name="users-bulk"),
     path("/login", UserLoginView.as_view(), name="users-login"),
+    path("/logout", UserLogoutView.as_view(), name="users-logout"),
     # Authentication
-    path("/tokens/refresh", TokenRefreshView.as_view(), name="token_refresh"),
+    path(
+        "/tokens/refresh",
+        TokenRefreshView.as_view(serializer_class=RevocableTokenRefreshSerializer),
+        name="token_refresh",
+    ),
     path("/tokens/verify", TokenVerifyView.as_view(), name="token_verify"),
 ]
@@ -11,7 +11,15 @@ from rest_framework.views import APIView
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
-from auth_api.serializers import user_list, user_login, user_password, user_registration
+from auth_api.serializers import (
+    user_bulk_registration,
+    user_bulk_result,
+    user_list,
+    user_login,
+    user_logout,
+    user_password,
+    user_registration,
+)
 from auth_api.services.user_service import UserService
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import (
@@ -19,6 +27,7 @@ from utils.exceptions.api_exceptions import (
     ForbiddenEntityException,
 )
 from utils.exceptions.serializers.api_exception_serializer import ApiExceptionSerializer
+from utils.throttles.login_rate_throttle import LoginRateThrottle
 
 
 class UserView(APIView):
@@ -201,6 +210,69 @@ class UserView(APIView):
             )
 
 
+class UserBulkView(APIView):
+    """
+    The user bulk view.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of UserBulkView.
+        """
+        self.permission_classes = (IsAuthenticated,)
+        self.serializer = user_bulk_registration.UserBulkRegistrationSerializer
+        self.user_service = UserService()
+
+    @swagger_auto_schema(
+        operation_description="Creates users in bulk.",
+        request_body=user_bulk_registration.UserBulkRegistrationSerializer(),
+        manual_parameters=[
+            openapi.Parameter(
+                "Authorization",
+                openapi.IN_HEADER,
+                "The user authorization.",
+                type="string",
+            ),
+        ],
+        responses={
+            201: openapi.Response(
+                "Users created.", user_bulk_result.UserBulkResultSerializer(many=True)
+            ),
+            207: openapi.Response(
+                "Some users not created.",
+                user_bulk_result.UserBulkResultSerializer(many=True),
+            ),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
+            500: openapi.Response(
+                "Internal server error.", ApiExceptionSerializer(many=False)
+            ),
+        },
+    )
+    def post(self, request, format=None):
+        """
+        Creates users in bulk.
+
+        :param rest_framework.request request: The request.
+        """
+        serializer = self.serializer(data=request.data)
+
+        if serializer.is_valid():
+            results = self.user_service.create_users(
+                serializer.validated_data.get(GenericConstants.USERS),
+                request.user.role,
+            )
+
+            if all(
+                result.get(GenericConstants.STATUS) == status.HTTP_201_CREATED
+                for result in results
+            ):
+                return Response(results, status=status.HTTP_201_CREATED)
+
+            return Response(results, status=status.HTTP_207_MULTI_STATUS)
+
+        raise BadRequestException(serializer.errors)
+
+
 class UserLoginView(APIView):
     """
     The user login view.
@@ -213,6 +285,7 @@ class UserLoginView(APIView):
         self.seralizer = user_login.UserLoginSerializer
         self.service = UserService()
         self.permission_classes = (AllowAny,)
+        self.throttle_classes = (LoginRateThrottle,)
 
     @swagger_auto_schema(
         operation_description="Authenticate user.",
@@ -223,6 +296,9 @@ class UserLoginView(APIView):
             422: openapi.Response(
                 "Unprocessable entity.", ApiExceptionSerializer(many=False)
             ),
+            429: openapi.Response(
+                "Too many requests.", ApiExceptionSerializer(many=False)
+            ),
             500: openapi.Response(
                 "Internal server error.", ApiExceptionSerializer(many=False)
             ),
@@ -237,3 +313,55 @@ class UserLoginView(APIView):
             return Response(response, status=status.HTTP_200_OK)
 
         raise BadRequestException(serializer.errors)
+
+
+class UserLogoutView(APIView):
+    """
+    The user logout view.
+    """
+
+    def __init__(self):
+        """
+        Creates a new instance of UserLogoutView.
+        """
+        self.permission_classes = (IsAuthenticated,)
+        self.serializer = user_logout.UserLogoutSerializer
+        self.service = UserService()
+
+    @swagger_auto_schema(
+        operation_description="Logs a user out, revoking its tokens.",
+        request_body=user_logout.UserLogoutSerializer(),
+        manual_parameters=[
+            openapi.Parameter(
+                "Authorization",
+                openapi.IN_HEADER,
+                "The user authorization.",
+                type="string",
+            ),
+        ],
+        responses={
+            204: openapi.Response("User logged out."),
+            400: openapi.Response("Bad request.", ApiExceptionSerializer(many=False)),
+            401: openapi.Response("Unauthorized.", ApiExceptionSerializer(many=False)),
+            500: openapi.Response(
+                "Internal server error.", ApiExceptionSerializer(many=False)
+            ),
+        },
+    )
+    def post(self, request):
+        """
+        Logs a user out.
+
+        :param rest_framework.request request: The request.
+        """
+        serializer = self.serializer(data=request.data)
+
+        if serializer.is_valid():
+            self.service.logout_user(
+                request.auth,
+                serializer.validated_data.get(GenericConstants.REFRESH_TOKEN),
+            )
+
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        raise BadRequestException(serializer.errors)
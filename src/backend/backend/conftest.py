@@ -1,8 +1,10 @@
 import os
 
+from django.conf import settings
 from django.test import TestCase, TransactionTestCase
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
 
-TestCase.databases = ["default"]
-TransactionTestCase.databases = ["default"]
+# the replicas mirror the default database in the tests
+TestCase.databases = ["default", *settings.DATABASE_REPLICAS]
+TransactionTestCase.databases = ["default", *settings.DATABASE_REPLICAS]
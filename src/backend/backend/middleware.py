@@ -1,6 +1,28 @@
+import asyncio
+import gzip
+from contextlib import nullcontext
+from functools import partial
+
 from django.conf import settings
 from django.contrib.sessions.middleware import SessionMiddleware
-from django.utils.cache import add_never_cache_headers
+from django.core.cache import cache, caches
+from django.utils.cache import add_never_cache_headers, patch_vary_headers
+from django.utils.functional import SimpleLazyObject
+
+from auth_api.repositories.user_repository import UserRepository
+from utils.asynchronous.loop_aware_sync_to_async import loop_aware_sync_to_async
+from utils.configurations.constants import GenericConstants
+from utils.databases.replica_router import ReplicaRouter
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 class HealthCheckAwareSessionMiddleware(SessionMiddleware):
@@ -10,14 +32,312 @@ class HealthCheckAwareSessionMiddleware(SessionMiddleware):
         super(HealthCheckAwareSessionMiddleware, self).process_request(request)
 
 
-class HeaderNoCacheMiddleware(object):
+class ResponseMiddleware(object):
+    """
+    Processes the responses of both the sync and the async request paths.
+
+    Under ASGI the responses are processed on the event loop, instead of
+    being sent to the thread of the synchronous code as Django does with the
+    middleware that is only sync capable.
+    """
+
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # flag the instance as a coroutine function, as Django does
+            self._is_coroutine = asyncio.coroutines._is_coroutine
 
     def __call__(self, request):
-        response = self.get_response(request)
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+
+        return self.process_response(request, response)
 
+    def process_response(self, request, response):
+        return response
+
+
+class HeaderNoCacheMiddleware(ResponseMiddleware):
+    def process_response(self, request, response):
         if request.method == "GET" and not response.has_header("Cache-Control"):
             add_never_cache_headers(response)
 
         return response
+
+
+class LastLoginFlushMiddleware(ResponseMiddleware):
+    """
+    Writes the deferred last login dates once due, at the end of every request,
+    on the request database connection, before Django closes it or returns it
+    to the pool on request_finished.
+    """
+
+    def process_response(self, request, response):
+        UserRepository.flush_due_last_logins()
+
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+
+        if UserRepository.has_due_last_logins():
+            await loop_aware_sync_to_async(UserRepository.flush_due_last_logins)()
+
+        return response
+
+
+class ReplicaRoutingMiddleware(ResponseMiddleware):
+    """
+    Sends the reads of the safe requests to a read replica and pins the
+    client to the primary for DATABASE_REPLICA_STICKINESS seconds after any
+    other request, so it reads its own writes.
+
+    The pin is kept for the authenticated user in the cache every worker
+    shares, and for any client in a cookie, kept by the clients with cookies.
+    The reads made before the user is authenticated are not pinned.
+    """
+
+    cache_format = "primary_pin:%s"
+
+    cookie_name = "primary_pin"
+
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        with self.__route(request):
+            response = self.get_response(request)
+
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        with self.__route(request):
+            response = await self.get_response(request)
+
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if settings.DATABASE_REPLICAS and request.method not in self.safe_methods:
+            user = self.__get_user(request)
+            if user is not None:
+                caches[GenericConstants.SHARED_CACHE].set(
+                    self.cache_format % user.pk,
+                    True,
+                    settings.DATABASE_REPLICA_STICKINESS,
+                )
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.DATABASE_REPLICA_STICKINESS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+        return response
+
+    def __get_user(self, request):
+        # the user the view authenticated, the lazy session user is not loaded
+        # as loading it reads the database
+        user = getattr(request, "user", None)
+        if isinstance(user, SimpleLazyObject) or user is None:
+            return None
+
+        return user if user.is_authenticated else None
+
+    def __is_pinned(self, request):
+        if not hasattr(request, "primary_pinned"):
+            user = self.__get_user(request)
+            if user is None:
+                return False
+            request.primary_pinned = caches[GenericConstants.SHARED_CACHE].get(
+                self.cache_format % user.pk, False
+            )
+
+        return request.primary_pinned
+
+    def __route(self, request):
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method in self.safe_methods
+            and self.cookie_name not in request.COOKIES
+        ):
+            return ReplicaRouter.use_replicas(partial(self.__is_pinned, request))
+
+        return nullcontext()
+
+
+class CompressionMiddleware(ResponseMiddleware):
+    """
+    Compresses responses with brotli, zstd or gzip, preferred in that order
+    among the encodings installed and accepted by the client.
+
+    Bodies under COMPRESSION_MIN_SIZE or over COMPRESSION_MAX_SIZE bytes and
+    streaming responses are sent as they are. The views set the
+    compression_cache_key of responses whose body only changes with it, such
+    as a closed order, and their compressed bodies are cached under that key,
+    so a later hit is neither rendered nor compressed again.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.compressors = {"gzip": self.__compress_gzip}
+        if zstandard is not None:
+            self.compressors["zstd"] = self.__compress_zstd
+        if brotli is not None:
+            self.compressors["br"] = self.__compress_brotli
+
+    def process_template_response(self, request, response):
+        encoding = self.__get_encoding(request)
+        cache_key = self.__get_cache_key(request, response, encoding)
+        if cache_key is None:
+            return response
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            content_type, content = cached
+            # setting the content marks the response as rendered, so the
+            # renderer is skipped
+            self.__set_encoded_content(response, content, encoding)
+            response["Content-Type"] = content_type
+            patch_vary_headers(response, ("Accept-Encoding",))
+
+        return response
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        content_length = len(response.content)
+        if (
+            content_length < settings.COMPRESSION_MIN_SIZE
+            or content_length > settings.COMPRESSION_MAX_SIZE
+        ):
+            return response
+
+        encoding = self.__get_encoding(request)
+        if encoding is None:
+            return response
+
+        content = self.compressors[encoding](response.content)
+        if len(content) >= content_length:
+            return response
+
+        cache_key = self.__get_cache_key(request, response, encoding)
+        if cache_key is not None:
+            cache.set(
+                cache_key,
+                (response["Content-Type"], content),
+                settings.COMPRESSION_CACHE_TIMEOUT,
+            )
+
+        self.__set_encoded_content(response, content, encoding)
+
+        return response
+
+    def __compress_brotli(self, content):
+        """
+        Compresses a body with brotli at COMPRESSION_BROTLI_LEVEL.
+
+        :param bytes content: The body.
+        """
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_LEVEL)
+
+    def __compress_gzip(self, content):
+        """
+        Compresses a body with gzip at COMPRESSION_GZIP_LEVEL, with no
+        modification time, so equal bodies compress to equal bytes.
+
+        :param bytes content: The body.
+        """
+        return gzip.compress(
+            content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+        )
+
+    def __compress_zstd(self, content):
+        """
+        Compresses a body with zstd at COMPRESSION_ZSTD_LEVEL.
+
+        :param bytes content: The body.
+        """
+        return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(
+            content
+        )
+
+    def __get_cache_key(self, request, response, encoding):
+        """
+        Gets the cache key of the compressed body of a response, by the
+        encoding, the media type, the path and the compression_cache_key the
+        view set, or None when the view set none or no encoding is accepted.
+
+        :param django.http.HttpRequest request: The request.
+        :param django.http.HttpResponse response: The response.
+        :param string encoding: The body encoding.
+        """
+        compression_cache_key = getattr(response, "compression_cache_key", None)
+        if compression_cache_key is None or encoding is None:
+            return None
+
+        return GenericConstants.COMPRESSION_CACHE_KEY % {
+            GenericConstants.ENCODING: encoding,
+            GenericConstants.MEDIA_TYPE: getattr(response, "accepted_media_type", None),
+            GenericConstants.PATH: request.get_full_path(),
+            GenericConstants.KEY: compression_cache_key,
+        }
+
+    def __get_encoding(self, request):
+        """
+        Gets the preferred encoding among those installed and accepted by the
+        request, or None when it accepts none.
+
+        :param django.http.HttpRequest request: The request.
+        """
+        accepted_encodings = set()
+
+        for accepted_encoding in request.META.get("HTTP_ACCEPT_ENCODING", "").split(
+            ","
+        ):
+            name, _, parameters = accepted_encoding.partition(";")
+            quality = 1.0
+            parameters = parameters.strip()
+            if parameters.startswith("q="):
+                try:
+                    quality = float(parameters[2:])
+                except ValueError:
+                    quality = 0.0
+            if quality > 0:
+                accepted_encodings.add(name.strip().lower())
+
+        for encoding in ("br", "zstd", "gzip"):
+            if encoding in self.compressors and encoding in accepted_encodings:
+                return encoding
+
+        return None
+
+    def __set_encoded_content(self, response, content, encoding):
+        """
+        Sets the compressed body of a response and its headers, weakening its
+        entity tag, as the compressed bytes differ from those it was made of.
+
+        :param django.http.HttpResponse response: The response.
+        :param bytes content: The compressed body.
+        :param string encoding: The body encoding.
+        """
+        response.content = content
+        response["Content-Length"] = str(len(content))
+        response["Content-Encoding"] = encoding
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
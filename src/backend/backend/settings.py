@@ -7,6 +7,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 import os
+import tempfile
 from datetime import timedelta
 
 from backend.envtools import getenv
@@ -46,9 +47,17 @@ INSTALLED_APPS = [
     "drf_yasg",
 ] + BACKEND_APPS
 
-MIDDLEWARE = [
+# Stateless API profile.
+# Authentication is JWT only, so pure API deployments can drop the session,
+# CSRF, messages and locale machinery, keeping the security headers.
+STATELESS_API = getenv("STATELESS_API", default=False, coalesce=bool)
+
+SESSION_MIDDLEWARE = [
     "backend.middleware.HealthCheckAwareSessionMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "backend.middleware.LastLoginFlushMiddleware",
+    "backend.middleware.ReplicaRoutingMiddleware",
+    "backend.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -57,6 +66,16 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "backend.middleware.HeaderNoCacheMiddleware",
 ]
+STATELESS_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "backend.middleware.LastLoginFlushMiddleware",
+    "backend.middleware.ReplicaRoutingMiddleware",
+    "backend.middleware.CompressionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "backend.middleware.HeaderNoCacheMiddleware",
+]
+MIDDLEWARE = STATELESS_MIDDLEWARE if STATELESS_API else SESSION_MIDDLEWARE
 
 ROOT_URLCONF = "backend.urls"
 
@@ -82,19 +101,110 @@ WSGI_APPLICATION = "backend.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
+# Whether the database connections are checked out of a pool per process,
+# returned at the end of every request, instead of kept by each thread.
+DATABASE_POOL = getenv("DATABASE_POOL", default=False, coalesce=bool)
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "utils.databases.pooled_postgresql"
+        if DATABASE_POOL
+        else "django.db.backends.postgresql",
         "NAME": getenv("POSTGRES_DB", default="postgres"),
         "USER": getenv("POSTGRES_USER", default="postgres"),
         "PASSWORD": getenv("POSTGRES_PASSWORD", default="postgres"),
         "HOST": getenv("POSTGRES_HOSTNAME", default="localhost"),
         "PORT": 5432,
-        "CONN_MAX_AGE": 600,
+        # Seconds each thread keeps its connection open between requests, 0
+        # closes it at the end of every request.
+        "CONN_MAX_AGE": 0
+        if DATABASE_POOL
+        else getenv("CONN_MAX_AGE", default=600, coalesce=int),
         "DISABLE_SERVER_SIDE_CURSORS": True,
+        # The pooled connections per process, the seconds a request waits for
+        # one, the seconds a connection is kept and the idle seconds before it
+        # is pinged on checkout.
+        "POOL": {
+            "MAX_SIZE": getenv("DATABASE_POOL_MAX_SIZE", default=10, coalesce=int),
+            "TIMEOUT": getenv("DATABASE_POOL_TIMEOUT", default=5, coalesce=float),
+            "MAX_LIFETIME": getenv(
+                "DATABASE_POOL_MAX_LIFETIME", default=1800, coalesce=int
+            ),
+            "HEALTH_CHECK_INTERVAL": getenv(
+                "DATABASE_POOL_HEALTH_CHECK_INTERVAL", default=30, coalesce=int
+            ),
+        },
+    },
+}
+
+# Read replicas, as comma separated hosts, each followed by /name when its
+# database name is not the primary one. The safe requests read from one of
+# them, the tests read from the primary, as the replicas mirror it.
+DATABASE_REPLICA_HOSTS = getenv("DATABASE_REPLICA_HOSTS", default="", coalesce=str)
+for index, replica_host in enumerate(filter(None, DATABASE_REPLICA_HOSTS.split(","))):
+    host, _, name = replica_host.strip().partition("/")
+    DATABASES["replica_%s" % index] = dict(
+        DATABASES["default"],
+        HOST=host,
+        NAME=name or DATABASES["default"]["NAME"],
+        TEST={"MIRROR": "default"},
+    )
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+DATABASE_ROUTERS = ["utils.databases.replica_router.ReplicaRouter"]
+# Seconds the reads of a client go to the primary after a write request, so it
+# reads its own writes while the replicas catch up.
+DATABASE_REPLICA_STICKINESS = getenv(
+    "DATABASE_REPLICA_STICKINESS", default=5, coalesce=int
+)
+
+# Caches.
+# The default cache is private to each process. The shared one holds what
+# every worker must see at once, the authenticated users and the primary pins,
+# in a directory gunicorn creates for its workers. Deployments over several
+# hosts point SHARED_CACHE_BACKEND and SHARED_CACHE_LOCATION to a networked
+# cache, such as memcached.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": getenv(
+            "SHARED_CACHE_BACKEND",
+            default="django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": getenv(
+            "SHARED_CACHE_LOCATION",
+            default=os.path.join(tempfile.gettempdir(), "backend-shared-cache"),
+        ),
+        "OPTIONS": {
+            "MAX_ENTRIES": getenv(
+                "SHARED_CACHE_MAX_ENTRIES", default=100000, coalesce=int
+            ),
+        },
     },
 }
 
+# Password hashing
+# https://docs.djangoproject.com/en/3.2/topics/auth/passwords/
+
+PASSWORD_HASHERS = [
+    "auth_api.hashers.tunable_pbkdf2_password_hasher.TunablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+# The PBKDF2 iterations, hashes made with other iterations are upgraded on login.
+PASSWORD_HASHING_ITERATIONS = getenv(
+    "PASSWORD_HASHING_ITERATIONS", default=260000, coalesce=int
+)
+# Threads hashing passwords per process, 0 hashes on the request thread, and
+# hashes allowed to wait for them before logins are answered with 503.
+PASSWORD_HASHING_WORKERS = getenv("PASSWORD_HASHING_WORKERS", default=0, coalesce=int)
+PASSWORD_HASHING_QUEUE_DEPTH = getenv(
+    "PASSWORD_HASHING_QUEUE_DEPTH", default=8, coalesce=int
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -121,9 +231,9 @@ LANGUAGE_CODE = "en-us"
 
 TIME_ZONE = "UTC"
 
-USE_I18N = True
+USE_I18N = not STATELESS_API
 
-USE_L10N = True
+USE_L10N = not STATELESS_API
 
 USE_TZ = True
 
@@ -138,17 +248,42 @@ STATIC_URL = "/static/"
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
 REST_FRAMEWORK = {
-    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "utils.renderers.fast_json_renderer.FastJSONRenderer",
+        "utils.renderers.message_pack_renderer.MessagePackRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "utils.parsers.fast_json_parser.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+        "utils.parsers.message_pack_parser.MessagePackParser",
+    ],
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
         "rest_framework.permissions.AllowAny",
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "auth_api.authentication.cached_jwt_authentication.CachedJWTAuthentication",
     ],
     "EXCEPTION_HANDLER": "utils.exceptions.handlers.exception_handler.handler",
+    "DEFAULT_THROTTLE_CLASSES": [
+        "utils.throttles.write_rate_throttle.WriteRateThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "login": getenv("RATE_LIMIT_LOGIN", default="30/minute"),
+        "write": getenv("RATE_LIMIT_WRITE", default="1200/minute"),
+    },
+    # The proxies in front of the API, nginx, so the throttled client address
+    # is the X-Forwarded-For hop the last proxy appends, not one the client sent.
+    "NUM_PROXIES": getenv("NUM_PROXIES", default=1, coalesce=int),
 }
 
+# Rate limiting.
+# The memory map file shared by the workers, created by gunicorn, without it
+# each process throttles on its own. The slots bound the buckets tracked.
+RATE_LIMIT_FILE = getenv("RATE_LIMIT_FILE", default=None)
+RATE_LIMIT_SLOTS = getenv("RATE_LIMIT_SLOTS", default=65536, coalesce=int)
+
 if getenv("BROWSABLE_API_RENDERER", default=False, coalesce=bool):
     REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = REST_FRAMEWORK[
         "DEFAULT_RENDERER_CLASSES"
@@ -251,6 +386,57 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 }
 
+# Reports.
+# Seconds a report over an already settled closure date range stays cached.
+REPORT_CACHE_TIMEOUT = getenv("REPORT_CACHE_TIMEOUT", default=300, coalesce=int)
+# Closure date partitions a product report is aggregated over, in a single
+# query the database runs on up to a parallel worker per partition, within its
+# max_parallel_workers. 1 aggregates the range as a whole.
+REPORT_PARALLELISM = getenv("REPORT_PARALLELISM", default=1, coalesce=int)
+
+# Response compression.
+# Bodies outside these sizes, in bytes, are sent uncompressed. The upper bound
+# and the levels cap the CPU a single response may spend compressing.
+COMPRESSION_MIN_SIZE = getenv("COMPRESSION_MIN_SIZE", default=1024, coalesce=int)
+COMPRESSION_MAX_SIZE = getenv(
+    "COMPRESSION_MAX_SIZE", default=16 * 1024 * 1024, coalesce=int
+)
+# Levels of each encoding, on its own scale: 0 to 11 for brotli, 1 to 9 for
+# gzip and 1 to 22 for zstd. The defaults cost about the same CPU per byte.
+COMPRESSION_BROTLI_LEVEL = getenv("COMPRESSION_BROTLI_LEVEL", default=4, coalesce=int)
+COMPRESSION_GZIP_LEVEL = getenv("COMPRESSION_GZIP_LEVEL", default=5, coalesce=int)
+COMPRESSION_ZSTD_LEVEL = getenv("COMPRESSION_ZSTD_LEVEL", default=3, coalesce=int)
+# Seconds the compressed body of a response with a cache key stays cached.
+COMPRESSION_CACHE_TIMEOUT = getenv(
+    "COMPRESSION_CACHE_TIMEOUT", default=3600, coalesce=int
+)
+
+# Authentication.
+# Seconds the user of authenticated requests stays cached.
+AUTH_USER_CACHE_TIMEOUT = getenv("AUTH_USER_CACHE_TIMEOUT", default=60, coalesce=int)
+# Whether the role claim of access tokens is trusted when the user is not
+# cached, so those requests make no user query.
+AUTH_TRUST_TOKEN_CLAIMS = getenv(
+    "AUTH_TRUST_TOKEN_CLAIMS", default=False, coalesce=bool
+)
+# Seconds other processes take to see a revoked token, and the revoked tokens
+# the filter holds at its false positive rate before it grows.
+TOKEN_REVOCATION_REFRESH_INTERVAL = getenv(
+    "TOKEN_REVOCATION_REFRESH_INTERVAL", default=5, coalesce=int
+)
+TOKEN_REVOCATION_FILTER_CAPACITY = getenv(
+    "TOKEN_REVOCATION_FILTER_CAPACITY", default=100000, coalesce=int
+)
+TOKEN_REVOCATION_FILTER_ERROR_RATE = getenv(
+    "TOKEN_REVOCATION_FILTER_ERROR_RATE", default=0.001, coalesce=float
+)
+# Users logged in before their last login dates are written in one batch,
+# and seconds after which the pending dates are written anyway, at the end of
+# the next request the worker serves, by the LastLoginFlushMiddleware. The
+# worker writes them on exit too.
+LAST_LOGIN_BATCH_SIZE = getenv("LAST_LOGIN_BATCH_SIZE", default=25, coalesce=int)
+LAST_LOGIN_FLUSH_INTERVAL = getenv("LAST_LOGIN_FLUSH_INTERVAL", default=5, coalesce=int)
+
 # The audthentication user model.
 AUTH_USER_MODEL = "auth_api.User"
 
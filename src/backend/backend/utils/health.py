@@ -2,14 +2,18 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from drf_yasg.utils import swagger_auto_schema
 
+from utils.views.async_api_view import AsyncAPIView
 
-class HealthView(APIView):
+
+class HealthView(AsyncAPIView):
     """
     The health view.
+
+    Answers from the event loop, with no authentication nor throttling, so the
+    view does not wait on the thread of the synchronous code.
     """
 
     def __init__(self):
@@ -17,12 +21,14 @@ class HealthView(APIView):
         Creates a new instance of HealthView.
         """
         self.renderer_classes = [JSONRenderer]
+        self.authentication_classes = ()
         self.permission_classes = (AllowAny,)
+        self.throttle_classes = ()
 
     @swagger_auto_schema(
         operation_description="Gets API health.",
     )
-    def get(self, request):
+    async def get(self, request):
         """
         Gets the API health.
         """
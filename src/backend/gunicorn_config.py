@@ -1,24 +1,68 @@
 import atexit
 import gc
 import os
+import shutil
 import signal
+import sys
+import tempfile
 import threading
 import time
 
 import psutil
 
+from utils.throttles.token_bucket_table import TokenBucketTable
+
 bind = "0.0.0.0:8000"
 
 workers = int(os.getenv("CONCURRENCY", default=2))
-worker_class = "sync"
 
-preload_app = True
+# asgi runs an event loop per worker, serving the async views concurrently
+server_interface = os.getenv("SERVER_INTERFACE", default="wsgi")
+if server_interface == "asgi":
+    worker_class = "uvicorn.workers.UvicornWorker"
+    wsgi_app = "backend.asgi:application"
+else:
+    # sync, gthread or gevent, gevent needs the gevent and psycogreen packages
+    worker_class = os.getenv("WORKER_CLASS", default="sync")
+    wsgi_app = "backend.wsgi:application"
+
+# requests served at once by each gthread worker, sync turns gthread over 1,
+# each thread keeps its own database connection up to CONN_MAX_AGE, or shares
+# the worker DATABASE_POOL_MAX_SIZE connections when DATABASE_POOL is set
+threads = int(os.getenv("THREADS", default=1))
+# requests served at once by each gevent worker
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", default=100))
+
+green = worker_class == "gevent"
+if green:
+    # each request runs on a new greenlet, so its connection is never reused,
+    # unless it comes from the worker pool when DATABASE_POOL is set
+    os.environ["CONN_MAX_AGE"] = "0"
+
+# gevent patches the standard library before the app loads, in each worker
+preload_app = not green
 
 timeout = 10
 graceful_timeout = 30
 
 restart_on_rss = int(os.getenv("RESTART_ON_RSS", default=500))
 
+# the rate limiter buckets shared by every worker, set before the app loads
+rate_limit_file = os.environ.setdefault(
+    "RATE_LIMIT_FILE",
+    os.path.join(tempfile.gettempdir(), "backend-rate-limit-%s" % os.getpid()),
+)
+rate_limit_slots = int(os.getenv("RATE_LIMIT_SLOTS", default=65536))
+
+# the cache directory shared by every worker, set before the app loads, unless
+# a networked shared cache is set
+shared_cache_location = None
+if "SHARED_CACHE_BACKEND" not in os.environ:
+    shared_cache_location = os.environ.setdefault(
+        "SHARED_CACHE_LOCATION",
+        os.path.join(tempfile.gettempdir(), "backend-shared-cache-%s" % os.getpid()),
+    )
+
 
 class MemoryWatch(threading.Thread):
     def __init__(self, server, restart_on_rss):
@@ -28,22 +72,31 @@ class MemoryWatch(threading.Thread):
         self.restart_on_rss = restart_on_rss
 
     def memory_usage(self, pid):
-        return int(psutil.Process(pid).memory_info()[0] / 1024.0 / 1024.0)
+        try:
+            return int(psutil.Process(pid).memory_info()[0] / 1024.0 / 1024.0)
+        except psutil.NoSuchProcess:
+            return 0
 
     def run(self):
         while True:
             time.sleep(60)
-            for (pid, worker) in list(self.server.WORKERS.items()):
-                pid_memory_usage = self.memory_usage(pid)
-
-                if pid_memory_usage >= self.restart_on_rss:
-                    self.server.log.info(
-                        """restart_on_rss on PID %s,
-                        observed memory usage: %sMB""",
-                        pid,
-                        pid_memory_usage,
-                    )
-                    self.server.kill_worker(pid, signal.SIGTERM)
+            pid_memory_usages = [
+                (self.memory_usage(pid), pid) for pid in list(self.server.WORKERS)
+            ]
+            if not pid_memory_usages:
+                continue
+
+            # restart one worker a round, threaded and green workers are few
+            # and each serves many requests, so the others keep serving
+            pid_memory_usage, pid = max(pid_memory_usages)
+            if pid_memory_usage >= self.restart_on_rss:
+                self.server.log.info(
+                    """restart_on_rss on PID %s,
+                    observed memory usage: %sMB""",
+                    pid,
+                    pid_memory_usage,
+                )
+                self.server.kill_worker(pid, signal.SIGTERM)
 
 
 # disable Python GC in master as early as possible
@@ -51,8 +104,16 @@ gc.disable()
 
 
 def when_ready(server):
-    # mark preloaded app objects as uncollectable
-    gc.freeze()
+    # mark preloaded app objects as uncollectable, so the workers share them
+    if preload_app:
+        gc.freeze()
+    # create the rate limiter buckets the workers map
+    if os.path.exists(rate_limit_file):
+        os.remove(rate_limit_file)
+    TokenBucketTable.create(rate_limit_file, rate_limit_slots)
+    # empty the cache directory the workers share, they create it on first use
+    if shared_cache_location is not None:
+        shutil.rmtree(shared_cache_location, ignore_errors=True)
     # enable child memory watcher
     mw = MemoryWatch(server, restart_on_rss)
     mw.start()
@@ -63,3 +124,24 @@ def post_fork(server, worker):
     gc.enable()
     # no final GC needed
     atexit.register(os._exit, 0)
+    # let psycopg2 yield to the other greenlets while waiting on the database
+    if green:
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+
+
+def worker_exit(server, worker):
+    # write the last login dates the worker deferred, once the app is loaded
+    user_repository = sys.modules.get("auth_api.repositories.user_repository")
+    if user_repository is not None:
+        user_repository.UserRepository.flush_last_logins()
+
+
+def on_exit(server):
+    # remove the rate limiter buckets
+    if os.path.exists(rate_limit_file):
+        os.remove(rate_limit_file)
+    # remove the cache directory the workers shared
+    if shared_cache_location is not None:
+        shutil.rmtree(shared_cache_location, ignore_errors=True)
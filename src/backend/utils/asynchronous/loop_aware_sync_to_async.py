@@ -0,0 +1,34 @@
+"""
+File name: loop_aware_sync_to_async.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import asyncio
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+
+
+def loop_aware_sync_to_async(function):
+    """
+    Adapts a synchronous function to be awaited.
+
+    From the event loop the function runs on the thread of the synchronous
+    code, as with sync_to_async. With no event loop running in the thread, as
+    when a coroutine is run to completion under WSGI, the function is called
+    on the spot, so the awaiting coroutine does not suspend.
+
+    :param callable function: The synchronous function.
+    """
+    async_function = sync_to_async(function)
+
+    @wraps(function)
+    async def wrapper(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return function(*args, **kwargs)
+
+        return await async_function(*args, **kwargs)
+
+    return wrapper
@@ -10,6 +10,24 @@ class ExceptionConstants:
     The exception constants.
     """
 
+    BENCHMARK_DATABASE_NOT_ALLOWED = (
+        "The benchmark commits its seed rows to the database, confirm it is not a "
+        "live one with --allow-database-writes."
+    )
+    """
+    The exception when a benchmark would seed the database unconfirmed.
+    """
+
+    COROUTINE_SUSPENDED = "The coroutine suspended with no event loop running."
+    """
+    The coroutine suspended with no event loop running message.
+    """
+
+    DATABASE_POOL_EXHAUSTED = "No database connection is free, retry later."
+    """
+    The exception when every pooled database connection is in use.
+    """
+
     EMAIL_ALREADY_EXISTS = "Email already exists."
     """
     The exception when email already exists.
@@ -30,6 +48,16 @@ class ExceptionConstants:
     The exception when the credentials are invalid.
     """
 
+    MESSAGE_PACK_PARSE_ERROR = "MessagePack parse error - %(error)s"
+    """
+    The exception when a request body is not valid MessagePack.
+    """
+
+    NAMES_ALREADY_IN_USE = "A name is already in use."
+    """
+    The exception when a name of a batch is already in use.
+    """
+
     NAME_ALREADY_IN_USE = "The name '%(name)s' is already in use."
     """
     The exception when a user name already exists.
@@ -45,6 +73,13 @@ class ExceptionConstants:
     The exception when an order is not found.
     """
 
+    PARAMETER_EXCEEDS_MAX_LENGTH = (
+        "The parameter '%(parameter)s' holds more than %(max_length)s values."
+    )
+    """
+    The exception when a provided list parameter holds too many values.
+    """
+
     PRODUCT_BY_ID_NOT_FOUND = "The product with id '%(id)s' does not exist."
     """
     The exception when a product by identifier does not exists.
@@ -74,11 +109,57 @@ class ExceptionConstants:
     The exception when a parameter is invalid due to regex validation.
     """
 
+    PARAMETER_IS_REQUIRED = "The parameter '%(parameter)s' is required."
+    """
+    The exception when a required parameter is not provided.
+    """
+
+    PARAMETER_MUST_BE_BOOLEAN = "The parameter '%(parameter)s' is not type boolean."
+    """
+    The exception when a provided parameter is not from type boolean.
+    """
+
+    PARAMETER_MUST_BE_CURSOR = "The parameter '%(parameter)s' is not a valid cursor."
+    """
+    The exception when a provided parameter is not a valid page cursor.
+    """
+
     PARAMETER_MUST_BE_DATETIME = "The parameter '%(parameter)s' is not type datetime."
     """
     The exception when a provided parameter is not from type datetime.
     """
 
+    PARAMETER_MUST_BE_POSITIVE_INTEGER = (
+        "The parameter '%(parameter)s' is not a positive integer."
+    )
+    """
+    The exception when a provided parameter is not a positive integer.
+    """
+
+    PARAMETER_MUST_BE_TIMEZONE = (
+        "The parameter '%(parameter)s' is not a valid timezone."
+    )
+    """
+    The exception when a provided parameter is not a valid timezone.
+    """
+
+    PARAMETER_MUST_BE_UUID = "The parameter '%(parameter)s' is not type uuid."
+    """
+    The exception when a provided parameter is not from type uuid.
+    """
+
+    PARAMETER_NOT_IN_OPTIONS = (
+        "The parameter '%(parameter)s' must be one of %(options)s."
+    )
+    """
+    The exception when a provided parameter is not one of the allowed options.
+    """
+
+    PASSWORD_HASHING_QUEUE_FULL = "Too many pending password hashes, retry later."
+    """
+    The exception when the password hashing queue is full.
+    """
+
     PASSWORD_MUST_BE_SET = "The password must be set"
     """
     The exception when password is not set.
@@ -105,16 +186,44 @@ class ExceptionConstants:
     The exception when no product quantities are found in a specified time range.
     """
 
+    REFRESH_TOKEN_NOT_VALID = "The refresh token is not valid."
+    """
+    The exception when a refresh token is not valid.
+    """
+
+    SERIES_EXCEEDS_MAX_BUCKETS = (
+        "The series from '%(start_date)s' to '%(end_date)s' exceeds %(max_length)s "
+        "buckets."
+    )
+    """
+    The exception when a series range holds too many buckets.
+    """
+
     SUPER_USER_ROLE_INVALID = "Superuser must have role of Global Admin"
     """
     The exception when a user is not an admin.
     """
 
+    TOKEN_REVOKED = "Token is revoked."
+    """
+    The exception when a token is revoked.
+    """
+
+    TOKEN_WITHOUT_USER_ID = "Token contained no recognizable user identification."
+    """
+    The exception when a token has no user identifier.
+    """
+
     USER_BY_EMAIL_NOT_FOUND = "User with email '%(email)s' not found."
     """
     The exception when user by email not found.
     """
 
+    USER_BY_ID_INACTIVE = "User with id '%(id)s' is inactive."
+    """
+    The exception when user by id is inactive.
+    """
+
     USER_BY_ID_NOT_FOUND = "User with id '%(id)s' not found."
     """
     The exception when user by id not found.
@@ -151,11 +260,81 @@ class GenericConstants:
     The access token.
     """
 
+    AUTH_USER_CACHE_KEY = "auth_user:%(id)s"
+    """
+    The authenticated user cache key.
+    """
+
+    BULK_REGISTRATION_MAX_USERS = 100
+    """
+    The maximum users a bulk registration request accepts.
+    """
+
+    BY_PRODUCT = "by_product"
+    """
+    The by product flag.
+    """
+
+    CLIENT = "client"
+    """
+    The client.
+    """
+
+    CLOSED_AT = "closed_at"
+    """
+    The closed at.
+    """
+
+    COLUMNS = "columns"
+    """
+    The columns.
+    """
+
+    COMMA = ","
+    """
+    The comma.
+    """
+
+    COMPARE_END_DATE = "compare_end_date"
+    """
+    The comparison end date.
+    """
+
+    COMPARE_START_DATE = "compare_start_date"
+    """
+    The comparison start date.
+    """
+
+    COMPARE_TOTAL_PRICE = "compare_total_price"
+    """
+    The comparison total price.
+    """
+
+    COMPARE_TOTAL_QUANTITY = "compare_total_quantity"
+    """
+    The comparison total quantity.
+    """
+
+    COMPRESSION_CACHE_KEY = "compression:%(encoding)s:%(media_type)s:%(path)s:%(key)s"
+    """
+    The compressed response cache key.
+    """
+
+    CREATED_AT = "created_at"
+    """
+    The creation date.
+    """
+
     CREATOR_ROLE = "creator_role"
     """
     The creator role.
     """
 
+    CURSOR = "cursor"
+    """
+    The cursor.
+    """
+
     DATE = "date"
     """
     The date.
@@ -166,6 +345,16 @@ class GenericConstants:
     The date format.
     """
 
+    DAY = "day"
+    """
+    The day.
+    """
+
+    DEFAULT = "default"
+    """
+    The default key.
+    """
+
     DELETED_AT = "deleted_at"
     """
     The deletion date.
@@ -176,6 +365,21 @@ class GenericConstants:
     The description.
     """
 
+    DIMENSIONS = "dimensions"
+    """
+    The dimensions.
+    """
+
+    DIMENSION_OPTIONS = ("product", "client", "hour", "weekday")
+    """
+    The report dimension options.
+    """
+
+    DOT = "."
+    """
+    The dot.
+    """
+
     EMAIL = "email"
     """
     The email.
@@ -186,11 +390,31 @@ class GenericConstants:
     The empty char.
     """
 
+    ENCODING = "encoding"
+    """
+    The encoding.
+    """
+
     END_DATE = "end_date"
     """
     The end date.
     """
 
+    ERROR = "error"
+    """
+    The error.
+    """
+
+    EXPAND = "expand"
+    """
+    The expand.
+    """
+
+    EXPIRES_AT = "expires_at"
+    """
+    The expiration date.
+    """
+
     EXPIRES_IN = "expires_in"
     """
     The expiration time.
@@ -201,31 +425,156 @@ class GenericConstants:
     The external client.
     """
 
+    FALSE_OPTIONS = ("false", "0")
+    """
+    The false boolean options.
+    """
+
+    FIELDS = "fields"
+    """
+    The fields.
+    """
+
+    FIRST_CLOSED_AT = "first_closed_at"
+    """
+    The first closed at aggregate.
+    """
+
     FIRST_NAME = "first_name"
     """
     The first name.
     """
 
+    GROUP_BY = "group_by"
+    """
+    The group by.
+    """
+
+    HOUR = "hour"
+    """
+    The hour.
+    """
+
     ID = "id"
     """
     The identifier.
     """
 
+    IDS = "ids"
+    """
+    The identifiers.
+    """
+
+    INDEX = "index"
+    """
+    The index.
+    """
+
     IS_ACTIVE = "is_active"
     """
     The is active flag.
     """
 
+    ITEMS = "items"
+    """
+    The items.
+    """
+
+    JTI = "jti"
+    """
+    The token identifier.
+    """
+
+    KEY = "key"
+    """
+    The key.
+    """
+
+    LAST_CLOSED_AT = "last_closed_at"
+    """
+    The last closed at aggregate.
+    """
+
+    LAST_LOGIN = "last_login"
+    """
+    The last login date.
+    """
+
     LAST_NAME = "last_name"
     """
     The last name.
     """
 
+    LIMIT = "limit"
+    """
+    The limit.
+    """
+
     LINE_BREAK = "\n "
     """
     The line break character.
     """
 
+    LOGIN = "login"
+    """
+    The login throttle scope.
+    """
+
+    LOWER_FIRST_NAME = "lower_first_name"
+    """
+    The lowercase first name.
+    """
+
+    LOWER_LAST_NAME = "lower_last_name"
+    """
+    The lowercase last name.
+    """
+
+    LOWER_LOOKUP = "__lower"
+    """
+    The lowercase lookup.
+    """
+
+    MAX_LENGTH = "max_length"
+    """
+    The max length.
+    """
+
+    MEDIA_TYPE = "media_type"
+    """
+    The media type.
+    """
+
+    MESSAGE_PACK_FORMAT = "msgpack"
+    """
+    The MessagePack format.
+    """
+
+    MESSAGE_PACK_MEDIA_TYPE = "application/msgpack"
+    """
+    The MessagePack media type.
+    """
+
+    MESSAGE_PACK_UUID_EXT_TYPE = 1
+    """
+    The MessagePack extension type code of uuids.
+    """
+
+    MISSING = "missing"
+    """
+    The missing.
+    """
+
+    MONTH = "month"
+    """
+    The month.
+    """
+
+    MULTI_GET_MAX_IDS = 100
+    """
+    The maximum identifiers a multi-get request accepts.
+    """
+
     NAME = "name"
     """
     The name.
@@ -236,11 +585,31 @@ class GenericConstants:
     The negative index.
     """
 
+    NEXT_CURSOR_HEADER = "X-Next-Cursor"
+    """
+    The next page cursor header.
+    """
+
+    OPTIONS = "options"
+    """
+    The options.
+    """
+
     ORDER = "order"
     """
     The order.
     """
 
+    ORDER_BY = "order_by"
+    """
+    The order by.
+    """
+
+    ORDER_CACHE_KEY = "order:%(id)s:%(closed_at)s"
+    """
+    The closed order cache key.
+    """
+
     PARAMETER = "parameter"
     """
     The parameter.
@@ -251,6 +620,11 @@ class GenericConstants:
     The password.
     """
 
+    PATH = "path"
+    """
+    The path.
+    """
+
     PRICE = "price"
     """
     The price.
@@ -261,6 +635,11 @@ class GenericConstants:
     The product.
     """
 
+    PRODUCT_ID = "product_id"
+    """
+    The product identifier.
+    """
+
     PRODUCT_QUANTITIES = "product_quantities"
     """
     The product quantities.
@@ -281,11 +660,56 @@ class GenericConstants:
     The refresh token.
     """
 
+    REPORT = "report"
+    """
+    The report.
+    """
+
+    REPORT_CACHE_KEY = "report:%(report)s:%(key)s"
+    """
+    The report cache key.
+    """
+
+    REPORT_ORDER_BY_OPTIONS = ("quantity", "revenue")
+    """
+    The report order by options.
+    """
+
+    REVENUE = "revenue"
+    """
+    The revenue.
+    """
+
+    REVOKED_TOKEN = "revoked_token"
+    """
+    The revoked token.
+    """
+
     ROLE = "role"
     """
     The role.
     """
 
+    SERIES_GROUP_BY_OPTIONS = ("hour", "day", "week", "month")
+    """
+    The series group by options.
+    """
+
+    SERIES_MAX_BUCKETS = 10000
+    """
+    The maximum buckets a product quantity series returns.
+    """
+
+    SHARED_CACHE = "shared"
+    """
+    The cache alias shared by every worker.
+    """
+
+    SNAPSHOT = "snapshot"
+    """
+    The snapshot.
+    """
+
     SPACE = " "
     """
     The space.
@@ -296,11 +720,36 @@ class GenericConstants:
     The start date.
     """
 
+    STATUS = "status"
+    """
+    The status.
+    """
+
+    TIMEZONE = "timezone"
+    """
+    The timezone.
+    """
+
+    TOTAL_ORDERS = "total_orders"
+    """
+    The total orders.
+    """
+
     TOTAL_PRICE = "total_price"
     """
     The total price.
     """
 
+    TOTAL_QUANTITY = "total_quantity"
+    """
+    The total quantity.
+    """
+
+    TRUE_OPTIONS = ("true", "1")
+    """
+    The true boolean options.
+    """
+
     USER = "user"
     """
     The user.
@@ -311,11 +760,36 @@ class GenericConstants:
     The users.
     """
 
+    USER_EMAIL_UNIQUE_INDEX = "user_lower_email_uniq"
+    """
+    The user lowercase email partial unique index.
+    """
+
+    USER_NAME_UNIQUE_INDEX = "user_lower_name_uniq"
+    """
+    The user lowercase name partial unique index.
+    """
+
     USER_ROLE = "user_role"
     """
     The user role.
     """
 
+    WEEK = "week"
+    """
+    The week.
+    """
+
+    WEEKDAY = "weekday"
+    """
+    The weekday.
+    """
+
+    WRITE = "write"
+    """
+    The write throttle scope.
+    """
+
 
 class ValidationConstants:
     """
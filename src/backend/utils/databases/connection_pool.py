@@ -0,0 +1,260 @@
+"""
+File name: connection_pool.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from collections import deque
+from threading import Condition
+from time import monotonic
+from weakref import WeakKeyDictionary, WeakSet
+
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from utils.configurations.constants import ExceptionConstants
+from utils.exceptions.api_exceptions import ServiceUnavailableException
+
+
+class ConnectionPool:
+    """
+    The connection pool.
+
+    Keeps up to max size database connections, handing out the last returned
+    idle one first, so the connections beyond the load stay idle until they
+    are recycled. A checkout waits up to the timeout for a free connection.
+
+    A connection is checked on checkout and discarded when closed, not idle or
+    older than the max lifetime, and pinged when idle longer than the health
+    check interval. The connections in use are weakly referenced, so one never
+    returned frees its place once collected.
+    """
+
+    def __init__(self, create, max_size, timeout, max_lifetime, health_check_interval):
+        """
+        Creates a new instance of ConnectionPool.
+
+        :param callable create: The function opening a new connection.
+        :param int max_size: The connections kept at most.
+        :param float timeout: The seconds a checkout waits for a connection.
+        :param float max_lifetime: The seconds a connection is kept at most.
+        :param float health_check_interval: The idle seconds before a ping.
+        """
+        self.create = create
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self.condition = Condition()
+        self.created_at = WeakKeyDictionary()
+        self.idle = deque()
+        self.in_use = WeakSet()
+        self.opening = 0
+        self.stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "timeouts": 0,
+            "created": 0,
+            "discarded": 0,
+        }
+
+    def close(self):
+        """
+        Closes the idle connections, the connections in use are closed once
+        returned.
+        """
+        with self.condition:
+            idle = [connection for connection, _ in self.idle]
+            self.idle.clear()
+            self.stats["discarded"] += len(idle)
+
+        for connection in idle:
+            self.__close(connection)
+
+    def get_connection(self):
+        """
+        Gets a healthy connection, waiting for a free one when every connection
+        is in use.
+        """
+        start = monotonic()
+        deadline = start + self.timeout
+        waited = False
+
+        while True:
+            with self.condition:
+                while not self.idle and self.__get_size() >= self.max_size:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        self.stats["timeouts"] += 1
+                        raise ServiceUnavailableException(
+                            ExceptionConstants.DATABASE_POOL_EXHAUSTED
+                        )
+                    waited = True
+                    self.condition.wait(remaining)
+
+                if waited:
+                    self.__record_wait(monotonic() - start)
+                    waited = False
+
+                if self.idle:
+                    connection, returned_at = self.idle.pop()
+                    self.in_use.add(connection)
+                else:
+                    connection, returned_at = None, None
+                    self.opening += 1
+
+            if connection is None:
+                return self.__open()
+
+            if self.__is_healthy(connection, returned_at):
+                with self.condition:
+                    self.stats["checkouts"] += 1
+
+                return connection
+
+            self.__discard(connection)
+
+    def get_stats(self):
+        """
+        Gets the pool size and the checkout counters, with the wait times in
+        seconds.
+        """
+        with self.condition:
+            return dict(
+                self.stats,
+                size=self.__get_size(),
+                idle=len(self.idle),
+                in_use=len(self.in_use),
+                max_size=self.max_size,
+            )
+
+    def put_connection(self, connection):
+        """
+        Returns a connection to the pool, rolling back its open transaction.
+
+        :param psycopg2.extensions.connection connection: The connection.
+        """
+        if not self.__is_reusable(connection):
+            self.__discard(connection)
+            return
+
+        with self.condition:
+            self.in_use.discard(connection)
+            self.idle.append((connection, monotonic()))
+            self.condition.notify()
+
+    def __close(self, connection):
+        """
+        Closes a connection, ignoring the errors of a broken one.
+
+        :param psycopg2.extensions.connection connection: The connection.
+        """
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def __discard(self, connection):
+        """
+        Closes a connection and frees its place.
+
+        :param psycopg2.extensions.connection connection: The connection.
+        """
+        self.__close(connection)
+
+        with self.condition:
+            self.in_use.discard(connection)
+            self.created_at.pop(connection, None)
+            self.stats["discarded"] += 1
+            self.condition.notify()
+
+    def __get_size(self):
+        """
+        Gets the connections kept, idle, in use or being opened.
+        """
+        return len(self.idle) + len(self.in_use) + self.opening
+
+    def __is_expired(self, connection):
+        """
+        Validates whether a connection is older than the max lifetime.
+
+        :param psycopg2.extensions.connection connection: The connection.
+        """
+        created_at = self.created_at.get(connection)
+
+        return created_at is None or monotonic() - created_at >= self.max_lifetime
+
+    def __is_healthy(self, connection, returned_at):
+        """
+        Validates whether an idle connection can be handed out, pinging it
+        when idle longer than the health check interval.
+
+        :param psycopg2.extensions.connection connection: The connection.
+        :param float returned_at: The time the connection was returned.
+        """
+        if connection.closed or self.__is_expired(connection):
+            return False
+
+        if monotonic() - returned_at < self.health_check_interval:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except Exception:
+            return False
+
+        return True
+
+    def __is_reusable(self, connection):
+        """
+        Validates whether a returned connection can be kept, rolling back its
+        open transaction.
+
+        :param psycopg2.extensions.connection connection: The connection.
+        """
+        if connection.closed or self.__is_expired(connection):
+            return False
+
+        if connection.info.transaction_status == TRANSACTION_STATUS_IDLE:
+            return True
+
+        try:
+            connection.rollback()
+        except Exception:
+            return False
+
+        return connection.info.transaction_status == TRANSACTION_STATUS_IDLE
+
+    def __open(self):
+        """
+        Opens a new connection in the place taken for it.
+        """
+        try:
+            connection = self.create()
+        except BaseException:
+            with self.condition:
+                self.opening -= 1
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.opening -= 1
+            self.created_at[connection] = monotonic()
+            self.in_use.add(connection)
+            self.stats["created"] += 1
+            self.stats["checkouts"] += 1
+
+        return connection
+
+    def __record_wait(self, wait_time):
+        """
+        Records the time a checkout waited for a free connection.
+
+        :param float wait_time: The seconds waited.
+        """
+        self.stats["waits"] += 1
+        self.stats["wait_time"] += wait_time
+        self.stats["max_wait_time"] = max(self.stats["max_wait_time"], wait_time)
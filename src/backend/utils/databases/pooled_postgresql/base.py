@@ -0,0 +1,122 @@
+"""
+File name: base.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import os
+from functools import partial
+from threading import Lock
+
+from django.db.backends.postgresql import base
+
+from utils.databases.connection_pool import ConnectionPool
+from utils.databases.pooled_postgresql.creation import DatabaseCreation
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    The pooled PostgreSQL database wrapper.
+
+    Checks its connections out of a process wide pool per connection settings
+    and returns them on close, so the threads of a worker share a bounded set
+    of connections. The pool is set by the POOL dictionary of the database
+    settings, with its MAX_SIZE, TIMEOUT, MAX_LIFETIME and
+    HEALTH_CHECK_INTERVAL, in seconds, and is meant to run with CONN_MAX_AGE 0,
+    so each request returns its connection.
+    """
+
+    creation_class = DatabaseCreation
+
+    __pools = {}
+    """
+    The connection pools, by process and connection settings.
+    """
+
+    __pools_lock = Lock()
+    """
+    The connection pools lock.
+    """
+
+    @classmethod
+    def close_pools(cls):
+        """
+        Closes the idle connections of the process pools.
+        """
+        with cls.__pools_lock:
+            pools = [
+                pool for (pid, _), pool in cls.__pools.items() if pid == os.getpid()
+            ]
+
+        for pool in pools:
+            pool.close()
+
+    def get_new_connection(self, conn_params):
+        """
+        Checks a connection out of the pool of the connection settings.
+
+        :param dict conn_params: The connection settings.
+        """
+        self.pool = self.__get_pool(conn_params)
+        connection = self.pool.get_connection()
+
+        options = self.settings_dict["OPTIONS"]
+        self.isolation_level = options.get(
+            "isolation_level", connection.isolation_level
+        )
+
+        return connection
+
+    def get_pool_stats(self):
+        """
+        Gets the pool statistics of the connection settings.
+        """
+        return self.__get_pool(self.get_connection_params()).get_stats()
+
+    def _close(self):
+        """
+        Returns the connection to the pool, closing it first when closed
+        within a transaction, as Django keeps it until the transaction ends.
+        """
+        if self.connection is None:
+            return
+
+        if self.in_atomic_block:
+            super()._close()
+
+        self.pool.put_connection(self.connection)
+
+    def __get_pool(self, conn_params):
+        """
+        Gets the pool of the connection settings, created on first use. Each
+        process has its own pools, the pools inherited through a fork are kept
+        unused, as closing their connections would close them for the parent.
+
+        :param dict conn_params: The connection settings.
+        """
+        options = self.settings_dict["OPTIONS"]
+        key = (
+            os.getpid(),
+            repr(
+                sorted(
+                    dict(
+                        conn_params,
+                        isolation_level=options.get("isolation_level"),
+                    ).items()
+                )
+            ),
+        )
+
+        with self.__pools_lock:
+            pool = self.__pools.get(key)
+            if pool is None:
+                pool_settings = self.settings_dict.get("POOL", {})
+                pool = ConnectionPool(
+                    partial(super().get_new_connection, conn_params),
+                    pool_settings.get("MAX_SIZE", 10),
+                    pool_settings.get("TIMEOUT", 5),
+                    pool_settings.get("MAX_LIFETIME", 1800),
+                    pool_settings.get("HEALTH_CHECK_INTERVAL", 30),
+                )
+                self.__pools[key] = pool
+
+            return pool
@@ -0,0 +1,26 @@
+"""
+File name: creation.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from django.db.backends.postgresql import creation
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    """
+    The pooled PostgreSQL database creation.
+
+    Closes the pooled connections before dropping the test database, as
+    PostgreSQL does not drop a database with open connections.
+    """
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        """
+        Drops the test database.
+
+        :param string test_database_name: The test database name.
+        :param int verbosity: The output verbosity.
+        """
+        self.connection.close_pools()
+
+        super()._destroy_test_db(test_database_name, verbosity)
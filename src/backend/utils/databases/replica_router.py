@@ -0,0 +1,102 @@
+"""
+File name: replica_router.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from random import choice
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class ReplicaRouter:
+    """
+    The replica router.
+
+    Sends the writes to the primary database and the reads of the blocks run
+    with use_replicas to one of the DATABASE_REPLICAS, the other reads going
+    to the primary. The reads within a transaction on the primary, or pinned
+    to it, stay on it, so they see the writes.
+    """
+
+    __replica = ContextVar("replica", default=None)
+    """
+    The replica of the current block and the function telling whether its
+    reads are pinned to the primary, None out of a block.
+    """
+
+    @classmethod
+    @contextmanager
+    def use_replicas(cls, is_pinned=None):
+        """
+        Routes the reads of the block to a replica, chosen once for the block
+        so its reads are consistent with each other, unless pinned to the
+        primary.
+
+        :param callable is_pinned: The optional function telling, on each read,
+            whether the reads are pinned to the primary.
+        """
+        replicas = settings.DATABASE_REPLICAS
+        token = cls.__replica.set((choice(replicas), is_pinned) if replicas else None)
+
+        try:
+            yield
+        finally:
+            cls.__replica.reset(token)
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Validates whether a migration runs on a database, the replicas get
+        their schema from the primary.
+
+        :param string db: The database alias.
+        :param string app_label: The migrated app label.
+        :param string model_name: The migrated model name.
+        """
+        if db in settings.DATABASE_REPLICAS:
+            return False
+
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        Validates whether two instances can be related, being the primary and
+        replicas the same data.
+
+        :param django.db.models.Model obj1: The first instance.
+        :param django.db.models.Model obj2: The second instance.
+        """
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def db_for_read(self, model, **hints):
+        """
+        Gets the database a model is read from.
+
+        :param django.db.models.base.ModelBase model: The read model.
+        """
+        replica = self.__replica.get()
+        if replica is None:
+            return None
+
+        replica, is_pinned = replica
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block or (
+            is_pinned is not None and is_pinned()
+        ):
+            return DEFAULT_DB_ALIAS
+
+        return replica
+
+    def db_for_write(self, model, **hints):
+        """
+        Gets the database a model is written to, the primary, also for the
+        instances read from a replica.
+
+        :param django.db.models.base.ModelBase model: The written model.
+        """
+        return DEFAULT_DB_ALIAS
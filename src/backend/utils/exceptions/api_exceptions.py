@@ -88,3 +88,17 @@ class InternalServerErrorException(APIException):
     status_code = 500
     default_detail = "Internal server error exception"
     default_code = "internal_server_error_exception"
+
+
+class ServiceUnavailableException(APIException):
+    """
+    The service unavailable exception resource.
+
+    Status code: 503
+    Detail: Service unavailable exception
+    Code: service_unavailable_exception
+    """
+
+    status_code = 503
+    default_detail = "Service unavailable exception"
+    default_code = "service_unavailable_exception"
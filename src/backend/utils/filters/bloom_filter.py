@@ -0,0 +1,71 @@
+"""
+File name: bloom_filter.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from hashlib import blake2b
+from math import ceil, log
+
+
+class BloomFilter:
+    """
+    The Bloom filter.
+
+    A compact set of strings with no false negatives, and false positives
+    bounded to the error rate while it holds at most its capacity.
+    """
+
+    def __init__(self, capacity, error_rate):
+        """
+        Creates a new instance of BloomFilter.
+
+        :param int capacity: The strings the filter is sized for.
+        :param float error_rate: The false positive rate at capacity.
+        """
+        self.capacity = max(1, capacity)
+        self.size = max(8, ceil(-self.capacity * log(error_rate) / log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, item):
+        """
+        Validates whether a string may have been added.
+
+        :param string item: The string.
+        """
+        return all(
+            self.bits[index >> 3] & (1 << (index & 7))
+            for index in self.__get_indexes(item)
+        )
+
+    def add(self, item):
+        """
+        Adds a string, counted only when it may not have been added, so adding
+        a string again does not fill the filter.
+
+        :param string item: The string.
+        """
+        is_new = False
+
+        for index in self.__get_indexes(item):
+            if not self.bits[index >> 3] & (1 << (index & 7)):
+                self.bits[index >> 3] |= 1 << (index & 7)
+                is_new = True
+
+        if is_new:
+            self.count += 1
+
+    def __get_indexes(self, item):
+        """
+        Gets the bit indexes of a string, by double hashing.
+
+        :param string item: The string.
+        """
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "little")
+        second_hash = int.from_bytes(digest[8:], "little") | 1
+
+        return [
+            (first_hash + hash * second_hash) % self.size for hash in range(self.hashes)
+        ]
@@ -0,0 +1,41 @@
+"""
+File name: fast_json_parser.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """
+    The fast JSON parser.
+
+    Parses UTF-8 request bodies with orjson, falls back to the JSONParser when
+    orjson is not installed or the body has another encoding.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses a JSON request body.
+
+        :param stream stream: The request body stream.
+        :param string media_type: The request media type.
+        :param dict parser_context: The parser context.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as error:
+            raise ParseError("JSON parse error - %s" % error)
@@ -0,0 +1,55 @@
+"""
+File name: message_pack_parser.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from uuid import UUID
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from msgpack import ExtType, unpackb
+from msgpack.exceptions import ExtraData, FormatError, StackError
+
+from utils.configurations.constants import ExceptionConstants, GenericConstants
+
+
+class MessagePackParser(BaseParser):
+    """
+    The MessagePack parser.
+
+    Parses MessagePack request bodies, decoding the timestamp extension type
+    to timezone aware datetimes and the uuid extension type to uuids.
+    """
+
+    media_type = GenericConstants.MESSAGE_PACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses a MessagePack request body.
+
+        :param stream stream: The request body stream.
+        :param string media_type: The request media type.
+        :param dict parser_context: The parser context.
+        """
+        try:
+            return unpackb(
+                stream.read(), ext_hook=self.__decode, raw=False, timestamp=3
+            )
+        except (ExtraData, FormatError, StackError, ValueError) as error:
+            raise ParseError(
+                ExceptionConstants.MESSAGE_PACK_PARSE_ERROR
+                % {GenericConstants.ERROR: error}
+            )
+
+    def __decode(self, code, data):
+        """
+        Decodes the uuid extension type, other extension types are kept.
+
+        :param int code: The extension type code.
+        :param bytes data: The extension data.
+        """
+        if code == GenericConstants.MESSAGE_PACK_UUID_EXT_TYPE:
+            return UUID(bytes=data)
+
+        return ExtType(code, data)
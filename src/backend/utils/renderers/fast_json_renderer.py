@@ -0,0 +1,57 @@
+"""
+File name: fast_json_renderer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    The fast JSON renderer.
+
+    Renders responses with orjson, which natively encodes uuids and datetimes,
+    producing the same bytes as the JSONRenderer. Falls back to the
+    JSONRenderer when orjson is not installed, an indented response is asked
+    for or orjson cannot encode the data.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders the data as JSON.
+
+        :param object data: The data to render.
+        :param string accepted_media_type: The accepted media type.
+        :param dict renderer_context: The renderer context.
+        """
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            rendered = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # The JSONRenderer escapes the line and paragraph separators, which are
+        # valid JSON but not valid JavaScript.
+        return rendered.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
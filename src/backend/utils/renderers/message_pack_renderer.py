@@ -0,0 +1,59 @@
+"""
+File name: message_pack_renderer.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+from rest_framework.renderers import BaseRenderer
+
+from msgpack import ExtType, packb
+
+from utils.configurations.constants import GenericConstants
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    The MessagePack renderer.
+
+    Renders responses as MessagePack. Timezone aware datetimes use the native
+    timestamp extension type and uuids the uuid extension type, as their 16
+    bytes.
+    """
+
+    media_type = GenericConstants.MESSAGE_PACK_MEDIA_TYPE
+    format = GenericConstants.MESSAGE_PACK_FORMAT
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders the data as MessagePack.
+
+        :param object data: The data to render.
+        :param string accepted_media_type: The accepted media type.
+        :param dict renderer_context: The renderer context.
+        """
+        if data is None:
+            return b""
+
+        return packb(data, default=self.__encode, use_bin_type=True, datetime=True)
+
+    def __encode(self, value):
+        """
+        Encodes the values MessagePack has no type for.
+
+        :param object value: The value to encode.
+        """
+        if isinstance(value, UUID):
+            return ExtType(GenericConstants.MESSAGE_PACK_UUID_EXT_TYPE, value.bytes)
+        if isinstance(value, (date, datetime, time)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+
+        raise TypeError(
+            "Object of type %s is not MessagePack serializable" % type(value)
+        )
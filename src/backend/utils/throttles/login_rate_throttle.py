@@ -0,0 +1,17 @@
+"""
+File name: login_rate_throttle.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from utils.configurations.constants import GenericConstants
+from utils.throttles.shared_memory_rate_throttle import SharedMemoryRateThrottle
+
+
+class LoginRateThrottle(SharedMemoryRateThrottle):
+    """
+    The login rate throttle.
+
+    Throttles the login attempts of each client address.
+    """
+
+    scope = GenericConstants.LOGIN
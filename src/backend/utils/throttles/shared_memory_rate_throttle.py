@@ -0,0 +1,68 @@
+"""
+File name: shared_memory_rate_throttle.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+from utils.throttles.token_bucket_table import TokenBucketTable
+
+
+class SharedMemoryRateThrottle(SimpleRateThrottle):
+    """
+    The shared memory rate throttle.
+
+    Throttles requests with a token bucket per scope, route and user, or
+    client address when anonymous, kept in the RATE_LIMIT_FILE memory map
+    shared by every worker. The bucket holds the scope rate requests and is
+    refilled over its period.
+    """
+
+    cache_format = "throttle:%(scope)s:%(ident)s"
+
+    table = TokenBucketTable(settings.RATE_LIMIT_FILE, settings.RATE_LIMIT_SLOTS)
+
+    def allow_request(self, request, view):
+        """
+        Validates whether a request is allowed, taking a token of its bucket.
+
+        :param rest_framework.request request: The request.
+        :param rest_framework.views.APIView view: The view.
+        """
+        if self.rate is None:
+            return True
+
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        self.wait_time = self.table.consume(
+            key, self.num_requests, self.num_requests / self.duration
+        )
+
+        return self.wait_time == 0
+
+    def get_cache_key(self, request, view):
+        """
+        Gets the bucket key of a request.
+
+        :param rest_framework.request request: The request.
+        :param rest_framework.views.APIView view: The view.
+        """
+        ident = self.get_ident(request)
+        if request.user is not None and request.user.is_authenticated:
+            ident = request.user.pk
+
+        route = getattr(request.resolver_match, "route", request.path)
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": "%s:%s" % (route, ident),
+        }
+
+    def wait(self):
+        """
+        Gets the seconds until the throttled request is allowed.
+        """
+        return self.wait_time
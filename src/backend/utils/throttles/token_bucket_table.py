@@ -0,0 +1,133 @@
+"""
+File name: token_bucket_table.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import fcntl
+import mmap
+import os
+import struct
+from hashlib import blake2b
+from threading import Lock
+from time import time
+
+
+class TokenBucketTable:
+    """
+    The token bucket table.
+
+    A fixed size hash table of token buckets in a memory map. Mapped from the
+    same file, the buckets are shared by every process; each key probes a few
+    adjacent slots, locked with a file lock, and evicts the stalest bucket
+    when none is free. Without a file, the buckets are private to the process.
+    """
+
+    PROBES = 4
+    """
+    The adjacent slots probed for a key.
+    """
+
+    SLOT = struct.Struct("<Qdd")
+    """
+    The slot layout: key hash, tokens and last update time.
+    """
+
+    def __init__(self, path, slots):
+        """
+        Creates a new instance of TokenBucketTable.
+
+        :param string path: The memory map file, or None for private buckets.
+        :param int slots: The slots in the table.
+        """
+        self.path = path
+        self.slots = max(self.PROBES, slots)
+        self.file = None
+        self.lock = Lock()
+        self.memory = None
+        self.pid = None
+
+    @classmethod
+    def create(cls, path, slots):
+        """
+        Creates the memory map file of a table, with every new slot free.
+
+        :param string path: The memory map file.
+        :param int slots: The slots in the table.
+        """
+        size = max(cls.PROBES, slots) * cls.SLOT.size
+
+        with open(path, "ab") as file:
+            if file.tell() < size:
+                file.truncate(size)
+
+    def consume(self, key, capacity, rate):
+        """
+        Takes a token from the bucket of a key.
+
+        Returns 0 when taken, or the seconds until a token is available.
+
+        :param string key: The bucket key.
+        :param int capacity: The bucket capacity, a full bucket is a burst.
+        :param float rate: The tokens refilled per second.
+        """
+        key_hash = int.from_bytes(
+            blake2b(key.encode(), digest_size=8).digest(), "little"
+        )
+        key_hash |= 1
+        offset = key_hash % (self.slots - self.PROBES + 1) * self.SLOT.size
+        length = self.PROBES * self.SLOT.size
+
+        with self.lock:
+            memory = self.__get_memory()
+            if self.file is not None:
+                fcntl.lockf(self.file, fcntl.LOCK_EX, length, offset)
+
+            try:
+                now = time()
+                slots = [
+                    self.SLOT.unpack_from(memory, offset + probe * self.SLOT.size)
+                    for probe in range(self.PROBES)
+                ]
+                probe = next(
+                    (probe for probe, slot in enumerate(slots) if slot[0] == key_hash),
+                    None,
+                )
+
+                if probe is None:
+                    probe = min(range(self.PROBES), key=lambda probe: slots[probe][2])
+                    tokens = capacity
+                else:
+                    _, tokens, updated_at = slots[probe]
+                    tokens = min(capacity, tokens + max(0, now - updated_at) * rate)
+
+                wait = 0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / rate
+
+                self.SLOT.pack_into(
+                    memory, offset + probe * self.SLOT.size, key_hash, tokens, now
+                )
+
+                return wait
+            finally:
+                if self.file is not None:
+                    fcntl.lockf(self.file, fcntl.LOCK_UN, length, offset)
+
+    def __get_memory(self):
+        """
+        Gets the memory map, mapped on first use and again after a fork.
+        """
+        if self.memory is None or self.pid != os.getpid():
+            size = self.slots * self.SLOT.size
+            if self.path is None:
+                self.file = None
+                self.memory = mmap.mmap(-1, size)
+            else:
+                self.create(self.path, self.slots)
+                self.file = open(self.path, "r+b")
+                self.memory = mmap.mmap(self.file.fileno(), size)
+            self.pid = os.getpid()
+
+        return self.memory
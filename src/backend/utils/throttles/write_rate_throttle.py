@@ -0,0 +1,31 @@
+"""
+File name: write_rate_throttle.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+from rest_framework.permissions import SAFE_METHODS
+
+from utils.configurations.constants import GenericConstants
+from utils.throttles.shared_memory_rate_throttle import SharedMemoryRateThrottle
+
+
+class WriteRateThrottle(SharedMemoryRateThrottle):
+    """
+    The write rate throttle.
+
+    Throttles the requests of each user, or client address, that are not safe.
+    """
+
+    scope = GenericConstants.WRITE
+
+    def allow_request(self, request, view):
+        """
+        Validates whether a request is allowed, safe requests always are.
+
+        :param rest_framework.request request: The request.
+        :param rest_framework.views.APIView view: The view.
+        """
+        if request.method in SAFE_METHODS:
+            return True
+
+        return super().allow_request(request, view)
@@ -4,6 +4,9 @@ Author: Fernando Rivera
 Creation date: 2021-12-08
 """
 from datetime import datetime
+from uuid import UUID
+
+from pytz import UnknownTimeZoneError, timezone
 
 from utils.configurations.constants import ExceptionConstants, GenericConstants
 from utils.exceptions.api_exceptions import (
@@ -53,6 +56,26 @@ class ApiValidations:
                 ExceptionConstants.USER_ROLE_NOT_VALID % {GenericConstants.ROLE: role}
             )
 
+    def validate_boolean(self, boolean, default_boolean):
+        """
+        Validates a boolean.
+
+        :param string boolean: The boolean to validate.
+        :param bool default_boolean: The default boolean.
+        """
+        if boolean is None:
+            return default_boolean
+
+        if boolean.lower() in GenericConstants.TRUE_OPTIONS:
+            return True
+        if boolean.lower() in GenericConstants.FALSE_OPTIONS:
+            return False
+
+        raise BadRequestException(
+            ExceptionConstants.PARAMETER_MUST_BE_BOOLEAN
+            % {GenericConstants.PARAMETER: boolean}
+        )
+
     def validate_date(self, date, default_date):
         """
         Validates a date.
@@ -71,3 +94,140 @@ class ApiValidations:
                 ExceptionConstants.PARAMETER_MUST_BE_DATETIME
                 % {GenericConstants.PARAMETER: date}
             )
+
+    def validate_option(self, option, options, default_option):
+        """
+        Validates an option is one of the allowed options.
+
+        :param string option: The option to validate.
+        :param string[] options: The allowed options.
+        :param string default_option: The default option.
+        """
+        if option is None:
+            return default_option
+
+        if option not in options:
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_NOT_IN_OPTIONS
+                % {
+                    GenericConstants.PARAMETER: option,
+                    GenericConstants.OPTIONS: ", ".join(options),
+                }
+            )
+
+        return option
+
+    def validate_option_list(self, option_list, options, default_option_list):
+        """
+        Validates a comma separated list of options, dropping repeated ones.
+
+        An empty string is an empty list.
+
+        :param string option_list: The option list to validate.
+        :param string[] options: The allowed options.
+        :param string[] default_option_list: The default option list.
+        """
+        if option_list is None:
+            return default_option_list
+
+        validated_options = []
+        for option in option_list.split(GenericConstants.COMMA):
+            option = option.strip()
+            if option == GenericConstants.EMPTY_CHAR:
+                continue
+
+            option = self.validate_option(option, options, None)
+            if option not in validated_options:
+                validated_options.append(option)
+
+        return validated_options
+
+    def validate_positive_integer(self, integer, default_integer):
+        """
+        Validates a positive integer.
+
+        :param string integer: The integer to validate.
+        :param int default_integer: The default integer.
+        """
+        if integer is None:
+            return default_integer
+
+        try:
+            validated_integer = int(integer)
+        except ValueError:
+            validated_integer = 0
+
+        if validated_integer <= 0:
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_MUST_BE_POSITIVE_INTEGER
+                % {GenericConstants.PARAMETER: integer}
+            )
+
+        return validated_integer
+
+    def validate_timezone(self, timezone_name, default_timezone):
+        """
+        Validates a timezone.
+
+        :param string timezone_name: The timezone name to validate.
+        :param tzinfo default_timezone: The default timezone.
+        """
+        if timezone_name is None:
+            return default_timezone
+
+        try:
+            return timezone(timezone_name)
+        except UnknownTimeZoneError:
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_MUST_BE_TIMEZONE
+                % {GenericConstants.PARAMETER: timezone_name}
+            )
+
+    def validate_uuid_list(self, uuid_list, parameter, max_length):
+        """
+        Validates a comma separated list of uuids, dropping repeated ones.
+
+        :param string uuid_list: The uuid list to validate.
+        :param string parameter: The parameter name.
+        :param int max_length: The maximum number of uuids.
+        """
+        if uuid_list is None or uuid_list.strip() == GenericConstants.EMPTY_CHAR:
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_IS_REQUIRED
+                % {GenericConstants.PARAMETER: parameter}
+            )
+
+        uuids = []
+        for uuid in uuid_list.split(GenericConstants.COMMA):
+            uuid = self.validate_uuid(uuid.strip(), None)
+            if uuid not in uuids:
+                uuids.append(uuid)
+
+        if len(uuids) > max_length:
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_EXCEEDS_MAX_LENGTH
+                % {
+                    GenericConstants.PARAMETER: parameter,
+                    GenericConstants.MAX_LENGTH: max_length,
+                }
+            )
+
+        return uuids
+
+    def validate_uuid(self, uuid, default_uuid):
+        """
+        Validates a uuid.
+
+        :param string uuid: The uuid to validate.
+        :param uuid4 default_uuid: The default uuid.
+        """
+        if uuid is None:
+            return default_uuid
+
+        try:
+            return UUID(uuid)
+        except ValueError:
+            raise BadRequestException(
+                ExceptionConstants.PARAMETER_MUST_BE_UUID
+                % {GenericConstants.PARAMETER: uuid}
+            )
@@ -0,0 +1,126 @@
+"""
+File name: async_api_view.py
+Author: Fernando Rivera
+Creation date: 2021-12-13
+"""
+import asyncio
+from functools import update_wrapper
+
+from rest_framework.views import APIView
+
+from utils.asynchronous.loop_aware_sync_to_async import loop_aware_sync_to_async
+from utils.configurations.constants import ExceptionConstants
+
+
+class AsyncAPIViewFunction:
+    """
+    The async API view function.
+
+    A coroutine function when called from an event loop, as Django does under
+    ASGI, and a synchronous function otherwise, as Django does under WSGI. The
+    synchronous calls run the view coroutine to completion with no event loop,
+    so the sync, threaded and green workers do not start an event loop per
+    request.
+    """
+
+    def __init__(self, view):
+        """
+        Creates a new instance of AsyncAPIViewFunction class.
+
+        :param callable view: The view function, returning a coroutine.
+        """
+        self.view = view
+        update_wrapper(self, view)
+
+    @property
+    def _is_coroutine(self):
+        """
+        Gets the flag asyncio.iscoroutinefunction, and so Django, checks.
+        """
+        if self.__is_loop_running():
+            return asyncio.coroutines._is_coroutine
+
+        return None
+
+    def __call__(self, request, *args, **kwargs):
+        """
+        Calls the view, awaitable when called from an event loop.
+
+        :param django.http.HttpRequest request: The request.
+        """
+        coroutine = self.view(request, *args, **kwargs)
+
+        if self.__is_loop_running():
+            return coroutine
+
+        try:
+            coroutine.send(None)
+        except StopIteration as stop:
+            return stop.value
+
+        coroutine.close()
+        raise RuntimeError(ExceptionConstants.COROUTINE_SUSPENDED)
+
+    def __is_loop_running(self):
+        """
+        Validates whether an event loop is running in the thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        return True
+
+
+class AsyncAPIView(APIView):
+    """
+    The async API view.
+
+    Lets its handlers be coroutines. From the event loop, under ASGI, the
+    authentication, permission and throttling checks and the handlers that are
+    not coroutines run on the thread of the synchronous code, as the ORM is
+    synchronous. The checks run on the event loop when the view has no
+    authentication and no throttling, as they can not block then.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Creates the view function, a coroutine function from an event loop.
+        """
+        return AsyncAPIViewFunction(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Dispatches the request to its handler, awaiting it.
+
+        :param django.http.HttpRequest request: The request.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            if self.authentication_classes or self.throttle_classes:
+                await loop_aware_sync_to_async(self.initial)(request, *args, **kwargs)
+            else:
+                self.initial(request, *args, **kwargs)
+
+            handler = self.http_method_not_allowed
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+
+            if not asyncio.iscoroutinefunction(handler):
+                handler = loop_aware_sync_to_async(handler)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+
+        return self.response